@@ -0,0 +1,67 @@
+"""
+Measures how many requests per second the authorizer checks, for requests
+with a valid signature, a wrong (but well formed) signature, and a
+malformed signature, like the ones Discord sends to validate the endpoint.
+
+Run from discord_app/:
+
+    python -m benchmarks.bench_authorize
+"""
+import json
+import time
+import timeit
+from typing import Dict
+
+from loguru import logger
+from nacl.signing import SigningKey
+
+from eternal_guesses.app import ingress
+from eternal_guesses.app.api_authorizer import ApiAuthorizerImpl
+
+RUNS = 2000
+
+
+def _event(signature: str, timestamp: str, body: str) -> Dict:
+    return {
+        'body': body,
+        'headers': {
+            'x-signature-ed25519': signature,
+            'x-signature-timestamp': timestamp,
+        },
+    }
+
+
+def _events(signing_key: SigningKey) -> Dict[str, Dict]:
+    body = json.dumps({"id": "1", "token": "t", "type": 1, "version": 1})
+    timestamp = str(int(time.time()))
+    signature = signing_key.sign((timestamp + body).encode()).signature.hex()
+    other_signature = SigningKey.generate() \
+        .sign((timestamp + body).encode()).signature.hex()
+
+    return {
+        'valid': _event(signature, timestamp, body),
+        'invalid': _event(other_signature, timestamp, body),
+        'malformed': _event("not a signature", timestamp, body),
+    }
+
+
+def main():
+    # Log as usual, including formatting any tracebacks, but quietly
+    logger.remove()
+    logger.add(lambda message: None)
+
+    signing_key = SigningKey.generate()
+    authorizer = ApiAuthorizerImpl(
+        public_key=signing_key.verify_key.encode().hex(),
+    )
+
+    for name, event in _events(signing_key).items():
+        seconds = timeit.timeit(
+            lambda: authorizer.authorize(ingress.from_api_gateway(event)),
+            number=RUNS,
+        ) / RUNS
+        print(f"{name:<10} {1 / seconds:>10.0f} requests/s")
+
+
+if __name__ == '__main__':
+    main()
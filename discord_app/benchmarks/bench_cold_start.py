@@ -0,0 +1,170 @@
+"""
+Measures a Lambda cold start of the interaction handler, in a fresh
+interpreter each run: importing the handler, building the event handler
+(injector.discord_event_handler()), and routing a first event of a few
+common kinds. Routing includes building the route and whatever it depends
+on, but not the route's own work (its calls to DynamoDB and Discord), which
+is the same however the handler is wired. A run with -X importtime shows
+which packages the import time goes to.
+
+The handler is configured like the InfraStack deploys it, with deferred
+responses and a post update queue. Nothing is sent to AWS or Discord.
+
+Run from discord_app/:
+
+    python -m benchmarks.bench_cold_start
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+from nacl.signing import SigningKey
+
+from eternal_guesses.app.component_ids import ComponentIds
+from tests.integration import discord_events
+
+RUNS = 5
+TOP_PACKAGES = 12
+STAGES = ['import', 'construct', 'route']
+
+# The modules that show what was loaded for the first event
+WATCHED_MODULES = ['boto3', 'aiohttp', 'nacl']
+
+COLD_START = f"""
+import json
+import sys
+import time
+
+event = json.loads(sys.argv[1])
+
+start = time.perf_counter()
+from eternal_guesses import event_handler
+from eternal_guesses.app import ingress
+from eternal_guesses.model.discord import discord_event
+imported = time.perf_counter()
+handler = event_handler.get_event_handler()
+constructed = time.perf_counter()
+request = ingress.from_api_gateway(event)
+handler.api_authorizer.authorize(request)
+handler.router._find_route(discord_event.from_event(request.json()))
+routed = time.perf_counter()
+
+print(json.dumps({{
+    'import': imported - start,
+    'construct': constructed - imported,
+    'route': routed - constructed,
+    'loaded': [m for m in {WATCHED_MODULES!r} if m in sys.modules],
+}}))
+"""
+
+
+def _events() -> Dict[str, Dict]:
+    return {
+        'ping': {
+            'body': json.dumps({"id": "1", "token": "t", "type": 1, "version": 1}),
+        },
+        'list-games': discord_events.application_command(
+            command_name="list-games",
+            guild_id=1,
+        ),
+        'submit guess': discord_events.modal_submit_event(
+            guild_id=1,
+            modal_custom_id=ComponentIds.submit_guess_modal_id("game"),
+            inputs={ComponentIds.submit_guess_input_value: "42"},
+        ),
+    }
+
+
+def _signed(event: Dict, signing_key: SigningKey) -> Dict:
+    timestamp = str(int(time.time()))
+    signature = signing_key.sign((timestamp + event['body']).encode())
+
+    return {
+        'body': event['body'],
+        'headers': {
+            'x-signature-ed25519': signature.signature.hex(),
+            'x-signature-timestamp': timestamp,
+        },
+    }
+
+
+def _environment(signing_key: SigningKey) -> Dict[str, str]:
+    return {
+        **os.environ,
+        'PYTHONPATH': os.getcwd(),
+        'LOGURU_LEVEL': 'WARNING',
+        'DISCORD_PUBLIC_KEY': signing_key.verify_key.encode().hex(),
+        'DYNAMODB_TABLE_NAME': 'cold-start-benchmark',
+        'AWS_DEFAULT_REGION': 'eu-west-1',
+        'AWS_ACCESS_KEY_ID': 'benchmark',
+        'AWS_SECRET_ACCESS_KEY': 'benchmark',
+        # As the InfraStack configures the function
+        'DEFERRED_RESPONSES': 'true',
+        'POST_UPDATE_QUEUE_URL':
+            'https://sqs.eu-west-1.amazonaws.com/000000000000/post-updates',
+        'AWS_LAMBDA_FUNCTION_NAME': 'cold-start-benchmark',
+    }
+
+
+def _cold_start(event: Dict, env: Dict[str, str], *flags: str):
+    return subprocess.run(
+        [sys.executable, *flags, '-c', COLD_START, json.dumps(event)],
+        capture_output=True,
+        check=True,
+        text=True,
+        env=env,
+    )
+
+
+def _import_time_by_package(import_time_output: str) -> List:
+    """Sums the self time of the imported modules by top level package."""
+    seconds_by_package = defaultdict(float)
+
+    for line in import_time_output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+
+        self_us, _, module = line[len("import time:"):].split("|")
+        package = module.strip().split(".")[0]
+        seconds_by_package[package] += int(self_us) / 1_000_000
+
+    return sorted(seconds_by_package.items(), key=lambda i: -i[1])
+
+
+def main():
+    signing_key = SigningKey.generate()
+    env = _environment(signing_key)
+    events = {
+        name: _signed(event, signing_key)
+        for name, event in _events().items()
+    }
+
+    print(f"cold start, median of {RUNS} runs:")
+    print(f"{'event':<14}" + "".join(f"{s:>11}" for s in STAGES) +
+          f"{'total':>11}  loaded")
+    for name, event in events.items():
+        runs = [
+            json.loads(_cold_start(event, env).stdout)
+            for _ in range(RUNS)
+        ]
+        medians = [statistics.median(run[s] for run in runs) for s in STAGES]
+
+        print(f"{name:<14}" + "".join(f"{m * 1000:>9.1f}ms" for m in medians) +
+              f"{sum(medians) * 1000:>9.1f}ms  " +
+              (", ".join(runs[0]['loaded']) or "-"))
+
+    import_times = _import_time_by_package(
+        _cold_start(events['ping'], env, '-X', 'importtime').stderr
+    )
+    print(f"import time by package for a ping (top {TOP_PACKAGES}):")
+    for package, seconds in import_times[:TOP_PACKAGES]:
+        print(f"  {package:<20} {seconds * 1000:>7.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+"""
+Measures finding the route for an event, for every kind of event in the
+integration test fixtures (tests/integration/discord_events.py): each
+command, button, select and modal the application handles, and the legacy
+commands it doesn't. Only the lookup is measured: events are parsed and the
+routes are registered beforehand, and no route is built.
+
+Run from discord_app/:
+
+    python -m benchmarks.bench_dispatch
+"""
+import json
+import timeit
+from typing import Dict, List
+
+from eternal_guesses.app import injector
+from eternal_guesses.app.component_ids import ComponentIds
+from eternal_guesses.model.discord import discord_event
+from eternal_guesses.model.discord.discord_component import ComponentType
+from eternal_guesses.model.discord.discord_event import DiscordEvent
+from tests.fakes import FakeDiscordMessaging
+from tests.integration import discord_events
+
+RUNS = 20_000
+GUILD_ID = 1
+CHANNEL_ID = 2
+GAME_ID = "benchmark-game"
+
+COMMANDS = ['ping', 'create-game', 'list-games', 'unknown-command']
+
+BUTTONS = [
+    ComponentIds.component_button_guess_id(GAME_ID),
+    ComponentIds.component_button_close_game_id(GAME_ID),
+    ComponentIds.component_button_reopen_game_id(GAME_ID),
+    ComponentIds.component_button_post_game_id(GAME_ID),
+    ComponentIds.component_button_edit_guess_id(GAME_ID),
+    ComponentIds.component_button_delete_guess_id(GAME_ID),
+    ComponentIds.component_button_edit_game_id(GAME_ID),
+    ComponentIds.button_edit_game_title_id(GAME_ID),
+    ComponentIds.button_edit_game_min_guess_id(GAME_ID),
+    ComponentIds.button_edit_game_max_guess_id(GAME_ID),
+    ComponentIds.button_edit_game_description_id(GAME_ID),
+    "unknown-button",
+]
+
+SELECTS = [
+    ComponentIds.component_select_game_to_manage,
+    ComponentIds.component_select_delete_guess_id(GAME_ID),
+    ComponentIds.component_select_edit_guess_id(GAME_ID),
+    ComponentIds.selector_post_game_id(GAME_ID),
+]
+
+MODALS = [
+    ComponentIds.submit_create_modal_id,
+    ComponentIds.submit_guess_modal_id(GAME_ID),
+    ComponentIds.edit_guess_modal_id(GAME_ID, 3),
+    ComponentIds.edit_game_title_modal_id(GAME_ID),
+    ComponentIds.edit_game_min_guess_modal_id(GAME_ID),
+    ComponentIds.edit_game_max_guess_modal_id(GAME_ID),
+    ComponentIds.edit_game_description_modal_id(GAME_ID),
+    "unknown-modal",
+]
+
+
+def _fixture_events() -> List[Dict]:
+    return [
+        *(discord_events.application_command(command_name=name, guild_id=GUILD_ID)
+          for name in COMMANDS),
+        *(discord_events.component_action(
+            guild_id=GUILD_ID,
+            component_custom_id=custom_id,
+            component_type=ComponentType.BUTTON,
+        ) for custom_id in BUTTONS),
+        *(discord_events.component_action(
+            guild_id=GUILD_ID,
+            component_custom_id=custom_id,
+            component_type=ComponentType.STRING_SELECT,
+            values=[GAME_ID],
+        ) for custom_id in SELECTS),
+        *(discord_events.modal_submit_event(
+            guild_id=GUILD_ID,
+            modal_custom_id=custom_id,
+            inputs={},
+        ) for custom_id in MODALS),
+        discord_events.make_discord_create_event(guild_id=GUILD_ID),
+        discord_events.make_discord_admin_event(guild_id=GUILD_ID),
+        discord_events.make_discord_manage_post_event(
+            guild_id=GUILD_ID, game_id=GAME_ID, channel_id=CHANNEL_ID),
+        discord_events.make_discord_admin_add_channel_event(
+            guild_id=GUILD_ID, new_management_channel_id=CHANNEL_ID, is_admin=True),
+        discord_events.make_discord_admin_remove_channel_event(
+            guild_id=GUILD_ID, management_channel_id=CHANNEL_ID, is_admin=True),
+        discord_events.make_discord_admin_add_role_event(
+            guild_id=GUILD_ID, new_management_role=3, is_admin=True),
+        discord_events.make_discord_admin_remove_role_event(
+            guild_id=GUILD_ID, management_role=3, is_admin=True),
+        discord_events.make_discord_admin_info(guild_id=GUILD_ID, is_admin=True),
+        discord_events.make_discord_manage_list_event(
+            guild_id=GUILD_ID, channel_id=CHANNEL_ID),
+        discord_events.make_discord_change_guess_event(
+            guild_id=GUILD_ID, game_id=GAME_ID, new_guess="42", member=3,
+            channel_id=CHANNEL_ID),
+        discord_events.make_discord_delete_guess_event(
+            guild_id=GUILD_ID, game_id=GAME_ID, member=3, channel_id=CHANNEL_ID),
+    ]
+
+
+def _events() -> List[DiscordEvent]:
+    return [
+        discord_event.from_event(json.loads(event['body']))
+        for event in _fixture_events()
+    ]
+
+
+def main():
+    route_registry = injector._router(FakeDiscordMessaging()).route_registry
+    events = _events()
+
+    def dispatch():
+        for event in events:
+            route_registry.find_type(event)
+
+    routed = sum(route_registry.find_type(e) is not None for e in events)
+    seconds = timeit.timeit(dispatch, number=RUNS) / RUNS
+
+    print(f"{len(events)} events, {routed} routed: "
+          f"{seconds / len(events) * 1_000_000_000:.0f}ns per event")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+"""
+Measures what running an invocation on an event loop costs, for the ways
+the handlers can get their loop: the thread's default loop
+(asyncio.get_event_loop(), deprecated without a running loop), a new loop
+per invocation (asyncio.run), and the container's EventLoop, with asyncio's
+loop and (when installed) uvloop's.
+
+Each is timed for an invocation that does nothing, and for one that sends a
+message to a local fake Discord. With a new loop per invocation, the HTTP
+session has to be closed before its loop is, so its connection can't be
+reused by the next invocation.
+
+Run from discord_app/:
+
+    python -m benchmarks.bench_event_loop
+"""
+import asyncio
+import statistics
+import threading
+import time
+import warnings
+from typing import Callable, Dict, Tuple
+
+from loguru import logger
+
+from eternal_guesses.app.discord_rest_messaging import DiscordRestMessaging
+from eternal_guesses.app.discord_session import DiscordSession
+from eternal_guesses.app.event_loop import EventLoop
+from tests.fake_discord_server import FakeDiscordServer
+
+INVOCATIONS = 200
+
+
+def _default_loop_run(awaitable):
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', DeprecationWarning)
+        return asyncio.get_event_loop().run_until_complete(awaitable)
+
+
+def _runners() -> Dict[str, Tuple[Callable, bool]]:
+    """The runners, and whether the HTTP session outlives an invocation."""
+    # asyncio.run leaves the thread without a default loop, so the default
+    # loop goes first
+    runners = {
+        'asyncio.get_event_loop()': (_default_loop_run, True),
+        'asyncio.run per invocation': (asyncio.run, False),
+        'EventLoop (asyncio)': (EventLoop().run, True),
+    }
+
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        logger.warning("uvloop isn't installed, skipping it")
+    else:
+        runners['EventLoop (uvloop)'] = (EventLoop(use_uvloop=True).run, True)
+
+    return runners
+
+
+class _ServerThread:
+    """Runs the fake Discord on a loop of its own, in another thread."""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.server = FakeDiscordServer()
+        threading.Thread(target=self.loop.run_forever, daemon=True).start()
+
+    def __enter__(self) -> FakeDiscordServer:
+        asyncio.run_coroutine_threadsafe(
+            self.server.__aenter__(), self.loop
+        ).result()
+        return self.server
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        asyncio.run_coroutine_threadsafe(
+            self.server.__aexit__(exc_type, exc_val, exc_tb), self.loop
+        ).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+
+def _median_us(runner: Callable, invocation: Callable) -> float:
+    durations = []
+    for _ in range(INVOCATIONS):
+        start = time.perf_counter()
+        runner(invocation())
+        durations.append(time.perf_counter() - start)
+
+    return statistics.median(durations) * 1_000_000
+
+
+async def _nothing():
+    pass
+
+
+def main():
+    logger.remove()
+
+    with _ServerThread() as server:
+        print(f"median per invocation, of {INVOCATIONS}:")
+        print(f"{'loop':<28}{'nothing':>12}{'send message':>16}")
+        for name, (runner, keep_session) in _runners().items():
+            discord_session = DiscordSession()
+            discord_messaging = DiscordRestMessaging(
+                discord_session=discord_session,
+                api_base_url=server.api_base_url,
+            )
+
+            async def send():
+                await discord_messaging.send_channel_message(
+                    channel_id=1, text="benchmark"
+                )
+                if not keep_session:
+                    await discord_session.close()
+
+            nothing = _median_us(runner, _nothing)
+            sending = _median_us(runner, send)
+            print(f"{name:<28}{nothing:>10.0f}us{sending:>14.0f}us")
+
+            runner(discord_session.close())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+Measures the write capacity a new guess costs as games grow: with the
+guesses of a game in one JSON attribute on its item, as they used to be
+stored, and with each guess as an item of its own, as GamesRepositoryImpl
+stores them now.
+
+The repository writes to a table that only records its items, whose sizes
+are counted by DynamoDB's rules: a write unit per started KB, and at most
+400 KB per item.
+
+Run from discord_app/:
+
+    python -m benchmarks.bench_guess_writes
+"""
+from datetime import datetime
+from typing import List
+
+from benchmarks.item_size import MAX_ITEM_SIZE, item_size, write_units
+from eternal_guesses import json_codec
+from eternal_guesses.model.data.game import Game
+from eternal_guesses.model.data.game_guess import GameGuess
+from eternal_guesses.repositories.games_repository import \
+    GamesRepositoryImpl, _guess_to_model
+
+GUESS_COUNTS = [10, 100, 1_000, 2_500, 10_000]
+FIRST_USER_ID = 100_000_000_000_000_000
+
+
+class _RecordingTable:
+    def __init__(self):
+        self.items: List[dict] = []
+
+    def put_item(self, Item, **kwargs):
+        self.items.append(Item)
+
+
+def _guess(user_id: int) -> GameGuess:
+    return GameGuess(
+        user_id=user_id,
+        guess=str(user_id % 1_000_000),
+        nickname=f"player {user_id % 1_000}",
+        timestamp=datetime(2023, 1, 1, 12, 0, user_id % 60, 123456),
+    )
+
+
+def _game() -> Game:
+    return Game(
+        guild_id=FIRST_USER_ID,
+        game_id="benchmark-game",
+        title="Benchmark game",
+        description="How close can you get?",
+        created_by=FIRST_USER_ID,
+        create_datetime=datetime(2023, 1, 1),
+        closed=False,
+        min_guess=1,
+        max_guess=1_000_000,
+    )
+
+
+def main():
+    game = _game()
+    table = _RecordingTable()
+    repository = GamesRepositoryImpl(eternal_guesses_table=table)
+
+    repository.create(game)
+    game_item = table.items[-1]
+
+    print(f"{'guesses':>8}  {'game item':>10}  {'write units per guess':>22}")
+    print(f"{'':>8}  {'':>10}  {'in game item':>13} {'own item':>8}")
+
+    guesses = {}
+    for guess_count in GUESS_COUNTS:
+        while len(guesses) < guess_count:
+            game_guess = _guess(FIRST_USER_ID + len(guesses))
+            guesses[game_guess.user_id] = _guess_to_model(game_guess)
+
+        # Adding a guess used to write the game's item with all its guesses
+        blob_item = dict(game_item)
+        blob_item['guesses'] = json_codec.dumps(guesses)
+        blob_size = item_size(blob_item)
+        blob_units = f"{write_units(blob_item)}" \
+            if blob_size <= MAX_ITEM_SIZE else "too large"
+
+        repository.save_guess(game, _guess(FIRST_USER_ID + guess_count))
+        guess_units = write_units(table.items[-1])
+
+        print(f"{guess_count:>8}  {blob_size / 1024:>8.1f}KB  "
+              f"{blob_units:>13} {guess_units:>8}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""
+Measures the per-request overhead of getting an interaction from the API
+Gateway event to its route: handler.handle_lambda with an authorizer that
+lets everything pass and a router that answers right away, so only the
+decoding, parsing and logging is left. Logging is at INFO, as deployed.
+
+Run from discord_app/:
+
+    python -m benchmarks.bench_ingress
+"""
+import json
+import timeit
+from typing import Dict
+
+from loguru import logger
+
+from eternal_guesses import event_handler
+from eternal_guesses.app.api_authorizer import ApiAuthorizer, \
+    AuthorizationResult
+from eternal_guesses.app.component_ids import ComponentIds
+from eternal_guesses.app.discord_event_handler import DiscordEventHandler
+from eternal_guesses.app.router import Router
+from eternal_guesses.model.lambda_response import LambdaResponse
+from tests.integration import discord_events
+
+RUNS = 5000
+DESCRIPTION_LENGTH = 4000
+
+
+class _PassingAuthorizer(ApiAuthorizer):
+    def authorize(self, request) -> (AuthorizationResult, LambdaResponse):
+        return AuthorizationResult.PASS, None
+
+
+class _AnsweringRouter(Router):
+    async def route(self, event) -> LambdaResponse:
+        return LambdaResponse.success({'type': 1})
+
+    def is_deferred(self, event) -> bool:
+        return False
+
+
+def _api_gateway_event(event: Dict) -> Dict:
+    """Adds what API Gateway sends along with an interaction."""
+    return {
+        'resource': '/event',
+        'path': '/event',
+        'httpMethod': 'POST',
+        'headers': {
+            'Accept-Encoding': 'gzip',
+            'CloudFront-Forwarded-Proto': 'https',
+            'CloudFront-Viewer-Country': 'US',
+            'Content-Type': 'application/json',
+            'Host': 'abcdef1234.execute-api.eu-west-1.amazonaws.com',
+            'User-Agent': 'Discord-Interactions/1.0 (+https://discord.com)',
+            'Via': '1.1 0123456789abcdef.cloudfront.net (CloudFront)',
+            'X-Amz-Cf-Id': 'AbCdEfGhIjKlMnOpQrStUvWxYz0123456789AbCdEfGhIj==',
+            'X-Amzn-Trace-Id': 'Root=1-65000000-0123456789abcdef01234567',
+            'X-Forwarded-For': '35.0.0.1, 130.176.0.1',
+            'X-Forwarded-Port': '443',
+            'X-Forwarded-Proto': 'https',
+            'x-signature-ed25519': 'ab' * 64,
+            'x-signature-timestamp': '1700000000',
+        },
+        'requestContext': {
+            'resourcePath': '/event',
+            'httpMethod': 'POST',
+            'stage': 'prod',
+            'requestId': '01234567-89ab-cdef-0123-456789abcdef',
+            'identity': {'sourceIp': '35.0.0.1'},
+        },
+        'body': event['body'],
+        'isBase64Encoded': False,
+    }
+
+
+def _events() -> Dict[str, Dict]:
+    return {
+        'ping': _api_gateway_event({
+            'body': json.dumps({"id": "1", "token": "t", "type": 1, "version": 1}),
+        }),
+        'large modal': _api_gateway_event(discord_events.modal_submit_event(
+            guild_id=1,
+            modal_custom_id=ComponentIds.submit_create_modal_id,
+            inputs={
+                ComponentIds.submit_create_input_game_id: "benchmark-game",
+                ComponentIds.submit_create_input_title: "Benchmark game",
+                ComponentIds.submit_create_input_description:
+                    "x" * DESCRIPTION_LENGTH,
+                ComponentIds.submit_create_input_min_value: "1",
+                ComponentIds.submit_create_input_max_value: "100",
+            },
+        )),
+    }
+
+
+def main():
+    logger.remove()
+    logger.add(lambda message: None, level='INFO')
+
+    event_handler.discord_event_handler = DiscordEventHandler(
+        router=_AnsweringRouter(),
+        api_authorizer=_PassingAuthorizer(),
+    )
+
+    from eternal_guesses import handler
+
+    for name, event in _events().items():
+        seconds = timeit.timeit(
+            lambda: handler.handle_lambda(event, None), number=RUNS
+        ) / RUNS
+        print(f"{name:<12} {seconds * 1_000_000:>7.1f}us per request")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+"""
+Measures json_codec's codecs on the payloads of the request path: decoding
+an interaction body, encoding a response with a game post, and encoding and
+decoding the guesses of a game as they were stored in DynamoDB before they
+got items of their own, for games with 1k and 10k guesses.
+
+Run from discord_app/:
+
+    python -m benchmarks.bench_json
+"""
+import json
+import timeit
+from datetime import datetime
+from typing import Callable, Dict, List, Tuple
+
+from eternal_guesses.app.component_ids import ComponentIds
+from eternal_guesses.app.message_provider import MessageProviderImpl
+from eternal_guesses.json_codec import OrjsonCodec, StdlibCodec
+from eternal_guesses.model.data.game import Game
+from eternal_guesses.model.data.game_guess import GameGuess
+from eternal_guesses.model.discord.discord_response import DiscordResponse
+from eternal_guesses.repositories.games_repository import _guess_to_model
+from tests.integration import discord_events
+
+SECONDS_PER_PAYLOAD = 0.5
+POST_GUESS_COUNT = 50
+STORED_GUESS_COUNTS = [1_000, 10_000]
+
+
+def _game(guess_count: int) -> Game:
+    return Game(
+        guild_id=1,
+        game_id="benchmark-game",
+        title="Benchmark game",
+        description="How close can you get?",
+        guesses={
+            user_id: GameGuess(
+                user_id=user_id,
+                guess=str(user_id * 7),
+                nickname=f"player {user_id}",
+                timestamp=datetime(2023, 1, 1, 12, 0, user_id % 60),
+            )
+            for user_id in range(100_000_000_000_000_000,
+                                 100_000_000_000_000_000 + guess_count)
+        },
+    )
+
+
+def _payloads() -> List[Tuple[str, str, object]]:
+    """Name, operation (loads or dumps), and its input."""
+    interaction_body = discord_events.modal_submit_event(
+        guild_id=1,
+        modal_custom_id=ComponentIds.submit_guess_modal_id("benchmark-game"),
+        inputs={ComponentIds.submit_guess_input_value: "42"},
+    )['body'].encode()
+
+    response = DiscordResponse.channel_message(
+        embed=MessageProviderImpl().game_post_embed(_game(POST_GUESS_COUNT))
+    )
+
+    payloads = [
+        ('interaction body', 'loads', interaction_body),
+        (f'post with {POST_GUESS_COUNT} guesses', 'dumps', response.json()),
+    ]
+
+    for guess_count in STORED_GUESS_COUNTS:
+        guesses = {
+            user_id: _guess_to_model(game_guess)
+            for user_id, game_guess in _game(guess_count).guesses.items()
+        }
+        payloads += [
+            (f'{guess_count} guesses', 'dumps', guesses),
+            (f'{guess_count} guesses', 'loads', json.dumps(guesses)),
+        ]
+
+    return payloads
+
+
+def _seconds(operation: Callable, payload) -> float:
+    timer = timeit.Timer(lambda: operation(payload))
+    number, _ = timer.autorange()
+    runs = max(1, int(number * SECONDS_PER_PAYLOAD / 0.2))
+
+    return min(timer.repeat(repeat=3, number=runs)) / runs
+
+
+def main():
+    codecs: Dict[str, object] = {'json': StdlibCodec()}
+    try:
+        codecs['orjson'] = OrjsonCodec()
+    except ImportError:
+        print("orjson isn't installed, only measuring json")
+
+    print(f"{'payload':<26}{'op':<7}" +
+          "".join(f"{name:>12}" for name in codecs) + "  speedup")
+    for name, operation, payload in _payloads():
+        timings = [
+            _seconds(getattr(codec, operation), payload)
+            for codec in codecs.values()
+        ]
+        speedup = f"{timings[0] / timings[-1]:>7.1f}x" if len(timings) > 1 \
+            else ""
+
+        print(f"{name:<26}{operation:<7}" +
+              "".join(f"{t * 1_000_000:>10.1f}us" for t in timings) +
+              f"  {speedup}")
+
+
+if __name__ == '__main__':
+    main()
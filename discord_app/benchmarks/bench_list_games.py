@@ -0,0 +1,168 @@
+"""
+Measures what listing the games of a guild reads, for a guild with
+hundreds of games with many guesses each: with get_all, which the listing
+used to load whole games with, with get_summaries, and with the summaries
+of only the open games, from the index of them.
+
+The repository reads from a table that keeps the guild's items in memory
+and answers its queries as DynamoDB would: the key condition selects the
+items read (and billed), the filter and projection what's sent back. The
+time per listing is that of handling the response: parsing it, turning
+its attribute values into Python values like boto3 does, and building the
+games from them.
+
+Run from discord_app/:
+
+    python -m benchmarks.bench_list_games
+"""
+import json
+import re
+import timeit
+from datetime import datetime
+from typing import Dict, Tuple
+
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+
+from benchmarks.item_size import item_size, read_units
+from eternal_guesses.model.data.game import Game
+from eternal_guesses.model.data.game_guess import GameGuess
+from eternal_guesses.repositories.games_repository import OPEN_GAMES_INDEX, \
+    OPEN_PK, GamesRepositoryImpl
+
+GUILD_ID = 1
+GAME_COUNT = 300
+GUESSES_PER_GAME = 100
+DESCRIPTION_LENGTH = 1000
+RUNS = 5
+
+# As the index of open games is defined in the InfraStack
+INDEX_ATTRIBUTES = ['pk', 'sk', OPEN_PK, 'title', 'closed']
+
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+
+class _GuildTable:
+    def __init__(self):
+        self.items: Dict[Tuple[str, str], dict] = {}
+        self.responses: Dict[str, Tuple[str, int, int, int]] = {}
+
+        self.items_read = 0
+        self.bytes_read = 0
+        self.bytes_returned = 0
+
+    def put_item(self, Item, **kwargs):
+        self.items[(Item['pk'], Item['sk'])] = Item
+
+    def query(self, **kwargs):
+        key = json.dumps(kwargs, sort_keys=True)
+        if key not in self.responses:
+            self.responses[key] = self._respond(**kwargs)
+        body, items_read, bytes_read, bytes_returned = self.responses[key]
+
+        self.items_read += items_read
+        self.bytes_read += bytes_read
+        self.bytes_returned += bytes_returned
+
+        # What boto3 does with the response: parse it, and turn each
+        # attribute value into a Python value
+        return {'Items': [
+            {name: _deserializer.deserialize(value)
+             for name, value in item.items()}
+            for item in json.loads(body)['Items']
+        ]}
+
+    def _respond(self, **kwargs) -> Tuple[str, int, int, int]:
+        values = kwargs['ExpressionAttributeValues']
+        if kwargs.get('IndexName') == OPEN_GAMES_INDEX:
+            # The index only has the open games, with what it projects
+            items = [
+                {name: item[name] for name in INDEX_ATTRIBUTES if name in item}
+                for (_, sk), item in sorted(self.items.items())
+                if item.get(OPEN_PK) == values[':pk'] and
+                sk.startswith(values[':sk'])
+            ]
+        else:
+            items = [
+                item for (pk, sk), item in sorted(self.items.items())
+                if pk == values[':pk'] and sk.startswith(values[':sk'])
+            ]
+        items_read = len(items)
+        bytes_read = sum(item_size(item) for item in items)
+
+        filter_expression = kwargs.get('FilterExpression')
+        if filter_expression is not None:
+            attribute = re.fullmatch(r'attribute_exists\((\w+)\)',
+                                     filter_expression).group(1)
+            items = [item for item in items if attribute in item]
+
+        projection = kwargs.get('ProjectionExpression')
+        if projection is not None:
+            names = projection.split(', ')
+            items = [
+                {name: item[name] for name in names if name in item}
+                for item in items
+            ]
+
+        body = json.dumps({'Items': [
+            {name: _serializer.serialize(value)
+             for name, value in item.items()}
+            for item in items
+        ]})
+
+        return body, items_read, bytes_read, \
+            sum(item_size(item) for item in items)
+
+
+def _fill(repository: GamesRepositoryImpl):
+    for game_number in range(GAME_COUNT):
+        game = Game(
+            guild_id=GUILD_ID,
+            game_id=f"game-{game_number}",
+            title=f"Game number {game_number}",
+            description="x" * DESCRIPTION_LENGTH,
+            created_by=100_000_000_000_000_000,
+            create_datetime=datetime(2023, 1, 1),
+            closed=game_number % 3 == 0,
+        )
+        repository.create(game)
+
+        for user_id in range(GUESSES_PER_GAME):
+            repository.save_guess(game, GameGuess(
+                user_id=100_000_000_000_000_000 + user_id,
+                guess=str(user_id * 7),
+                nickname=f"player {user_id}",
+                timestamp=datetime(2023, 1, 1, 12, 0, user_id % 60),
+            ))
+
+
+def main():
+    table = _GuildTable()
+    repository = GamesRepositoryImpl(eternal_guesses_table=table)
+    _fill(repository)
+
+    print(f"{GAME_COUNT} games with {GUESSES_PER_GAME} guesses each\n")
+    print(f"{'':<14}{'items read':>11}{'read units':>11}"
+          f"{'returned':>12}{'per listing':>13}")
+
+    listings = {
+        'get_all': repository.get_all,
+        'get_summaries': repository.get_summaries,
+        'open only': lambda guild_id: list(
+            repository.iter_summaries(guild_id, open_only=True)
+        ),
+    }
+    for name, listing in listings.items():
+        listing(GUILD_ID)
+        table.items_read = table.bytes_read = table.bytes_returned = 0
+
+        seconds = timeit.timeit(lambda: listing(GUILD_ID), number=RUNS) / RUNS
+
+        print(f"{name:<14}{table.items_read // RUNS:>11}"
+              f"{read_units(table.bytes_read // RUNS):>11.1f}"
+              f"{table.bytes_returned / RUNS / 1024:>10.1f}KB"
+              f"{seconds * 1000:>11.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
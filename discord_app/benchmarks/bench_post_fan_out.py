@@ -0,0 +1,67 @@
+"""
+Measures how long GamePostManagerImpl.update takes for a game posted in
+many channels, against a fake messaging backend with a fixed per-request
+delay standing in for the Discord round-trip.
+
+Run from discord_app/:
+
+    python -m benchmarks.bench_post_fan_out
+"""
+import asyncio
+import time
+
+from loguru import logger
+
+from eternal_guesses.app.game_post_manager import GamePostManagerImpl
+from eternal_guesses.app.message_provider import MessageProviderImpl
+from eternal_guesses.model.data.channel_message import ChannelMessage
+from eternal_guesses.model.data.game import Game
+from tests.fakes import FakeDiscordMessaging, FakeGamesRepository
+
+ROUND_TRIP_SECONDS = 0.05
+POST_COUNTS = [1, 5, 10, 25]
+CONCURRENCY_LIMITS = [1, 5, 10]
+
+
+async def _time_update(post_count: int, max_concurrency: int) -> float:
+    game = Game(
+        guild_id=1,
+        game_id="benchmark-game",
+        closed=False,
+        channel_messages=[
+            ChannelMessage(channel_id=i, message_id=i)
+            for i in range(post_count)
+        ],
+    )
+
+    game_post_manager = GamePostManagerImpl(
+        games_repository=FakeGamesRepository([game]),
+        message_provider=MessageProviderImpl(),
+        discord_messaging=FakeDiscordMessaging(
+            delay_seconds=ROUND_TRIP_SECONDS
+        ),
+        max_concurrency=max_concurrency,
+    )
+
+    start = time.perf_counter()
+    await game_post_manager.update(game)
+    return time.perf_counter() - start
+
+
+async def main():
+    logger.remove()
+    print(f"round-trip per edit: {ROUND_TRIP_SECONDS * 1000:.0f}ms")
+    print("posts " + "".join(f"{f'limit={c}':>12}" for c in CONCURRENCY_LIMITS))
+
+    for post_count in POST_COUNTS:
+        durations = [
+            await _time_update(post_count, limit)
+            for limit in CONCURRENCY_LIMITS
+        ]
+        print(f"{post_count:>5} " + "".join(
+            f"{d * 1000:>10.0f}ms" for d in durations
+        ))
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
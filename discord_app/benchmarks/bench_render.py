@@ -0,0 +1,86 @@
+"""
+Measures what rendering a game post costs a cold start: the time to import
+the interaction path (in a fresh interpreter each run, as in a new Lambda
+container), and the time to render a game post to Discord's JSON.
+
+Run from discord_app/:
+
+    python -m benchmarks.bench_render
+"""
+import os
+import statistics
+import subprocess
+import sys
+import timeit
+from datetime import datetime
+
+from eternal_guesses.app.message_provider import MessageProviderImpl
+from eternal_guesses.model.data.game import Game
+from eternal_guesses.model.data.game_guess import GameGuess
+
+IMPORT_RUNS = 7
+IMPORTED_MODULES = [
+    'eternal_guesses.app.message_provider',
+    'eternal_guesses.app.injector',
+]
+
+RENDER_RUNS = 2000
+GUESS_COUNT = 50
+
+
+def _import_seconds(module: str) -> float:
+    code = f"import time\n" \
+           f"start = time.perf_counter()\n" \
+           f"import {module}\n" \
+           f"print(time.perf_counter() - start)"
+
+    durations = []
+    for _ in range(IMPORT_RUNS):
+        output = subprocess.run(
+            [sys.executable, '-c', code],
+            capture_output=True,
+            check=True,
+            text=True,
+            env={**os.environ, 'PYTHONPATH': os.getcwd()},
+        )
+        durations.append(float(output.stdout))
+
+    return statistics.median(durations)
+
+
+def _render_seconds() -> float:
+    game = Game(
+        guild_id=1,
+        game_id="benchmark-game",
+        title="Benchmark game",
+        description="How many guesses can a post show?",
+        guesses={
+            user_id: GameGuess(
+                user_id=user_id,
+                guess=str(user_id),
+                nickname=f"user {user_id}",
+                timestamp=datetime.now(),
+            )
+            for user_id in range(GUESS_COUNT)
+        },
+    )
+    message_provider = MessageProviderImpl()
+
+    def render():
+        message_provider.game_post_embed(game).json()
+        for action_row in message_provider.game_post_action_rows(game):
+            action_row.json()
+
+    return timeit.timeit(render, number=RENDER_RUNS) / RENDER_RUNS
+
+
+def main():
+    for module in IMPORTED_MODULES:
+        print(f"import {module}: {_import_seconds(module) * 1000:.0f}ms")
+
+    print(f"render post with {GUESS_COUNT} guesses: "
+          f"{_render_seconds() * 1_000_000:.1f}us")
+
+
+if __name__ == '__main__':
+    main()
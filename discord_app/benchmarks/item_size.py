@@ -0,0 +1,43 @@
+"""
+The size of DynamoDB items, by the rules DynamoDB bills reads and writes
+by: https://docs.aws.amazon.com/amazondynamodb/latest/developerguide/CapacityUnitCalculations.html
+"""
+import math
+from decimal import Decimal
+
+MAX_ITEM_SIZE = 400 * 1024
+
+
+def _attribute_size(value) -> int:
+    if isinstance(value, str):
+        return len(value.encode())
+    if isinstance(value, bool) or value is None:
+        return 1
+    if isinstance(value, (int, float, Decimal)):
+        digits = len(str(abs(value)).replace('.', '').strip('0')) or 1
+        return math.ceil(digits / 2) + 1
+    if isinstance(value, dict):
+        return 3 + sum(_attribute_size(name) + _attribute_size(element) + 1
+                       for name, element in value.items())
+    if isinstance(value, list):
+        return 3 + sum(_attribute_size(element) + 1 for element in value)
+
+    raise TypeError(f"can't size {value!r}")
+
+
+def item_size(item: dict) -> int:
+    return sum(_attribute_size(name) + _attribute_size(value)
+               for name, value in item.items())
+
+
+def write_units(item: dict) -> int:
+    """A write unit per started KB."""
+    return math.ceil(item_size(item) / 1024)
+
+
+def read_units(size: int) -> float:
+    """
+    Half a read unit per started 4 KB that a Query reads, as the
+    repository's reads are eventually consistent.
+    """
+    return math.ceil(size / 4096) / 2
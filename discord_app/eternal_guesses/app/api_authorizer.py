@@ -1,13 +1,19 @@
+import time
 from abc import ABC
 from enum import Enum
-from typing import Dict
+from typing import Callable, Optional
 
 from loguru import logger
+from nacl.exceptions import BadSignatureError
 from nacl.signing import VerifyKey
 
+from eternal_guesses.app.ingress import InteractionRequest
 from eternal_guesses.model.lambda_response import LambdaResponse
 from eternal_guesses.app import app_config
 
+# An Ed25519 signature is 64 bytes, sent as hex
+SIGNATURE_HEX_LENGTH = 128
+
 
 class AuthorizationResult(Enum):
     PASS = True
@@ -15,33 +21,91 @@ class AuthorizationResult(Enum):
 
 
 class ApiAuthorizer(ABC):
-    def authorize(self, event: Dict) -> (AuthorizationResult, LambdaResponse):
+    def authorize(
+        self, request: InteractionRequest
+    ) -> (AuthorizationResult, LambdaResponse):
         pass
 
 
 class ApiAuthorizerImpl(ApiAuthorizer):
-    def authorize(self, event: Dict) -> (AuthorizationResult, LambdaResponse):
-        body = event['body'].encode()
-        headers = event['headers']
-        signature = headers['x-signature-ed25519']
-        timestamp = headers['x-signature-timestamp']
-
-        result = self.verify_key(
-            body, signature, timestamp, app_config.discord_public_key()
-        )
-        if result:
+    """
+    Checks that a request was signed by Discord, with the application's
+    public key. The key is parsed once, on first use, and kept for the
+    container's life.
+
+    Discord checks that the endpoint rejects bad signatures, so those are
+    expected: they're rejected without a traceback, and requests that can't
+    hold a valid signature are rejected before any crypto runs. With
+    max_timestamp_age, so are requests signed longer ago (or further in
+    the future) than that many seconds.
+    """
+
+    def __init__(
+        self,
+        public_key: str = None,
+        max_timestamp_age: Optional[float] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.public_key = public_key
+        self.max_timestamp_age = max_timestamp_age
+        self.clock = clock
+
+        self._verify_key: Optional[VerifyKey] = None
+
+    def authorize(
+        self, request: InteractionRequest
+    ) -> (AuthorizationResult, LambdaResponse):
+        signature = request.header('x-signature-ed25519')
+        timestamp = request.header('x-signature-timestamp')
+
+        if self._is_valid(request.body, signature, timestamp):
             return AuthorizationResult.PASS, None
         else:
             return AuthorizationResult.FAIL, LambdaResponse.unauthorized(
                 "could not verify authorization"
             )
 
-    def verify_key(self, body, signature, timestamp, public_key):
-        message = timestamp.encode() + body
+    def _is_valid(self, body: bytes, signature: str, timestamp: str) -> bool:
+        if signature is None or timestamp is None:
+            logger.info("rejected request without a signature")
+            return False
+
+        if len(signature) != SIGNATURE_HEX_LENGTH:
+            logger.info("rejected request with a malformed signature")
+            return False
+
+        if self.max_timestamp_age is not None and \
+                not self._is_recent(timestamp):
+            logger.info(f"rejected request signed at {timestamp}")
+            return False
+
+        try:
+            signature_bytes = bytes.fromhex(signature)
+        except ValueError:
+            logger.info("rejected request with a malformed signature")
+            return False
+
+        try:
+            self._get_verify_key().verify(
+                timestamp.encode() + body, signature_bytes
+            )
+        except BadSignatureError:
+            logger.info("rejected request with a bad signature")
+            return False
+
+        return True
+
+    def _is_recent(self, timestamp: str) -> bool:
         try:
-            vk = VerifyKey(bytes.fromhex(public_key))
-            vk.verify(message, bytes.fromhex(signature))
-            return True
-        except Exception as ex:
-            logger.exception(ex)
-        return False
+            signed_at = int(timestamp)
+        except ValueError:
+            return False
+
+        return abs(self.clock() - signed_at) <= self.max_timestamp_age
+
+    def _get_verify_key(self) -> VerifyKey:
+        if self._verify_key is None:
+            public_key = self.public_key or app_config.discord_public_key()
+            self._verify_key = VerifyKey(bytes.fromhex(public_key))
+
+        return self._verify_key
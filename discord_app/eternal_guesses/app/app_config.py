@@ -10,9 +10,46 @@ def discord_bot_token() -> str:
     return os.getenv('DISCORD_BOT_TOKEN')
 
 
+def discord_api_base_url() -> str:
+    return os.getenv('DISCORD_API_BASE_URL', 'https://discord.com/api/v10')
+
+
 def dynamodb_table_name() -> str:
     return os.getenv('DYNAMODB_TABLE_NAME')
 
 
 def aws_endpoint_url() -> typing.Optional[str]:
     return os.getenv('AWS_ENDPOINT_URL', None)
+
+
+def post_update_concurrency() -> int:
+    return int(os.getenv('POST_UPDATE_CONCURRENCY', 10))
+
+
+def deferred_responses() -> bool:
+    return os.getenv('DEFERRED_RESPONSES', 'false').lower() == 'true'
+
+
+def lambda_function_name() -> str:
+    return os.getenv('AWS_LAMBDA_FUNCTION_NAME')
+
+
+def post_update_queue_url() -> typing.Optional[str]:
+    return os.getenv('POST_UPDATE_QUEUE_URL', None)
+
+
+def post_update_queue_path() -> typing.Optional[str]:
+    return os.getenv('POST_UPDATE_QUEUE_PATH', None)
+
+
+def post_update_coalesce_seconds() -> float:
+    return float(os.getenv('POST_UPDATE_COALESCE_SECONDS', 2))
+
+
+def use_uvloop() -> bool:
+    return os.getenv('USE_UVLOOP', 'false').lower() == 'true'
+
+
+def signature_max_age_seconds() -> typing.Optional[float]:
+    max_age = os.getenv('SIGNATURE_MAX_AGE_SECONDS', None)
+    return float(max_age) if max_age else None
@@ -1,60 +1,87 @@
+from eternal_guesses.app.custom_id import CustomIdKind, GameMemberCustomId
+from eternal_guesses.model.discord.discord_event import InteractionType
+
+COMPONENT = InteractionType.MESSAGE_COMPONENT
+MODAL = InteractionType.MODAL_SUBMIT
+
+
 class ComponentIds:
-    component_button_post_game_prefix = "button-post_game-"
-    component_button_post_game_regex = r"button-post_game-(.*)"
+    # The custom_ids are sent back by Discord when a component is used, also
+    # for posts made by an earlier version: a template can't change once
+    # it's been released.
+    component_button_post_game = CustomIdKind(
+        COMPONENT, "button-post_game-{game_id}"
+    )
 
-    component_button_close_game_prefix = "action-manage_game-close-"
+    component_button_close_game = CustomIdKind(
+        COMPONENT, "action-manage_game-close-{game_id}"
+    )
 
     @classmethod
     def component_button_close_game_id(cls, game_id):
-        return f"{cls.component_button_close_game_prefix}{game_id}"
+        return cls.component_button_close_game.encode(game_id)
 
-    component_button_reopen_game_prefix = "action-manage_game-reopen-"
+    component_button_reopen_game = CustomIdKind(
+        COMPONENT, "action-manage_game-reopen-{game_id}"
+    )
 
     @classmethod
     def component_button_reopen_game_id(cls, game_id):
-        return f"{cls.component_button_reopen_game_prefix}{game_id}"
+        return cls.component_button_reopen_game.encode(game_id)
 
     @classmethod
     def component_button_post_game_id(cls, game_id: str):
-        return f"{ComponentIds.component_button_post_game_prefix}{game_id}"
+        return cls.component_button_post_game.encode(game_id)
 
-    component_button_edit_guess_prefix = "button-manage_game-edit_guess-"
+    component_button_edit_guess = CustomIdKind(
+        COMPONENT, "button-manage_game-edit_guess-{game_id}"
+    )
 
     @classmethod
     def component_button_edit_guess_id(cls, game_id):
-        return f"{cls.component_button_edit_guess_prefix}{game_id}"
+        return cls.component_button_edit_guess.encode(game_id)
 
-    component_button_delete_guess_prefix = "button-manage_game-delete_guess-"
+    component_button_delete_guess = CustomIdKind(
+        COMPONENT, "button-manage_game-delete_guess-{game_id}"
+    )
 
     @classmethod
     def component_button_delete_guess_id(cls, game_id):
-        return f"{cls.component_button_delete_guess_prefix}{game_id}"
+        return cls.component_button_delete_guess.encode(game_id)
 
-    component_select_delete_guess_prefix = "selector-manage_game-delete_guess-"
+    component_select_delete_guess = CustomIdKind(
+        COMPONENT, "selector-manage_game-delete_guess-{game_id}"
+    )
 
     @classmethod
     def component_select_delete_guess_id(cls, game_id):
-        return f"{cls.component_select_delete_guess_prefix}{game_id}"
+        return cls.component_select_delete_guess.encode(game_id)
 
-    component_select_edit_guess_prefix = "selector-manage_game-edit_guess-"
+    component_select_edit_guess = CustomIdKind(
+        COMPONENT, "selector-manage_game-edit_guess-{game_id}"
+    )
 
     @classmethod
     def component_select_edit_guess_id(cls, game_id):
-        return f"{cls.component_select_edit_guess_prefix}{game_id}"
+        return cls.component_select_edit_guess.encode(game_id)
 
     component_select_game_to_manage = "selector-select-game-to-manage"
 
-    component_button_edit_game_prefix = "button-manage_game-edit-"
+    component_button_edit_game = CustomIdKind(
+        COMPONENT, "button-manage_game-edit-{game_id}"
+    )
 
     @classmethod
     def component_button_edit_game_id(cls, game_id):
-        return f"{cls.component_button_edit_game_prefix}{game_id}"
+        return cls.component_button_edit_game.encode(game_id)
 
-    component_button_guess_prefix = "button_trigger_guess_modal_"
+    component_button_guess = CustomIdKind(
+        COMPONENT, "button_trigger_guess_modal_{game_id}"
+    )
 
-    @staticmethod
-    def component_button_guess_id(game_id: str):
-        return f"{ComponentIds.component_button_guess_prefix}{game_id}"
+    @classmethod
+    def component_button_guess_id(cls, game_id: str):
+        return cls.component_button_guess.encode(game_id)
 
     submit_create_modal_id = "modal_create_game"
     submit_create_input_game_id = "modal_create_game_id"
@@ -63,72 +90,99 @@ class ComponentIds:
     submit_create_input_min_value = "modal_create_game_min_value"
     submit_create_input_max_value = "modal_create_game_max_value"
 
-    submit_guess_modal_prefix = "modal_submit_guess_"
-    submit_guess_modal_regex = "modal_submit_guess_(.*)"
+    submit_guess_modal = CustomIdKind(MODAL, "modal_submit_guess_{game_id}")
     submit_guess_input_value = "modal_input_guess_value"
 
     @classmethod
     def submit_guess_modal_id(cls, game_id):
-        return f"modal_submit_guess_{game_id}"
+        return cls.submit_guess_modal.encode(game_id)
 
-    edit_guess_modal_prefix = "modal-edit_guess-game_"
-    edit_guess_modal_regex = r"modal-edit_guess-game_(.*)-member_(.*)"
+    edit_guess_modal = CustomIdKind(
+        MODAL,
+        "modal-edit_guess-game_{game_id}-member_{member_id}",
+        GameMemberCustomId,
+    )
 
     @classmethod
     def edit_guess_modal_id(cls, game_id, member_id):
-        return f"{cls.edit_guess_modal_prefix}{game_id}-member_{member_id}"
+        return cls.edit_guess_modal.encode(game_id, member_id)
 
     edit_guess_modal_input_id = "modal-edit_guess-new_guess_input"
 
-    selector_post_game_prefix = "select-post_game-"
+    selector_post_game = CustomIdKind(COMPONENT, "select-post_game-{game_id}")
 
     @classmethod
     def selector_post_game_id(cls, game_id):
-        return f"{cls.selector_post_game_prefix}{game_id}"
-
-    edit_game_title_modal_prefix = "modal-edit_game-title-"
-    edit_game_min_guess_modal_prefix = "modal-edit_game-min_guess-"
-    edit_game_max_guess_modal_prefix = "modal-edit_game-max_guess-"
-    edit_game_description_modal_prefix = "modal-edit_game-description-"
+        return cls.selector_post_game.encode(game_id)
+
+    edit_game_title_modal = CustomIdKind(
+        MODAL, "modal-edit_game-title-{game_id}"
+    )
+    edit_game_min_guess_modal = CustomIdKind(
+        MODAL, "modal-edit_game-min_guess-{game_id}"
+    )
+    edit_game_max_guess_modal = CustomIdKind(
+        MODAL, "modal-edit_game-max_guess-{game_id}"
+    )
+    edit_game_description_modal = CustomIdKind(
+        MODAL, "modal-edit_game-description-{game_id}"
+    )
 
     @classmethod
     def edit_game_title_modal_id(cls, game_id):
-        return f"{cls.edit_game_title_modal_prefix}{game_id}"
+        return cls.edit_game_title_modal.encode(game_id)
 
     @classmethod
     def edit_game_min_guess_modal_id(cls, game_id):
-        return f"{cls.edit_game_min_guess_modal_prefix}{game_id}"
+        return cls.edit_game_min_guess_modal.encode(game_id)
 
     @classmethod
     def edit_game_max_guess_modal_id(cls, game_id):
-        return f"{cls.edit_game_max_guess_modal_prefix}{game_id}"
+        return cls.edit_game_max_guess_modal.encode(game_id)
 
     @classmethod
     def edit_game_description_modal_id(cls, game_id):
-        return f"{cls.edit_game_description_modal_prefix}{game_id}"
+        return cls.edit_game_description_modal.encode(game_id)
 
     edit_game_title_input = "input-edit_game-title"
     edit_game_min_guess_input = "input-edit_game-min_guess"
     edit_game_max_guess_input = "input-edit_game-max_guess"
     edit_game_description_input = "input-edit_game-description"
 
-    button_edit_game_title_prefix = "button-edit_game_title-"
-    button_edit_game_min_guess_prefix = "button-edit_game_min_guess-"
-    button_edit_game_max_guess_prefix = "button-edit_game_max_guess-"
-    button_edit_game_description_prefix = "button-edit_game_description-"
+    button_edit_game_title = CustomIdKind(
+        COMPONENT, "button-edit_game_title-{game_id}"
+    )
+    button_edit_game_min_guess = CustomIdKind(
+        COMPONENT, "button-edit_game_min_guess-{game_id}"
+    )
+    button_edit_game_max_guess = CustomIdKind(
+        COMPONENT, "button-edit_game_max_guess-{game_id}"
+    )
+    button_edit_game_description = CustomIdKind(
+        COMPONENT, "button-edit_game_description-{game_id}"
+    )
 
     @classmethod
     def button_edit_game_title_id(cls, game_id):
-        return f"{cls.button_edit_game_title_prefix}{game_id}"
+        return cls.button_edit_game_title.encode(game_id)
 
     @classmethod
     def button_edit_game_min_guess_id(cls, game_id):
-        return f"{cls.button_edit_game_min_guess_prefix}{game_id}"
+        return cls.button_edit_game_min_guess.encode(game_id)
 
     @classmethod
     def button_edit_game_max_guess_id(cls, game_id):
-        return f"{cls.button_edit_game_max_guess_prefix}{game_id}"
+        return cls.button_edit_game_max_guess.encode(game_id)
 
     @classmethod
     def button_edit_game_description_id(cls, game_id):
-        return f"{cls.button_edit_game_description_prefix}{game_id}"
+        return cls.button_edit_game_description.encode(game_id)
+
+    @classmethod
+    def max_game_id_length(cls) -> int:
+        """The longest game id that fits in every custom_id it's put in."""
+        return min(
+            kind.max_text_length
+            for kind in vars(cls).values()
+            if isinstance(kind, CustomIdKind)
+        )
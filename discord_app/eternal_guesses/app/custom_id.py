@@ -0,0 +1,111 @@
+import re
+from typing import Generic, NamedTuple, Type, TypeVar
+
+from eternal_guesses.app.dispatcher import RouteKey
+from eternal_guesses.exceptions import InvalidCustomIdError
+from eternal_guesses.model.discord.discord_event import InteractionType
+
+# Discord rejects components and modals with a longer custom_id
+MAX_CUSTOM_ID_LENGTH = 100
+
+# The ints in custom_ids are Discord ids, which fit in 64 bits
+MAX_INT_LENGTH = len(str(2 ** 64))
+
+FIELD = re.compile(r"{(\w+)}")
+FIELD_PATTERNS = {
+    str: r"(.*)",
+    int: r"(\d+)",
+}
+
+T = TypeVar('T')
+
+
+class GameCustomId(NamedTuple):
+    game_id: str
+
+
+class GameMemberCustomId(NamedTuple):
+    game_id: str
+    member_id: int
+
+
+class CustomIdKind(Generic[T]):
+    """
+    A kind of custom_id, declared by a template with its fields in braces
+    ("button-post_game-{game_id}"). The fields are those of fields_type (a
+    NamedTuple), in the same order, and a custom_id decodes into an instance
+    of it.
+
+    The template is compiled once: encoding is a str.format, and decoding a
+    slice (for a single text field at the end) or a precompiled regex.
+    """
+
+    def __init__(
+        self,
+        interaction_type: InteractionType,
+        template: str,
+        fields_type: Type[T] = GameCustomId,
+    ):
+        self.interaction_type = interaction_type
+        self.template = template
+        self.fields_type = fields_type
+
+        parts = FIELD.split(template)
+        literals, names = parts[0::2], parts[1::2]
+        if names != list(fields_type._fields):
+            raise ValueError(
+                f"fields {names} of '{template}' don't match {fields_type}"
+            )
+
+        self.prefix = literals[0]
+        self.converters = list(fields_type.__annotations__.values())
+        self.format = FIELD.sub("{}", template)
+        self.pattern = re.compile("".join(
+            re.escape(literal) + FIELD_PATTERNS[converter]
+            for literal, converter in zip(literals, self.converters)
+        ) + re.escape(literals[-1]))
+        self.int_fields = [
+            i for i, converter in enumerate(self.converters)
+            if converter is int
+        ]
+        self.single_field = self.converters == [str] and literals[-1] == ""
+
+        # The longest text field that keeps the custom_id within Discord's
+        # limit, with the int fields at their longest
+        self.max_text_length = (
+            MAX_CUSTOM_ID_LENGTH -
+            sum(len(literal) for literal in literals) -
+            MAX_INT_LENGTH * self.converters.count(int)
+        )
+
+    def encode(self, *fields) -> str:
+        custom_id = self.format.format(*fields)
+        if len(custom_id) > MAX_CUSTOM_ID_LENGTH:
+            raise InvalidCustomIdError(
+                custom_id,
+                f"longer than {MAX_CUSTOM_ID_LENGTH} characters",
+            )
+
+        return custom_id
+
+    def decode(self, custom_id: str) -> T:
+        if self.single_field and custom_id.startswith(self.prefix):
+            return self.fields_type(custom_id[len(self.prefix):])
+
+        match = self.pattern.fullmatch(custom_id)
+        if match is None:
+            raise InvalidCustomIdError(
+                custom_id,
+                f"doesn't match '{self.template}'",
+            )
+
+        values = match.groups()
+        if self.int_fields:
+            values = list(values)
+            for i in self.int_fields:
+                values[i] = int(values[i])
+
+        return self.fields_type._make(values)
+
+    def route_key(self) -> RouteKey:
+        return RouteKey(self.interaction_type, prefix=self.prefix)
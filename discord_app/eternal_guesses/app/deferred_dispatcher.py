@@ -0,0 +1,45 @@
+from abc import ABC
+from typing import Callable, Dict
+
+from loguru import logger
+
+from eternal_guesses import json_codec
+
+# The key under which a deferred interaction is passed to the function, to
+# tell it apart from the API Gateway events.
+DEFERRED_INTERACTION_KEY = 'deferred_interaction'
+
+
+class DeferredDispatcher(ABC):
+    def dispatch(self, interaction: Dict):
+        raise NotImplementedError()
+
+
+class LambdaDeferredDispatcher(DeferredDispatcher):
+    """
+    Hands an interaction over to a new, asynchronous invocation of this same
+    function: the current invocation can then acknowledge the interaction
+    without waiting for it to be handled.
+
+    The Lambda client is only made by the first dispatch, as making it
+    (and importing boto3 for it) would otherwise add to every cold start,
+    also of those that don't defer anything.
+    """
+
+    def __init__(self, lambda_client_factory: Callable, function_name: str):
+        self.lambda_client_factory = lambda_client_factory
+        self.function_name = function_name
+
+        self._lambda_client = None
+
+    def dispatch(self, interaction: Dict):
+        logger.debug(f"deferring interaction {interaction.get('id')}")
+
+        if self._lambda_client is None:
+            self._lambda_client = self.lambda_client_factory()
+
+        self._lambda_client.invoke(
+            FunctionName=self.function_name,
+            InvocationType='Event',
+            Payload=json_codec.dumps({DEFERRED_INTERACTION_KEY: interaction}),
+        )
@@ -1,32 +1,92 @@
-import asyncio
-import json
 from typing import Dict
 
 from loguru import logger
 
 from eternal_guesses.app.api_authorizer import ApiAuthorizer, \
     AuthorizationResult
+from eternal_guesses.app.deferred_dispatcher import DeferredDispatcher
+from eternal_guesses.app.discord_messaging import DiscordMessaging
+from eternal_guesses.app.event_loop import EventLoop
+from eternal_guesses.app import ingress
 from eternal_guesses.app.router import Router
 from eternal_guesses.model.discord import discord_event
+from eternal_guesses.model.discord.discord_response import DiscordResponse
+from eternal_guesses.model.lambda_response import LambdaResponse
 
 
 class DiscordEventHandler:
-    def __init__(self, router: Router, api_authorizer: ApiAuthorizer):
+    def __init__(
+        self,
+        router: Router,
+        api_authorizer: ApiAuthorizer,
+        deferred_dispatcher: DeferredDispatcher = None,
+        discord_messaging: DiscordMessaging = None,
+        event_loop: EventLoop = None,
+    ):
         self.router = router
         self.api_authorizer = api_authorizer
+        self.deferred_dispatcher = deferred_dispatcher
+        self.discord_messaging = discord_messaging
+        self.event_loop = event_loop or EventLoop()
 
     def handle(self, event) -> Dict:
-        result, response = self.api_authorizer.authorize(event)
+        request = ingress.from_api_gateway(event)
+
+        result, response = self.api_authorizer.authorize(request)
         if result == AuthorizationResult.PASS:
-            body_json = json.loads(event['body'])
+            body_json = request.json()
             event = discord_event.from_event(body_json)
 
-            try:
-                response = asyncio.get_event_loop() \
-                    .run_until_complete(self.router.route(event))
-            except Exception as e:
-                logger.error(f"Failed handling event: {event}")
-                raise e
+            if self._should_defer(event):
+                self.deferred_dispatcher.dispatch(body_json)
+
+                acknowledgement = \
+                    DiscordResponse.ephemeral_deferred_channel_message()
+                response = LambdaResponse.success(acknowledgement.json())
+            else:
+                try:
+                    response = self.event_loop.run(self.router.route(event))
+                except Exception as e:
+                    logger.error(f"Failed handling event: {event}")
+                    raise e
+
+        response_json = response.json()
+        logger.debug("Response from the webhook: {}", response_json)
+        return response_json
+
+    def handle_deferred(self, interaction: Dict):
+        """
+        Handles an interaction that was already acknowledged, by sending the
+        route's response as an edit of that acknowledgement.
+        """
+        event = discord_event.from_event(interaction)
+
+        self.event_loop.run(self._respond_deferred(event))
+
+    def _should_defer(self, event) -> bool:
+        return (
+            self.deferred_dispatcher is not None and
+            self.router.is_deferred(event)
+        )
+
+    async def _respond_deferred(self, event):
+        try:
+            response = await self.router.respond(event)
+        except Exception as e:
+            logger.error(f"Failed handling deferred event: {event}")
+
+            # Don't leave the user looking at the 'thinking...' message
+            await self.discord_messaging.edit_interaction_response(
+                application_id=event.application_id,
+                token=event.token,
+                response=DiscordResponse.ephemeral_channel_message(
+                    content="Something went wrong, please try again."
+                ),
+            )
+            raise e
 
-        logger.debug(f"Response from the webhook: {response.json()}")
-        return response.json()
+        await self.discord_messaging.edit_interaction_response(
+            application_id=event.application_id,
+            token=event.token,
+            response=response,
+        )
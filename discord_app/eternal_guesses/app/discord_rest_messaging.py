@@ -0,0 +1,176 @@
+from typing import Dict, List
+
+from loguru import logger
+
+from eternal_guesses.app import app_config, metrics
+from eternal_guesses.app.discord_messaging import DiscordMessaging
+from eternal_guesses.app.discord_session import DiscordSession
+from eternal_guesses.app.rate_limiter import RateLimiter
+from eternal_guesses.exceptions import DiscordApiError, \
+    DiscordForbiddenError, DiscordNotFoundError, DiscordServerError
+from eternal_guesses.model.discord.discord_component import ActionRow
+from eternal_guesses.model.discord.discord_embed import DiscordEmbed
+from eternal_guesses.model.discord.discord_response import DiscordResponse, \
+    ResponseType
+
+# Requests that were rate limited are retried, as Discord tells when to
+MAX_ATTEMPTS = 3
+
+
+class DiscordRestMessaging(DiscordMessaging):
+    """
+    Sends and edits channel messages with a single call to Discord's REST
+    API each. Requests keep to Discord's rate limits (see RateLimiter).
+    """
+
+    def __init__(
+        self,
+        discord_session: DiscordSession,
+        api_base_url: str = None,
+        rate_limiter: RateLimiter = None,
+    ):
+        self.discord_session = discord_session
+        self.api_base_url = api_base_url or app_config.discord_api_base_url()
+        self.rate_limiter = rate_limiter or RateLimiter()
+
+    async def send_channel_message(
+        self, channel_id: int, text: str = None, embed: DiscordEmbed = None,
+        action_rows: List[ActionRow] = None
+    ) -> int:
+        logger.debug(
+            f"send_channel_message, channel_id={channel_id}, text='{text}'"
+        )
+
+        message = await self._request(
+            method="POST",
+            path=f"/channels/{channel_id}/messages",
+            payload=_message_payload(
+                text=text, embed=embed, action_rows=action_rows
+            ),
+        )
+        logger.debug(f"channel message id = {message['id']}")
+
+        return int(message['id'])
+
+    async def update_channel_message(
+        self,
+        channel_id: int,
+        message_id: int,
+        text: str = None,
+        embed: DiscordEmbed = None,
+        action_rows: List[ActionRow] = None
+    ):
+        logger.debug(
+            f"update_channel_message, channel_id={channel_id}, message_id={message_id}, text='{text}'"
+        )
+
+        # Without action rows, any existing buttons are removed
+        payload = _message_payload(
+            text=text, embed=embed, action_rows=action_rows or []
+        )
+
+        await self._request(
+            method="PATCH",
+            path=f"/channels/{channel_id}/messages/{message_id}",
+            payload=payload,
+        )
+        logger.debug(f"updated channel message {message_id} in channel"
+                     f" {channel_id}")
+
+    async def edit_interaction_response(
+        self, application_id: int, token: str, response: DiscordResponse
+    ):
+        logger.debug(f"edit_interaction_response, application_id={application_id}")
+
+        # A deferred response can only be followed up by a message
+        if response.response_type in (ResponseType.PONG, ResponseType.MODAL):
+            raise ValueError(f"can't edit a deferred response into a "
+                             f"{response.response_type.name} response")
+
+        payload = response.json()['data']
+        # The original response's flags (like being ephemeral) were set when
+        # it was deferred, and can't be changed anymore.
+        payload.pop('flags', None)
+
+        await self._request(
+            method="PATCH",
+            path=f"/webhooks/{application_id}/{token}/messages/@original",
+            payload=payload,
+        )
+
+    async def _request(self, method: str, path: str, payload: Dict) -> Dict:
+        http = await self.discord_session.http()
+
+        # A failed request leaves the session as it is: other requests share
+        # it, and aiohttp already discards a connection that broke
+        try:
+            for attempt in range(1, MAX_ATTEMPTS + 1):
+                await self.rate_limiter.acquire(method, path)
+
+                async with http.request(
+                    method,
+                    f"{self.api_base_url}{path}",
+                    json=payload,
+                ) as response:
+                    self.rate_limiter.update(method, path, response.headers)
+                    data = await response.json(content_type=None)
+
+                    if response.status == 429 and attempt < MAX_ATTEMPTS:
+                        metrics.increment('discord.rate_limited')
+                        self.rate_limiter.rate_limited(
+                            method, path, response.headers,
+                            retry_after=float(data.get('retry_after', 1)),
+                        )
+                        continue
+
+                    if response.status >= 400:
+                        raise _api_error(response.status, data)
+
+                    return data
+        finally:
+            logger.debug(f"discord session stats: {self.discord_session.stats}")
+            logger.opt(lazy=True).debug("discord rate limits: {}",
+                                        self.rate_limiter.state)
+
+
+def _api_error(status: int, data) -> DiscordApiError:
+    if status == 404:
+        error_type = DiscordNotFoundError
+    elif status == 403:
+        error_type = DiscordForbiddenError
+    elif status >= 500:
+        error_type = DiscordServerError
+    else:
+        error_type = DiscordApiError
+
+    if not isinstance(data, dict):
+        data = {}
+
+    return error_type(
+        status=status,
+        code=data.get('code', 0),
+        message=data.get('message', ""),
+    )
+
+
+def _message_payload(
+    text: str = None,
+    embed: DiscordEmbed = None,
+    action_rows: List[ActionRow] = None,
+) -> Dict:
+    payload = {
+        'allowed_mentions': {
+            'parse': [],
+        },
+    }
+
+    if text is not None:
+        payload['content'] = text
+
+    if embed is not None:
+        payload['embeds'] = [embed.json()]
+
+    if action_rows is not None:
+        payload['components'] = [row.json() for row in action_rows]
+
+    return payload
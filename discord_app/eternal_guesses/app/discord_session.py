@@ -0,0 +1,97 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Optional, TYPE_CHECKING
+
+from loguru import logger
+
+from eternal_guesses.app import app_config
+
+if TYPE_CHECKING:
+    import aiohttp
+
+
+@dataclass
+class SessionStats:
+    connections_created: int = 0
+    connections_reused: int = 0
+
+
+class DiscordSession:
+    """
+    Connections to Discord that live as long as the (warm) container.
+
+    The HTTP session for the REST API is created on first use, and kept
+    around for later invocations so they don't pay for a new TLS handshake
+    every time. Its connector keeps connections to Discord alive and pools
+    them; the stats show how often a connection could be reused.
+
+    aiohttp is only imported once a session is needed, as many interactions
+    are answered without calling Discord.
+    """
+
+    def __init__(
+        self,
+        connection_limit: int = 20,
+        keepalive_timeout: float = 60,
+    ):
+        self.connection_limit = connection_limit
+        self.keepalive_timeout = keepalive_timeout
+        self.stats = SessionStats()
+
+        self._http: Optional['aiohttp.ClientSession'] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def http(self) -> 'aiohttp.ClientSession':
+        """An HTTP session authorized as the bot, for calling the REST API."""
+        import aiohttp
+
+        self._bind_to_running_loop()
+
+        if self._http is None or self._http.closed:
+            logger.info("creating a new discord http session")
+            self._http = aiohttp.ClientSession(
+                connector=self._connector(),
+                trace_configs=[self._trace_config()],
+                headers={
+                    'Authorization': f"Bot {app_config.discord_bot_token()}",
+                },
+            )
+
+        return self._http
+
+    async def close(self):
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
+
+    def _bind_to_running_loop(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Connections are bound to the loop they were created on, so the
+            # ones from another loop can't be reused (or closed) from this one.
+            self._http = None
+            self._loop = loop
+
+    def _connector(self) -> 'aiohttp.TCPConnector':
+        import aiohttp
+
+        return aiohttp.TCPConnector(
+            limit=self.connection_limit,
+            keepalive_timeout=self.keepalive_timeout,
+        )
+
+    def _trace_config(self) -> 'aiohttp.TraceConfig':
+        import aiohttp
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(
+            self._on_connection_created
+        )
+        trace_config.on_connection_reuseconn.append(self._on_connection_reused)
+        return trace_config
+
+    async def _on_connection_created(self, session, context, params):
+        self.stats.connections_created += 1
+
+    async def _on_connection_reused(self, session, context, params):
+        self.stats.connections_reused += 1
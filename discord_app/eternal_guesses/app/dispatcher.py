@@ -0,0 +1,149 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Generic, Iterator, Optional, Tuple, TypeVar
+
+from eternal_guesses.exceptions import AmbiguousRouteError
+from eternal_guesses.model.discord.discord_event import DiscordEvent, \
+    InteractionType
+
+T = TypeVar('T')
+
+
+@dataclass(frozen=True)
+class RouteKey:
+    """
+    The events a route handles: a command by its name, or a component or
+    modal by its exact custom_id or a custom_id prefix.
+    """
+    interaction_type: InteractionType
+    name: Optional[str] = None
+    prefix: Optional[str] = None
+
+    @staticmethod
+    def command(name: str) -> 'RouteKey':
+        return RouteKey(InteractionType.APPLICATION_COMMAND, name=name)
+
+    @staticmethod
+    def component(custom_id: str = None, prefix: str = None) -> 'RouteKey':
+        return RouteKey(InteractionType.MESSAGE_COMPONENT,
+                        name=custom_id, prefix=prefix)
+
+    @staticmethod
+    def modal(custom_id: str = None, prefix: str = None) -> 'RouteKey':
+        return RouteKey(InteractionType.MODAL_SUBMIT,
+                        name=custom_id, prefix=prefix)
+
+
+class PrefixTrie(Generic[T]):
+    def __init__(self):
+        self.value: Optional[T] = None
+        self.children: Dict[str, 'PrefixTrie[T]'] = {}
+
+    def insert(self, prefix: str, value: T):
+        node = self
+        for character in prefix:
+            node = node.children.setdefault(character, PrefixTrie())
+
+        node.value = value
+
+    def find(self, key: str) -> Optional[T]:
+        """The value of the shortest inserted prefix of key."""
+        node = self
+        for character in key:
+            if node.value is not None:
+                return node.value
+
+            node = node.children.get(character)
+            if node is None:
+                return None
+
+        return node.value
+
+    def values_under(self, prefix: str) -> Iterator[T]:
+        """The values of the inserted keys that start with prefix."""
+        node = self
+        for character in prefix:
+            node = node.children.get(character)
+            if node is None:
+                return
+
+        nodes = [node]
+        while nodes:
+            node = nodes.pop()
+            if node.value is not None:
+                yield node.value
+            nodes.extend(node.children.values())
+
+
+class Dispatcher(Generic[T]):
+    """
+    Finds what handles an event by its interaction type and its command name
+    or custom_id, with a single lookup: a dict for the exact names, and a
+    trie for the custom_id prefixes.
+
+    Keys that could both match the same event are rejected when they're
+    added, so the order in which they're added never decides what handles
+    an event.
+    """
+
+    def __init__(self):
+        self.names: Dict[Tuple[InteractionType, str], T] = {}
+        self.prefixes: Dict[InteractionType, PrefixTrie[T]] = \
+            defaultdict(PrefixTrie)
+
+    def add(self, key: RouteKey, target: T):
+        prefixes = self.prefixes[key.interaction_type]
+
+        if key.name is not None:
+            other = self.names.get((key.interaction_type, key.name))
+            if other is None:
+                other = prefixes.find(key.name)
+            if other is not None:
+                raise AmbiguousRouteError(key, target, other)
+
+            self.names[(key.interaction_type, key.name)] = target
+
+        if key.prefix is not None:
+            other = prefixes.find(key.prefix) or next(
+                prefixes.values_under(key.prefix), None
+            )
+            if other is None:
+                other = next((
+                    t for (interaction_type, name), t in self.names.items()
+                    if interaction_type == key.interaction_type and
+                    name.startswith(key.prefix)
+                ), None)
+            if other is not None:
+                raise AmbiguousRouteError(key, target, other)
+
+            prefixes.insert(key.prefix, target)
+
+    def find(self, event: DiscordEvent) -> Optional[T]:
+        interaction_type, name = event_name(event)
+        if name is None:
+            return None
+
+        target = self.names.get((interaction_type, name))
+        if target is not None:
+            return target
+
+        prefixes = self.prefixes.get(interaction_type)
+        if prefixes is None:
+            return None
+
+        return prefixes.find(name)
+
+
+def event_name(event: DiscordEvent) -> Tuple[InteractionType, Optional[str]]:
+    """The interaction type and name (command name or custom_id) of an event."""
+    if event.command is not None:
+        return InteractionType.APPLICATION_COMMAND, event.command.command_name
+
+    if event.component_action is not None:
+        return InteractionType.MESSAGE_COMPONENT, \
+            event.component_action.component_custom_id
+
+    if event.modal_submit is not None:
+        return InteractionType.MODAL_SUBMIT, event.modal_submit.modal_custom_id
+
+    return event.event_type, None
@@ -0,0 +1,65 @@
+import asyncio
+from typing import Awaitable, List, Optional, TypeVar
+
+from loguru import logger
+
+T = TypeVar('T')
+
+
+class EventLoop:
+    """
+    The event loop of the container, reused by every invocation.
+
+    Async resources (like the HTTP session to Discord) are bound to the loop
+    they were created on: with one loop for the container's life, they can
+    be kept between invocations. They're registered here to be closed, with
+    the loop, when the container shuts down.
+
+    With use_uvloop, the loop comes from uvloop when it's installed.
+    """
+
+    def __init__(self, use_uvloop: bool = False):
+        self.use_uvloop = use_uvloop
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._resources: List = []
+
+    def run(self, awaitable: Awaitable[T]) -> T:
+        return self._get_loop().run_until_complete(awaitable)
+
+    def register(self, resource: T) -> T:
+        """Adds a resource with an async close(), to close on shutdown."""
+        self._resources.append(resource)
+        return resource
+
+    def close(self):
+        if self._loop is None or self._loop.is_closed():
+            return
+
+        for resource in reversed(self._resources):
+            try:
+                self._loop.run_until_complete(resource.close())
+            except Exception as e:
+                logger.warning(f"failed closing {resource}: {e}")
+
+        self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+        self._loop.close()
+        asyncio.set_event_loop(None)
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None or self._loop.is_closed():
+            self._loop = self._new_loop()
+            asyncio.set_event_loop(self._loop)
+
+        return self._loop
+
+    def _new_loop(self) -> asyncio.AbstractEventLoop:
+        if self.use_uvloop:
+            try:
+                import uvloop
+            except ImportError:
+                logger.warning("uvloop isn't installed, using asyncio's loop")
+            else:
+                return uvloop.new_event_loop()
+
+        return asyncio.new_event_loop()
@@ -1,12 +1,26 @@
+import asyncio
+import hashlib
+import json
+import time
 from abc import ABC
+from typing import List, Tuple
 
-import discord
 from loguru import logger
 
+from eternal_guesses.app import app_config, metrics
+from eternal_guesses.exceptions import DiscordNotFoundError
+from eternal_guesses.model.data.channel_message import ChannelMessage
 from eternal_guesses.model.data.game import Game
+from eternal_guesses.model.discord.discord_component import ActionRow
+from eternal_guesses.model.discord.discord_embed import DiscordEmbed
 from eternal_guesses.repositories.games_repository import GamesRepository
+from eternal_guesses.repositories.post_update_schedule_repository import \
+    PostUpdateScheduleRepository
 from eternal_guesses.app.discord_messaging import DiscordMessaging
+from eternal_guesses.app.game_updates import save_with_retry
 from eternal_guesses.app.message_provider import MessageProvider
+from eternal_guesses.app.post_update_queue import PostUpdateQueue, \
+    PostUpdateJob
 
 
 class GamePostManager(ABC):
@@ -16,47 +30,233 @@ class GamePostManager(ABC):
     async def update(self, game: Game):
         raise NotImplementedError()
 
+    async def update_stored(self, game: Game):
+        """
+        Updates the game's posts to the game as it's stored, for a copy of
+        it that wasn't read with all of its guesses.
+        """
+        raise NotImplementedError()
+
 
 class GamePostManagerImpl(GamePostManager):
     def __init__(
         self,
         games_repository: GamesRepository,
         message_provider: MessageProvider,
-        discord_messaging: DiscordMessaging
+        discord_messaging: DiscordMessaging,
+        max_concurrency: int = None,
     ):
         self.discord_messaging = discord_messaging
         self.games_repository = games_repository
         self.message_provider = message_provider
 
+        if max_concurrency is None:
+            max_concurrency = app_config.post_update_concurrency()
+        self.max_concurrency = max_concurrency
+
     async def post(self, game: Game, channel_id: int):
         embed = self.message_provider.game_post_embed(game)
-        view = self.message_provider.game_post_view(game)
+        action_rows = self.message_provider.game_post_action_rows(game)
         return await self.discord_messaging.send_channel_message(
             channel_id=channel_id,
             embed=embed,
-            view=view,
+            action_rows=action_rows,
         )
 
+    async def update_stored(self, game: Game):
+        if not game.channel_messages:
+            return
+
+        stored_game = self.games_repository.get(
+            game.guild_id, game.game_id, consistent_read=True
+        )
+        if stored_game is not None:
+            await self.update(stored_game)
+
     async def update(self, game: Game):
+        if not game.channel_messages:
+            return
+
+        start = time.perf_counter()
+
+        new_embed = self.message_provider.game_post_embed(game)
+        action_rows = self.message_provider.game_post_action_rows(game)
+        content_hash = _content_hash(new_embed, action_rows)
+
+        # Posts that already show this content don't need to be edited
+        outdated_messages = [
+            m for m in game.channel_messages if m.content_hash != content_hash
+        ]
+        skipped = len(game.channel_messages) - len(outdated_messages)
+        metrics.increment('game_post_update.skipped', skipped)
+
         logger.info(
-            f"updating {len(game.channel_messages)} channel messages for {game.game_id}"
+            f"updating {len(outdated_messages)} channel messages for "
+            f"{game.game_id}, {skipped} are up to date"
         )
-        if game.channel_messages is not None:
-            new_embed = self.message_provider.game_post_embed(game)
-            view = self.message_provider.game_post_view(game)
-            for channel_message in game.channel_messages:
+        if not outdated_messages:
+            return
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def update_message(channel_message: ChannelMessage):
+            async with semaphore:
                 logger.debug(
                     f"sending update to channel message, channel_id={channel_message.channel_id}, "
-                    f"message_id={channel_message.message_id}, message='{new_embed}'"
+                    f"message_id={channel_message.message_id}, message='{new_embed.description}'"
+                )
+
+                await self.discord_messaging.update_channel_message(
+                    channel_id=channel_message.channel_id,
+                    message_id=channel_message.message_id,
+                    embed=new_embed,
+                    action_rows=action_rows,
+                )
+
+        results = await asyncio.gather(
+            *(update_message(m) for m in outdated_messages),
+            return_exceptions=True,
+        )
+        self._save_results(game, outdated_messages, results, content_hash)
+
+        duration = time.perf_counter() - start
+        metrics.record_timing('game_post_update.fan_out', duration)
+
+        for result in results:
+            if isinstance(result, Exception) and \
+                    not isinstance(result, DiscordNotFoundError):
+                raise result
+
+    def _save_results(
+        self,
+        game: Game,
+        messages: List[ChannelMessage],
+        results: List,
+        content_hash: str,
+    ):
+        dead_messages = set()
+        sent_messages = set()
+        for message, result in zip(messages, results):
+            if isinstance(result, DiscordNotFoundError):
+                dead_messages.add(_message_key(message))
+            elif not isinstance(result, Exception):
+                sent_messages.add(_message_key(message))
+        metrics.increment('game_post_update.sent', len(sent_messages))
+
+        if not dead_messages and not sent_messages:
+            return
+
+        if dead_messages:
+            logger.info(f"removing {len(dead_messages)} deleted channel "
+                        f"messages from {game.game_id}")
+
+        # By key rather than by object, as the game might be read again if
+        # it changed in the meantime
+        def apply_results(game_to_save: Game):
+            game_to_save.channel_messages = [
+                m for m in game_to_save.channel_messages
+                if _message_key(m) not in dead_messages
+            ]
+
+            for message in game_to_save.channel_messages:
+                if _message_key(message) in sent_messages:
+                    message.content_hash = content_hash
+
+        # Saves the pruned messages and new hashes in one go
+        save_with_retry(
+            self.games_repository,
+            game,
+            apply_results,
+            save=self.games_repository.save_channel_messages,
+        )
+
+
+def _message_key(message: ChannelMessage) -> Tuple[int, int]:
+    return message.channel_id, message.message_id
+
+
+def _content_hash(embed: DiscordEmbed, action_rows: List[ActionRow]) -> str:
+    content = {
+        'embed': embed.json(),
+        'components': [row.json() for row in action_rows],
+    }
+
+    # Not json_codec: the hashes of existing posts were made with json's
+    # formatting, and would otherwise all mismatch (and be re-sent) once
+    return hashlib.sha256(
+        json.dumps(content, sort_keys=True).encode()
+    ).hexdigest()
+
+
+class QueueingGamePostManager(GamePostManager):
+    """
+    Leaves updating a game's posts to the post update worker, by queueing a
+    job for it. New posts are still sent right away, as their message id is
+    needed to keep track of them.
+
+    Updates are coalesced: the job is delayed by coalesce_seconds, and any
+    update requested for the game in the meantime is covered by that same
+    job, as the worker renders the game's state at the time it runs.
+    """
+
+    # How long after its delay a scheduled job is assumed to have been lost
+    STALE_AFTER_SECONDS = 60
+
+    def __init__(
+        self,
+        game_post_manager: GamePostManager,
+        post_update_queue: PostUpdateQueue,
+        post_update_schedule: PostUpdateScheduleRepository = None,
+        coalesce_seconds: float = None,
+    ):
+        self.game_post_manager = game_post_manager
+        self.post_update_queue = post_update_queue
+        self.post_update_schedule = post_update_schedule
+
+        if coalesce_seconds is None:
+            coalesce_seconds = app_config.post_update_coalesce_seconds()
+        self.coalesce_seconds = coalesce_seconds
+
+    async def post(self, game: Game, channel_id: int):
+        return await self.game_post_manager.post(game, channel_id)
+
+    async def update_stored(self, game: Game):
+        # The worker reads the game as it's stored anyway
+        await self.update(game)
+
+    async def update(self, game: Game):
+        if not game.channel_messages:
+            return
+
+        metrics.increment('post_update.requested')
+        job = PostUpdateJob(guild_id=game.guild_id, game_id=game.game_id)
+
+        if self.post_update_schedule is None or self.coalesce_seconds <= 0:
+            self._schedule(job, delay_seconds=0)
+        elif self.post_update_schedule.claim(
+            guild_id=game.guild_id,
+            game_id=game.game_id,
+            seconds=self.coalesce_seconds + self.STALE_AFTER_SECONDS,
+        ):
+            try:
+                self._schedule(job, delay_seconds=self.coalesce_seconds)
+            except Exception:
+                # Without a job, the claim would hold off the next updates
+                # until it's stale
+                self.post_update_schedule.release(
+                    guild_id=game.guild_id, game_id=game.game_id
                 )
+                raise
+        else:
+            logger.debug(f"posts update of {game.game_id} already scheduled")
+
+        scheduled = metrics.counter('post_update.scheduled')
+        if scheduled > 0:
+            metrics.set_gauge(
+                'post_update.coalescing_ratio',
+                metrics.counter('post_update.requested') / scheduled,
+            )
 
-                try:
-                    await self.discord_messaging.update_channel_message(
-                        channel_id=channel_message.channel_id,
-                        message_id=channel_message.message_id,
-                        embed=new_embed,
-                        view=view,
-                    )
-                except discord.NotFound:
-                    game.channel_messages.remove(channel_message)
-                    self.games_repository.save(game)
+    def _schedule(self, job: PostUpdateJob, delay_seconds: float):
+        self.post_update_queue.enqueue(job, delay_seconds=delay_seconds)
+        metrics.increment('post_update.scheduled')
@@ -0,0 +1,71 @@
+from typing import Callable, Optional
+
+from loguru import logger
+
+from eternal_guesses.app import metrics
+from eternal_guesses.exceptions import GameVersionConflictError
+from eternal_guesses.model.data.game import Game
+from eternal_guesses.repositories.games_repository import GamesRepository
+
+MAX_ATTEMPTS = 5
+
+
+def save_with_retry(
+    games_repository: GamesRepository,
+    game: Game,
+    mutation: Callable[[Game], None],
+    save: Callable[[Game], None] = None,
+    max_attempts: int = MAX_ATTEMPTS,
+) -> Optional[Game]:
+    """
+    Applies mutation to the game and saves it, with save (the repository's
+    save by default). If the game changed since it was read, it's read
+    again and the mutation is applied to that, up to max_attempts times in
+    all, so the mutation must work on any copy of the game. That copy is
+    read without its guesses, which neither the mutation nor the save may
+    rely on.
+
+    Returns the saved game, or None if it no longer exists. Raises
+    GameVersionConflictError if every attempt conflicted.
+    """
+    if save is None:
+        save = games_repository.save
+
+    for attempt in range(1, max_attempts + 1):
+        mutation(game)
+
+        try:
+            save(game)
+            _record_attempt(conflicted=False)
+            return game
+        except GameVersionConflictError:
+            _record_attempt(conflicted=True)
+
+            if attempt == max_attempts:
+                logger.warning(f"giving up saving game {game.game_id} after "
+                               f"{attempt} conflicting attempts")
+                raise
+
+        metrics.increment('game_save.retries')
+        logger.info(f"game {game.game_id} changed since version "
+                    f"{game.version}, retrying on a fresh copy")
+
+        # Consistent, or it could well be the version that just conflicted
+        game = games_repository.get_without_guesses(
+            game.guild_id, game.game_id
+        )
+        if game is None:
+            logger.warning("not saving the game, as it no longer exists")
+            return None
+
+
+def _record_attempt(conflicted: bool):
+    metrics.increment('game_save.attempts')
+    if conflicted:
+        metrics.increment('game_save.conflicts')
+
+    metrics.set_gauge(
+        'game_save.conflict_rate',
+        metrics.counter('game_save.conflicts') /
+        metrics.counter('game_save.attempts'),
+    )
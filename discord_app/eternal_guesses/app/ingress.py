@@ -0,0 +1,48 @@
+import base64
+from typing import Dict, Optional
+
+from eternal_guesses import json_codec
+
+
+class InteractionRequest:
+    """
+    An interaction as API Gateway delivers it, decoded once: the raw body
+    (the bytes Discord signed) and the headers, by their lower case names.
+    The body is only parsed as JSON when it's first needed, which is after
+    its signature was verified.
+
+    Handles both the REST API (v1) and the HTTP API (v2) payload formats,
+    with or without a base64 encoded body.
+    """
+
+    def __init__(self, body: bytes, headers: Dict[str, str]):
+        self.body = body
+        self.headers = headers
+
+        self._json: Optional[Dict] = None
+
+    def header(self, name: str) -> Optional[str]:
+        return self.headers.get(name)
+
+    def json(self) -> Dict:
+        if self._json is None:
+            self._json = json_codec.loads(self.body)
+
+        return self._json
+
+
+def from_api_gateway(event: Dict) -> InteractionRequest:
+    body = event.get('body') or ""
+    if event.get('isBase64Encoded'):
+        body = base64.b64decode(body)
+    else:
+        body = body.encode()
+
+    # The HTTP API sends lower case header names, the REST API sends them
+    # as the client did
+    headers = {
+        name.lower(): value
+        for name, value in (event.get('headers') or {}).items()
+    }
+
+    return InteractionRequest(body=body, headers=headers)
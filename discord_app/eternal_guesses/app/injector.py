@@ -1,14 +1,28 @@
-import boto3
+import atexit
+import functools
+from typing import Optional
 
 from eternal_guesses.app import app_config
 from eternal_guesses.app.api_authorizer import ApiAuthorizerImpl, \
     ApiAuthorizer
+from eternal_guesses.app.deferred_dispatcher import DeferredDispatcher, \
+    LambdaDeferredDispatcher
 from eternal_guesses.app.discord_event_handler import DiscordEventHandler
-from eternal_guesses.app.discord_messaging import DiscordMessagingImpl
-from eternal_guesses.app.game_post_manager import GamePostManagerImpl
+from eternal_guesses.app.discord_messaging import DiscordMessaging
+from eternal_guesses.app.discord_rest_messaging import DiscordRestMessaging
+from eternal_guesses.app.discord_session import DiscordSession
+from eternal_guesses.app.event_loop import EventLoop
+from eternal_guesses.app.game_post_manager import GamePostManagerImpl, \
+    GamePostManager, QueueingGamePostManager
 from eternal_guesses.app.message_provider import MessageProviderImpl
-from eternal_guesses.app.router import Router, RouterImpl
+from eternal_guesses.app.post_update_queue import PostUpdateQueue, \
+    SqsPostUpdateQueue, SqlitePostUpdateQueue
+from eternal_guesses.app.post_update_worker import PostUpdateWorker
+from eternal_guesses.app.router import Router, RouterImpl, \
+    RouteRegistry
 from eternal_guesses.repositories.games_repository import GamesRepositoryImpl
+from eternal_guesses.repositories.post_update_schedule_repository import \
+    PostUpdateScheduleRepositoryImpl
 from eternal_guesses.routes.actions.action_edit_game_routes import \
     ActionEditGameTitleRoute, ActionEditGameMinGuessRoute, \
     ActionEditGameMaxGuessRoute, ActionEditGameDescriptionRoute
@@ -49,122 +63,264 @@ from eternal_guesses.services.guesses_service import GuessesService
 
 
 def discord_event_handler():
+    discord_messaging = DiscordRestMessaging(
+        discord_session=event_loop().register(DiscordSession()),
+    )
+
     return DiscordEventHandler(
         api_authorizer=_api_authorizer(),
-        router=_router(),
+        router=_router(discord_messaging),
+        deferred_dispatcher=_deferred_dispatcher(),
+        discord_messaging=discord_messaging,
+        event_loop=event_loop(),
+    )
+
+
+def post_update_worker():
+    eternal_guesses_table = _eternal_guesses_table()
+    games_repository = GamesRepositoryImpl(eternal_guesses_table)
+
+    return PostUpdateWorker(
+        games_repository=games_repository,
+        post_update_schedule=PostUpdateScheduleRepositoryImpl(
+            eternal_guesses_table
+        ),
+        game_post_manager=GamePostManagerImpl(
+            games_repository=games_repository,
+            message_provider=MessageProviderImpl(),
+            discord_messaging=DiscordRestMessaging(
+                discord_session=event_loop().register(DiscordSession()),
+            ),
+        ),
     )
 
 
+def games_repository() -> GamesRepositoryImpl:
+    return GamesRepositoryImpl(_eternal_guesses_table())
+
+
+@functools.cache
+def event_loop() -> EventLoop:
+    """The event loop of the container, shared by everything it runs."""
+    loop = EventLoop(use_uvloop=app_config.use_uvloop())
+
+    # Closes the registered resources when the interpreter exits normally,
+    # like a local run does; a Lambda container is just frozen and dropped
+    atexit.register(loop.close)
+
+    return loop
+
+
 def _api_authorizer() -> ApiAuthorizer:
-    return ApiAuthorizerImpl()
+    return ApiAuthorizerImpl(
+        public_key=app_config.discord_public_key(),
+        max_timestamp_age=app_config.signature_max_age_seconds(),
+    )
+
+
+def _deferred_dispatcher() -> Optional[DeferredDispatcher]:
+    if not app_config.deferred_responses():
+        return None
 
+    def lambda_client():
+        import boto3
+
+        return boto3.client(
+            service_name='lambda',
+            endpoint_url=app_config.aws_endpoint_url(),
+        )
+
+    return LambdaDeferredDispatcher(
+        lambda_client_factory=lambda_client,
+        function_name=app_config.lambda_function_name(),
+    )
+
+
+def _post_update_queue() -> Optional[PostUpdateQueue]:
+    queue_url = app_config.post_update_queue_url()
+    if queue_url is not None:
+        import boto3
+
+        return SqsPostUpdateQueue(
+            sqs_client=boto3.client(
+                service_name='sqs',
+                endpoint_url=app_config.aws_endpoint_url(),
+            ),
+            queue_url=queue_url,
+        )
+
+    queue_path = app_config.post_update_queue_path()
+    if queue_path is not None:
+        return SqlitePostUpdateQueue(queue_path)
+
+    return None
+
+
+def _eternal_guesses_table():
+    # boto3 takes a large part of a cold start, so it's only imported once
+    # it's needed
+    import boto3
 
-def _router() -> Router:
     dynamodb = boto3.resource(
         service_name='dynamodb',
         endpoint_url=app_config.aws_endpoint_url(),
     )
 
-    eternal_guesses_table = dynamodb.Table(app_config.dynamodb_table_name())
+    return dynamodb.Table(app_config.dynamodb_table_name())
 
-    games_repository = GamesRepositoryImpl(eternal_guesses_table)
 
-    discord_messaging = DiscordMessagingImpl()
-    message_provider = MessageProviderImpl()
+def _router(discord_messaging: DiscordMessaging) -> Router:
+    # The dependencies are built once, by the first route that needs them
+    @functools.cache
+    def eternal_guesses_table():
+        return _eternal_guesses_table()
 
-    game_post_manager = GamePostManagerImpl(
-        games_repository=games_repository,
-        message_provider=message_provider,
-        discord_messaging=discord_messaging,
-    )
+    @functools.cache
+    def games_repository():
+        return GamesRepositoryImpl(eternal_guesses_table())
 
-    games_service = GamesService(
-        games_repository=games_repository,
-        game_post_manager=game_post_manager,
-    )
+    @functools.cache
+    def message_provider():
+        return MessageProviderImpl()
 
-    guesses_service = GuessesService(
-        games_repository=games_repository,
-        game_post_manager=game_post_manager,
-    )
+    @functools.cache
+    def game_post_manager() -> GamePostManager:
+        manager = GamePostManagerImpl(
+            games_repository=games_repository(),
+            message_provider=message_provider(),
+            discord_messaging=discord_messaging,
+        )
 
-    return RouterImpl(
-        routes=[
-            PingRoute(),
-            ActionGameGuessRoute(
-                message_provider=message_provider,
-                games_repository=games_repository,
-            ),
-            ActionManageGamePostRoute(),
-            ActionManageGameCloseRoute(
-                games_service=games_service,
-                games_repository=games_repository,
-            ),
-            ActionManageGameReopenRoute(
-                games_service=games_service,
-                games_repository=games_repository,
-            ),
-            ActionSelectDeleteGuessRoute(
-                guesses_service=guesses_service,
-                message_provider=message_provider,
-            ),
-            ActionSelectEditGuessRoute(
-                message_provider=message_provider,
-            ),
-            ActionSelectGameToManageRoute(
-                games_repository=games_repository,
-            ),
-            ActionSelectPostGameRoute(
-                message_provider=message_provider,
-                games_service=games_service,
-            ),
-            ActionManageGameEditRoute(
-                games_repository=games_repository,
-            ),
-            ActionEditGameTitleRoute(),
-            ActionEditGameMinGuessRoute(),
-            ActionEditGameMaxGuessRoute(),
-            ActionEditGameDescriptionRoute(),
-            SubmitEditGameTitleRoute(
-                games_service=games_service,
-            ),
-            SubmitEditGameMinGuessRoute(
-                games_service=games_service,
-            ),
-            SubmitEditGameMaxGuessRoute(
-                games_service=games_service,
-            ),
-            SubmitEditGameDescriptionRoute(
-                games_service=games_service,
-            ),
-            SubmitGuessRoute(
-                games_repository=games_repository,
-                game_post_manager=game_post_manager,
-                message_provider=message_provider,
-            ),
-            SubmitCreateRoute(
-                games_repository=games_repository,
-                message_provider=message_provider,
-            ),
-            SubmitEditGuessRoute(
-                guesses_service=guesses_service,
-            ),
-            ActionManageGameEditGuessRoute(
-                message_provider=message_provider,
-                games_repository=games_repository,
-            ),
-            ActionManageGameDeleteGuessRoute(
-                message_provider=message_provider,
-                games_repository=games_repository,
-            ),
-            ListGamesRoute(
-                games_service=games_service,
-                message_provider=message_provider,
-            ),
-            CreateRoute(
-                games_repository=games_repository,
-                discord_messaging=discord_messaging,
-                message_provider=message_provider,
+        post_update_queue = _post_update_queue()
+        if post_update_queue is None:
+            return manager
+
+        return QueueingGamePostManager(
+            game_post_manager=manager,
+            post_update_queue=post_update_queue,
+            post_update_schedule=PostUpdateScheduleRepositoryImpl(
+                eternal_guesses_table()
             ),
-        ]
+        )
+
+    @functools.cache
+    def games_service():
+        return GamesService(
+            games_repository=games_repository(),
+            game_post_manager=game_post_manager(),
+        )
+
+    @functools.cache
+    def guesses_service():
+        return GuessesService(
+            games_repository=games_repository(),
+            game_post_manager=game_post_manager(),
+        )
+
+    registry = RouteRegistry()
+
+    registry.register(PingRoute)
+    registry.register(ActionGameGuessRoute, lambda: ActionGameGuessRoute(
+        message_provider=message_provider(),
+        games_repository=games_repository(),
+    ))
+    registry.register(ActionManageGamePostRoute)
+    registry.register(
+        ActionManageGameCloseRoute, lambda: ActionManageGameCloseRoute(
+            games_service=games_service(),
+            games_repository=games_repository(),
+        )
+    )
+    registry.register(
+        ActionManageGameReopenRoute, lambda: ActionManageGameReopenRoute(
+            games_service=games_service(),
+            games_repository=games_repository(),
+        )
+    )
+    registry.register(
+        ActionSelectDeleteGuessRoute, lambda: ActionSelectDeleteGuessRoute(
+            guesses_service=guesses_service(),
+            message_provider=message_provider(),
+        )
+    )
+    registry.register(
+        ActionSelectEditGuessRoute, lambda: ActionSelectEditGuessRoute(
+            message_provider=message_provider(),
+        )
+    )
+    registry.register(
+        ActionSelectGameToManageRoute, lambda: ActionSelectGameToManageRoute(
+            games_repository=games_repository(),
+        )
+    )
+    registry.register(
+        ActionSelectPostGameRoute, lambda: ActionSelectPostGameRoute(
+            message_provider=message_provider(),
+            games_service=games_service(),
+        )
     )
+    registry.register(
+        ActionManageGameEditRoute, lambda: ActionManageGameEditRoute(
+            games_repository=games_repository(),
+        )
+    )
+    registry.register(ActionEditGameTitleRoute)
+    registry.register(ActionEditGameMinGuessRoute)
+    registry.register(ActionEditGameMaxGuessRoute)
+    registry.register(ActionEditGameDescriptionRoute)
+    registry.register(
+        SubmitEditGameTitleRoute, lambda: SubmitEditGameTitleRoute(
+            games_service=games_service(),
+        )
+    )
+    registry.register(
+        SubmitEditGameMinGuessRoute, lambda: SubmitEditGameMinGuessRoute(
+            games_service=games_service(),
+        )
+    )
+    registry.register(
+        SubmitEditGameMaxGuessRoute, lambda: SubmitEditGameMaxGuessRoute(
+            games_service=games_service(),
+        )
+    )
+    registry.register(
+        SubmitEditGameDescriptionRoute, lambda: SubmitEditGameDescriptionRoute(
+            games_service=games_service(),
+        )
+    )
+    registry.register(SubmitGuessRoute, lambda: SubmitGuessRoute(
+        games_repository=games_repository(),
+        game_post_manager=game_post_manager(),
+        message_provider=message_provider(),
+    ))
+    registry.register(SubmitCreateRoute, lambda: SubmitCreateRoute(
+        games_repository=games_repository(),
+        message_provider=message_provider(),
+    ))
+    registry.register(SubmitEditGuessRoute, lambda: SubmitEditGuessRoute(
+        guesses_service=guesses_service(),
+    ))
+    registry.register(
+        ActionManageGameEditGuessRoute, lambda: ActionManageGameEditGuessRoute(
+            message_provider=message_provider(),
+            games_repository=games_repository(),
+        )
+    )
+    registry.register(
+        ActionManageGameDeleteGuessRoute,
+        lambda: ActionManageGameDeleteGuessRoute(
+            message_provider=message_provider(),
+            games_repository=games_repository(),
+        )
+    )
+    registry.register(ListGamesRoute, lambda: ListGamesRoute(
+        games_service=games_service(),
+        message_provider=message_provider(),
+    ))
+    registry.register(CreateRoute, lambda: CreateRoute(
+        games_repository=games_repository(),
+        discord_messaging=discord_messaging,
+        message_provider=message_provider(),
+    ))
+
+    return RouterImpl(route_registry=registry)
@@ -1,20 +1,20 @@
 from abc import ABC
-from typing import List, Optional
-
-import discord
-from discord import ButtonStyle
+from typing import List
 
 from eternal_guesses.model.data.game import Game
 from eternal_guesses.model.data.guild_config import GuildConfig
 from eternal_guesses.model.discord.discord_command import DiscordCommand
+from eternal_guesses.model.discord.discord_component import ActionRow, \
+    DiscordComponent
+from eternal_guesses.model.discord.discord_embed import DiscordEmbed
 from eternal_guesses.app.component_ids import ComponentIds
 
 
 class MessageProvider(ABC):
-    def game_post_view(self, game: Game) -> Optional[discord.ui.View]:
+    def game_post_action_rows(self, game: Game) -> List[ActionRow]:
         raise NotImplementedError()
 
-    def game_post_embed(self, game: Game) -> discord.Embed:
+    def game_post_embed(self, game: Game) -> DiscordEmbed:
         raise NotImplementedError()
 
     def error_game_not_found(self, game_id: str) -> str:
@@ -106,22 +106,18 @@ class MessageProvider(ABC):
 
 
 class MessageProviderImpl(MessageProvider):
-    def game_post_view(self, game: Game) -> Optional[discord.ui.View]:
+    def game_post_action_rows(self, game: Game) -> List[ActionRow]:
         if game.closed:
-            return None
-
-        view = discord.ui.View()
+            return []
 
-        make_guess_button = discord.ui.Button(
-            style=ButtonStyle.secondary,
-            label="Guess!",
+        make_guess_button = DiscordComponent.button(
             custom_id=ComponentIds.component_button_guess_id(game.game_id),
+            label="Guess!",
         )
-        view.add_item(make_guess_button)
 
-        return view
+        return [ActionRow(components=[make_guess_button])]
 
-    def game_post_embed(self, game: Game) -> discord.Embed:
+    def game_post_embed(self, game: Game) -> DiscordEmbed:
         if game.title:
             title = game.title
         else:
@@ -152,7 +148,7 @@ class MessageProviderImpl(MessageProvider):
             minmax = "\n".join(minmax)
             description = f"{description}\n\n{minmax}"
 
-        embed = discord.Embed(
+        embed = DiscordEmbed(
             title=title,
             description=description,
             color=0x723EEA
@@ -0,0 +1,66 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict
+
+from loguru import logger
+
+# Metrics are kept per container: they are reset on a cold start, and
+# accumulate over all invocations handled by a warm one.
+
+
+@dataclass
+class Timing:
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    last: float = 0.0
+
+    @property
+    def average(self) -> float:
+        if self.count == 0:
+            return 0.0
+
+        return self.total / self.count
+
+
+_counters: Dict[str, int] = defaultdict(int)
+_timings: Dict[str, Timing] = defaultdict(Timing)
+_gauges: Dict[str, float] = {}
+
+
+def increment(name: str, value: int = 1):
+    _counters[name] += value
+
+
+def record_timing(name: str, seconds: float):
+    timing = _timings[name]
+    timing.count += 1
+    timing.total += seconds
+    timing.max = max(timing.max, seconds)
+    timing.last = seconds
+
+    logger.info(f"metric {name}: {seconds * 1000:.1f}ms")
+
+
+def set_gauge(name: str, value: float):
+    _gauges[name] = value
+
+    logger.info(f"metric {name}: {value:.2f}")
+
+
+def counter(name: str) -> int:
+    return _counters.get(name, 0)
+
+
+def timing(name: str) -> Timing:
+    return _timings.get(name, Timing())
+
+
+def gauge(name: str) -> float:
+    return _gauges.get(name, 0.0)
+
+
+def reset():
+    _counters.clear()
+    _timings.clear()
+    _gauges.clear()
@@ -0,0 +1,124 @@
+import contextlib
+import math
+import sqlite3
+import time
+from abc import ABC
+from dataclasses import dataclass
+from typing import Iterator, List, Tuple
+
+from loguru import logger
+
+from eternal_guesses import json_codec
+
+
+@dataclass(frozen=True)
+class PostUpdateJob:
+    """Re-render the posts of a game. The game is re-read when handled."""
+    guild_id: int
+    game_id: str
+
+    def to_json(self) -> str:
+        return json_codec.dumps({'guild_id': self.guild_id, 'game_id': self.game_id})
+
+    @staticmethod
+    def from_json(body: str) -> 'PostUpdateJob':
+        data = json_codec.loads(body)
+        return PostUpdateJob(guild_id=int(data['guild_id']),
+                             game_id=data['game_id'])
+
+
+class PostUpdateQueue(ABC):
+    def enqueue(self, job: PostUpdateJob, delay_seconds: float = 0):
+        """Adds a job, which isn't received until delay_seconds have passed."""
+        raise NotImplementedError()
+
+    def receive(self, max_jobs: int = 10) -> List[PostUpdateJob]:
+        """
+        Takes the next jobs off the queue. Queues that deliver their jobs to
+        the worker themselves (like SQS) don't support this.
+        """
+        raise NotImplementedError()
+
+
+class SqsPostUpdateQueue(PostUpdateQueue):
+    def __init__(self, sqs_client, queue_url: str):
+        self.sqs_client = sqs_client
+        self.queue_url = queue_url
+
+    def enqueue(self, job: PostUpdateJob, delay_seconds: float = 0):
+        logger.debug(f"enqueueing {job}, delay={delay_seconds}s")
+
+        self.sqs_client.send_message(
+            QueueUrl=self.queue_url,
+            MessageBody=job.to_json(),
+            # SQS only delays by whole seconds, up to 15 minutes
+            DelaySeconds=min(math.ceil(delay_seconds), 900),
+        )
+
+
+class SqlitePostUpdateQueue(PostUpdateQueue):
+    """A queue in a local SQLite file, for running the bot and worker locally."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS post_update_jobs "
+                "(id INTEGER PRIMARY KEY AUTOINCREMENT, body TEXT NOT NULL, "
+                "available_at REAL NOT NULL DEFAULT 0)"
+            )
+
+    def enqueue(self, job: PostUpdateJob, delay_seconds: float = 0):
+        logger.debug(f"enqueueing {job}, delay={delay_seconds}s")
+
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT INTO post_update_jobs (body, available_at) "
+                "VALUES (?, ?)",
+                (job.to_json(), time.time() + delay_seconds),
+            )
+
+    def receive(self, max_jobs: int = 10) -> List[PostUpdateJob]:
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT id, body FROM post_update_jobs WHERE available_at <= ? "
+                "ORDER BY id LIMIT ?",
+                (time.time(), max_jobs),
+            ).fetchall()
+
+            connection.executemany(
+                "DELETE FROM post_update_jobs WHERE id = ?",
+                [(row_id,) for row_id, _ in rows],
+            )
+
+        return [PostUpdateJob.from_json(body) for _, body in rows]
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # IMMEDIATE transactions keep two workers from receiving the same jobs
+        connection = sqlite3.connect(self.path, isolation_level='IMMEDIATE')
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+
+class InMemoryPostUpdateQueue(PostUpdateQueue):
+    def __init__(self):
+        self.jobs: List[Tuple[float, PostUpdateJob]] = []
+
+    def enqueue(self, job: PostUpdateJob, delay_seconds: float = 0):
+        self.jobs.append((time.time() + delay_seconds, job))
+
+    def receive(self, max_jobs: int = 10) -> List[PostUpdateJob]:
+        now = time.time()
+
+        available = [
+            entry for entry in self.jobs if entry[0] <= now
+        ][:max_jobs]
+        for entry in available:
+            self.jobs.remove(entry)
+
+        return [job for _, job in available]
@@ -0,0 +1,69 @@
+import asyncio
+from typing import Iterable, Set
+
+from loguru import logger
+
+from eternal_guesses.app import metrics
+from eternal_guesses.app.game_post_manager import GamePostManager
+from eternal_guesses.app.post_update_queue import PostUpdateJob
+from eternal_guesses.repositories.games_repository import GamesRepository
+from eternal_guesses.repositories.post_update_schedule_repository import \
+    PostUpdateScheduleRepository
+
+
+class PostUpdateWorker:
+    """
+    Updates the posts of the games in a batch of jobs. A game that was
+    changed several times while its jobs were queued only has its posts
+    updated once, using its latest state.
+    """
+
+    def __init__(
+        self,
+        games_repository: GamesRepository,
+        game_post_manager: GamePostManager,
+        post_update_schedule: PostUpdateScheduleRepository = None,
+    ):
+        self.games_repository = games_repository
+        self.game_post_manager = game_post_manager
+        self.post_update_schedule = post_update_schedule
+
+    async def process(self, jobs: Iterable[PostUpdateJob]) -> Set[PostUpdateJob]:
+        """Handles the jobs, and returns the ones that failed."""
+        jobs = list(jobs)
+        unique_jobs = list(dict.fromkeys(jobs))
+
+        logger.info(f"processing {len(jobs)} post update jobs, "
+                    f"{len(unique_jobs)} unique")
+        metrics.increment('post_update_worker.jobs', len(jobs))
+        metrics.increment('post_update_worker.updates', len(unique_jobs))
+
+        results = await asyncio.gather(
+            *(self._process(job) for job in unique_jobs),
+            return_exceptions=True,
+        )
+
+        failed_jobs = set()
+        for job, result in zip(unique_jobs, results):
+            if isinstance(result, Exception):
+                logger.error(f"failed updating posts for {job}: {result!r}")
+                failed_jobs.add(job)
+
+        return failed_jobs
+
+    async def _process(self, job: PostUpdateJob):
+        if self.post_update_schedule is not None:
+            # Released before reading the game, so that any change made
+            # after the read schedules a new update
+            self.post_update_schedule.release(job.guild_id, job.game_id)
+
+        # Consistent, as the writes made while the job was claimed didn't
+        # schedule an update of their own, and must all be in this one
+        game = self.games_repository.get(
+            job.guild_id, job.game_id, consistent_read=True
+        )
+        if game is None:
+            logger.warning(f"game of {job} no longer exists")
+            return
+
+        await self.game_post_manager.update(game)
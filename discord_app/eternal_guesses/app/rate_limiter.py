@@ -0,0 +1,179 @@
+import asyncio
+import re
+import time
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional
+
+from loguru import logger
+
+from eternal_guesses.app import metrics
+
+# Requests to routes that share a bucket still have separate limits per
+# 'major parameter', like the channel a message is sent to.
+MAJOR_PARAMETERS = re.compile(r"/(channels|guilds)/(\d+)|/webhooks/(\d+)/([^/]+)")
+
+# Discord tells which bucket a route uses; the route is identified
+# without its parameters.
+ROUTE_PARAMETERS = [
+    (re.compile(r"/webhooks/\d+/[^/]+"), "/webhooks/{webhook_id}/{token}"),
+    (re.compile(r"/\d+"), "/{id}"),
+]
+
+
+@dataclass
+class RateLimitBucket:
+    key: str
+    limit: int
+    remaining: int
+    reset_at: float
+    window: float
+
+    def delay(self, now: float) -> float:
+        self._refill(now)
+
+        if self.remaining > 0:
+            return 0
+
+        return self.reset_at - now
+
+    def take(self, now: float):
+        self._refill(now)
+        self.remaining -= 1
+
+    def _refill(self, now: float):
+        if now >= self.reset_at:
+            self.remaining = self.limit
+            self.reset_at = now + self.window
+
+
+class RateLimiter:
+    """
+    Keeps track of Discord's rate limit buckets, from the X-RateLimit-*
+    headers of its responses. Requests wait for their bucket to reset
+    instead of being sent into a 429.
+
+    The buckets are kept for as long as the (warm) container lives, so the
+    limits learned in one invocation are respected by the next ones.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+
+        self.buckets: Dict[str, RateLimitBucket] = {}
+        self.bucket_hashes: Dict[str, str] = {}
+        self.global_reset_at = 0.0
+
+    async def acquire(self, method: str, path: str):
+        """Waits until a request to this route may be sent."""
+        while True:
+            now = self.clock()
+            bucket = self._bucket(method, path)
+
+            delay = max(
+                self.global_reset_at - now,
+                bucket.delay(now) if bucket is not None else 0,
+            )
+            if delay <= 0:
+                break
+
+            logger.debug(f"waiting {delay:.2f}s for the rate limit of "
+                         f"{method} {path}")
+            metrics.increment('discord.rate_limit_waits')
+            await asyncio.sleep(delay)
+
+        if bucket is not None:
+            bucket.take(now)
+
+    def update(self, method: str, path: str, headers: Mapping[str, str]):
+        """Learns the route's bucket from the headers of a response."""
+        bucket_hash = headers.get('X-RateLimit-Bucket')
+        if bucket_hash is None:
+            return
+
+        self.bucket_hashes[route_key(method, path)] = bucket_hash
+
+        now = self.clock()
+        key = _bucket_key(bucket_hash, path)
+        limit = int(headers.get('X-RateLimit-Limit', 1))
+        remaining = int(headers.get('X-RateLimit-Remaining', 0))
+        reset_after = float(headers.get('X-RateLimit-Reset-After', 0))
+
+        bucket = self.buckets.get(key)
+        if bucket is None or now >= bucket.reset_at:
+            self.buckets[key] = RateLimitBucket(
+                key=key,
+                limit=limit,
+                remaining=remaining,
+                reset_at=now + reset_after,
+                window=max(reset_after, bucket.window if bucket else 0),
+            )
+        else:
+            # Responses within a window can arrive out of order, so the
+            # lowest count is the most recent one
+            bucket.limit = limit
+            bucket.remaining = min(bucket.remaining, remaining)
+            bucket.reset_at = now + reset_after
+            bucket.window = max(bucket.window, reset_after)
+
+    def rate_limited(
+        self,
+        method: str,
+        path: str,
+        headers: Mapping[str, str],
+        retry_after: float,
+    ):
+        """Handles a 429: nothing is sent to its bucket until retry_after."""
+        now = self.clock()
+
+        if headers.get('X-RateLimit-Global', '').lower() == 'true':
+            logger.warning(f"hit the global rate limit, retrying after "
+                           f"{retry_after}s")
+            self.global_reset_at = now + retry_after
+            return
+
+        logger.warning(f"rate limited on {method} {path}, retrying after "
+                       f"{retry_after}s")
+
+        bucket = self._bucket(method, path)
+        if bucket is not None:
+            bucket.remaining = 0
+            bucket.reset_at = max(bucket.reset_at, now + retry_after)
+
+    def state(self) -> Dict:
+        """The known routes and buckets, for debugging."""
+        now = self.clock()
+
+        return {
+            'global_reset_after': max(0.0, self.global_reset_at - now),
+            'routes': dict(self.bucket_hashes),
+            'buckets': {
+                key: {
+                    'limit': bucket.limit,
+                    'remaining': bucket.remaining,
+                    'reset_after': max(0.0, bucket.reset_at - now),
+                }
+                for key, bucket in self.buckets.items()
+            },
+        }
+
+    def _bucket(self, method: str, path: str) -> Optional[RateLimitBucket]:
+        bucket_hash = self.bucket_hashes.get(route_key(method, path))
+        if bucket_hash is None:
+            return None
+
+        return self.buckets.get(_bucket_key(bucket_hash, path))
+
+
+def route_key(method: str, path: str) -> str:
+    for pattern, replacement in ROUTE_PARAMETERS:
+        path = pattern.sub(replacement, path)
+
+    return f"{method} {path}"
+
+
+def _bucket_key(bucket_hash: str, path: str) -> str:
+    major_parameters = MAJOR_PARAMETERS.search(path)
+    if major_parameters is None:
+        return bucket_hash
+
+    return f"{bucket_hash}:{major_parameters.group(0)}"
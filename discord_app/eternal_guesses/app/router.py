@@ -1,37 +1,110 @@
 from abc import ABC
+from typing import Callable, Dict, Optional, Type
 
 from loguru import logger
 
+from eternal_guesses.app.dispatcher import Dispatcher
 from eternal_guesses.exceptions import BadRouteException, UnknownEventException
 from eternal_guesses.model.discord.discord_event import DiscordEvent
+from eternal_guesses.model.discord.discord_response import DiscordResponse
 from eternal_guesses.model.lambda_response import LambdaResponse
+from eternal_guesses.routes.route import Route
 
 
 class Router(ABC):
     async def route(self, event: DiscordEvent) -> LambdaResponse:
         pass
 
+    async def respond(self, event: DiscordEvent) -> DiscordResponse:
+        pass
+
+    def is_deferred(self, event: DiscordEvent) -> bool:
+        return False
+
+
+class RouteRegistry:
+    """
+    Routes by their type, with the factory that builds them. A route (and
+    with it, its dependencies) is only built once an event reaches it, and
+    then kept for the rest of the container's life: most invocations only
+    need one or two of the routes.
+
+    Events are matched to a route type by the route keys it declares, so
+    overlapping routes are found when they're registered.
+    """
+
+    def __init__(self):
+        self.dispatcher: Dispatcher[Type[Route]] = Dispatcher()
+        self.factories: Dict[Type[Route], Callable[[], Route]] = {}
+        self.built_routes: Dict[Type[Route], Route] = {}
+
+    def register(
+        self,
+        route_type: Type[Route],
+        factory: Callable[[], Route] = None,
+    ):
+        """Adds a route, which is built by factory (or its type)."""
+        for route_key in route_type.route_keys:
+            self.dispatcher.add(route_key, route_type)
+
+        self.factories[route_type] = factory or route_type
+
+    def add(self, route: Route):
+        """Adds a route that's already built."""
+        self.register(type(route), lambda: route)
+        self.built_routes[type(route)] = route
+
+    def find_type(self, event: DiscordEvent) -> Optional[Type[Route]]:
+        return self.dispatcher.find(event)
+
+    def get(self, route_type: Type[Route]) -> Route:
+        route = self.built_routes.get(route_type)
+        if route is None:
+            logger.debug(f"building route {route_type.__name__}")
+
+            route = self.factories[route_type]()
+            self.built_routes[route_type] = route
+
+        return route
+
 
 class RouterImpl(Router):
-    def __init__(self, routes=None):
+    def __init__(self, routes=None, route_registry: RouteRegistry = None):
+        self.route_registry = route_registry or RouteRegistry()
 
-        self.route_definitions = []
-        self.routes = routes or []
+        for route in routes or []:
+            self.route_registry.add(route)
 
     async def route(self, event: DiscordEvent) -> LambdaResponse:
-        for route in self.routes:
-            if route.matches(event):
-                try:
-                    discord_response = await route.call(event)
-                except Exception as e:
-                    logger.error(f"Error occurred in route {route}")
-                    raise e
-
-                if discord_response is None:
-                    raise BadRouteException(
-                        f"Route returned None response: {route}"
-                    )
-
-                return LambdaResponse.success(discord_response.json())
-
-        raise UnknownEventException(event)
+        discord_response = await self.respond(event)
+        return LambdaResponse.success(discord_response.json())
+
+    async def respond(self, event: DiscordEvent) -> DiscordResponse:
+        route = self._find_route(event)
+        if route is None:
+            raise UnknownEventException(event)
+
+        try:
+            discord_response = await route.call(event)
+        except Exception as e:
+            logger.error(f"Error occurred in route {route}")
+            raise e
+
+        if discord_response is None:
+            raise BadRouteException(
+                f"Route returned None response: {route}"
+            )
+
+        return discord_response
+
+    def is_deferred(self, event: DiscordEvent) -> bool:
+        # Deferring doesn't need the route itself, so it isn't built here
+        route_type = self.route_registry.find_type(event)
+        return route_type is not None and route_type.deferred
+
+    def _find_route(self, event: DiscordEvent) -> Optional[Route]:
+        route_type = self.route_registry.find_type(event)
+        if route_type is None:
+            return None
+
+        return self.route_registry.get(route_type)
@@ -0,0 +1,19 @@
+"""
+Adds the open games saved before the index of open games existed to it,
+so that list-games lists them. Run once after deploying that index, from
+discord_app/, with the table's name in DYNAMODB_TABLE_NAME:
+
+    python -m eternal_guesses.backfill_open_games
+"""
+from loguru import logger
+
+from eternal_guesses.app import injector
+
+
+def main():
+    game_count = injector.games_repository().backfill_open_games()
+    logger.info(f"added {game_count} open games to the index of open games")
+
+
+if __name__ == '__main__':
+    main()
@@ -8,6 +8,11 @@ def handle(event):
     return event_handler.handle(event)
 
 
+def handle_deferred(interaction):
+    event_handler = get_event_handler()
+    event_handler.handle_deferred(interaction)
+
+
 def get_event_handler():
     global discord_event_handler
 
@@ -10,6 +10,23 @@ class GameNotFoundError(Exception):
     pass
 
 
+class DuplicateGameError(Exception):
+    pass
+
+
+class GameClosedError(Exception):
+    pass
+
+
+class DuplicateGuessError(Exception):
+    pass
+
+
+class GameVersionConflictError(Exception):
+    """The game was changed (or deleted) since the copy being saved was read."""
+    pass
+
+
 class BadRouteException(Exception):
     pass
 
@@ -30,3 +47,38 @@ class UnknownCommandException(Exception):
 class UnknownEventException(Exception):
     def __init__(self, event: DiscordEvent):
         super().__init__(f"could not handle event {event}")
+
+
+class DiscordApiError(Exception):
+    """An error response from Discord's REST API."""
+
+    def __init__(self, status: int, code: int = 0, message: str = ""):
+        super().__init__(f"{status} (error code: {code}): {message}")
+        self.status = status
+        self.code = code
+        self.message = message
+
+
+class DiscordNotFoundError(DiscordApiError):
+    pass
+
+
+class DiscordForbiddenError(DiscordApiError):
+    pass
+
+
+class DiscordServerError(DiscordApiError):
+    pass
+
+
+class AmbiguousRouteError(Exception):
+    def __init__(self, key, route, other_route):
+        super().__init__(
+            f"{key} of {route} overlaps with the keys of {other_route}"
+        )
+
+
+class InvalidCustomIdError(ValueError):
+    def __init__(self, custom_id: str, reason: str):
+        super().__init__(f"invalid custom_id '{custom_id}': {reason}")
+        self.custom_id = custom_id
@@ -5,14 +5,22 @@ from typing import Dict
 from loguru import logger
 
 from eternal_guesses import event_handler
+from eternal_guesses.app.deferred_dispatcher import DEFERRED_INTERACTION_KEY
 
 discord_event_handler = None
 
 
 def handle_lambda(event, context) -> Dict:
-    logger.debug(f"body: {pprint.pformat(event['body'])}")
-    logger.debug(f"headers:{pprint.pformat(event['headers'])}")
-    logger.debug(f"context:{pprint.pformat(context)}")
+    if DEFERRED_INTERACTION_KEY in event:
+        event_handler.handle_deferred(event[DEFERRED_INTERACTION_KEY])
+        return {}
+
+    # Formatting the event is only worth it when it's logged
+    logger.opt(lazy=True).debug(
+        "event: {}\ncontext: {}",
+        lambda: pprint.pformat(event),
+        lambda: pprint.pformat(context),
+    )
 
     return event_handler.handle(event)
 
@@ -0,0 +1,56 @@
+"""
+Encodes and decodes the JSON on the request path: interaction bodies,
+responses, queue messages and the guesses of a game. orjson is used when
+it's installed, with the standard library's json module as the fallback.
+
+Both write compact UTF-8 JSON, and accept int dict keys (as strings), so
+what one writes reads the same with the other.
+"""
+import json
+from typing import Any, Union
+
+
+class StdlibCodec:
+    name = 'json'
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any, sort_keys: bool = False) -> str:
+        return json.dumps(
+            obj,
+            separators=(',', ':'),
+            ensure_ascii=False,
+            sort_keys=sort_keys,
+        )
+
+
+class OrjsonCodec:
+    name = 'orjson'
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+        self._options = orjson.OPT_NON_STR_KEYS
+        self._sorted_options = self._options | orjson.OPT_SORT_KEYS
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any, sort_keys: bool = False) -> str:
+        options = self._sorted_options if sort_keys else self._options
+        return self._orjson.dumps(obj, option=options).decode()
+
+
+def _installed_codec():
+    try:
+        return OrjsonCodec()
+    except ImportError:
+        return StdlibCodec()
+
+
+codec = _installed_codec()
+
+loads = codec.loads
+dumps = codec.dumps
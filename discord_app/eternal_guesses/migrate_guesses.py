@@ -0,0 +1,19 @@
+"""
+Moves the guesses of the games saved before guesses got items of their own
+into items. Run once after deploying the version that reads them from
+items, from discord_app/, with the table's name in DYNAMODB_TABLE_NAME:
+
+    python -m eternal_guesses.migrate_guesses
+"""
+from loguru import logger
+
+from eternal_guesses.app import injector
+
+
+def main():
+    guess_count = injector.games_repository().migrate_guesses()
+    logger.info(f"moved {guess_count} guesses into items of their own")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,14 @@
+from typing import Optional
+
+
 class ChannelMessage:
-    def __init__(self, channel_id: int, message_id: int):
+    def __init__(
+        self,
+        channel_id: int,
+        message_id: int,
+        content_hash: Optional[str] = None,
+    ):
         self.channel_id = channel_id
         self.message_id = message_id
+        # Fingerprint of what the message was last rendered with
+        self.content_hash = content_hash
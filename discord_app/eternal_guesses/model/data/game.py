@@ -19,7 +19,8 @@ class Game:
         title: str = None,
         description: str = None,
         min_guess: int = None,
-        max_guess: int = None
+        max_guess: int = None,
+        version: int = None,
     ):
         self.guild_id = guild_id
         self.game_id = game_id
@@ -36,6 +37,10 @@ class Game:
         self.min_guess = min_guess
         self.max_guess = max_guess
 
+        # Counts the saves of the game, to detect saving a stale copy; None
+        # for a game that was never saved
+        self.version = version
+
         if channel_messages is None:
             self.channel_messages = []
 
@@ -0,0 +1,14 @@
+class GameSummary:
+    """The few fields of a game that listing the games of a guild needs."""
+
+    def __init__(
+        self,
+        guild_id: int = None,
+        game_id: str = None,
+        title: str = None,
+        closed: bool = False,
+    ):
+        self.guild_id = guild_id
+        self.game_id = game_id
+        self.title = title
+        self.closed = closed
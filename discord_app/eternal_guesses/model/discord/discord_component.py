@@ -81,16 +81,22 @@ class DiscordComponent(object):
         custom_id: str,
         label: str,
         paragraph: bool = False,
-        required: bool = True
+        required: bool = True,
+        max_length: int = None
     ):
+        fields = {
+            "custom_id": custom_id,
+            "label": label,
+            "style": (2 if paragraph else 1),
+            "required": required,
+        }
+
+        if max_length is not None:
+            fields["max_length"] = max_length
+
         return DiscordComponent(
             type=ComponentType.TEXT_INPUT,
-            fields={
-                "custom_id": custom_id,
-                "label": label,
-                "style": (2 if paragraph else 1),
-                "required": required,
-            }
+            fields=fields
         )
 
     @classmethod
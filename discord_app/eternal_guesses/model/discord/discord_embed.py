@@ -0,0 +1,35 @@
+class DiscordEmbed(object):
+    def __init__(
+        self,
+        title: str = None,
+        description: str = None,
+        color: int = None,
+    ):
+        self.title = title
+        self.description = description
+        self.color = color
+        self.footer = None
+
+    def set_footer(self, text: str):
+        self.footer = text
+
+    def json(self):
+        data = {
+            "type": "rich",
+        }
+
+        if self.title is not None:
+            data['title'] = self.title
+
+        if self.description is not None:
+            data['description'] = self.description
+
+        if self.color is not None:
+            data['color'] = self.color
+
+        if self.footer is not None:
+            data['footer'] = {
+                "text": self.footer,
+            }
+
+        return data
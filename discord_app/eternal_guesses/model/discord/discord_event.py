@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Dict
+from typing import Dict, Optional
 
 from loguru import logger
 
@@ -32,6 +32,8 @@ class DiscordEvent:
         guild_id: int = None,
         channel_id: int = None,
         event_type: InteractionType = InteractionType.APPLICATION_COMMAND,
+        application_id: int = None,
+        token: str = None,
     ):
         self.command = command
         self.modal_submit = modal_submit
@@ -40,6 +42,8 @@ class DiscordEvent:
         self.guild_id = guild_id
         self.channel_id = channel_id
         self.event_type = event_type
+        self.application_id = application_id
+        self.token = token
 
     def __repr__(self):
         if self.event_type == InteractionType.APPLICATION_COMMAND:
@@ -90,6 +94,8 @@ def from_application_command_event(event_source):
         command=command,
         member=member,
         event_type=InteractionType.APPLICATION_COMMAND,
+        application_id=_application_id_from_data(event_source),
+        token=event_source.get('token'),
     )
 
 
@@ -142,6 +148,8 @@ def from_message_component_event(event_source):
         channel_id=channel_id,
         event_type=InteractionType.MESSAGE_COMPONENT,
         component_action=component_action,
+        application_id=_application_id_from_data(event_source),
+        token=event_source.get('token'),
     )
 
 
@@ -173,5 +181,15 @@ def from_modal_submit_event(event_source):
         modal_submit=DiscordModalSubmit(
             modal_custom_id=custom_id,
             inputs=inputs,
-        )
+        ),
+        application_id=_application_id_from_data(event_source),
+        token=event_source.get('token'),
     )
+
+
+def _application_id_from_data(event_source) -> Optional[int]:
+    application_id = event_source.get('application_id')
+    if application_id is None:
+        return None
+
+    return int(application_id)
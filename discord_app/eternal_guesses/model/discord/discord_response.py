@@ -1,10 +1,9 @@
 from enum import Enum
 from typing import List
 
-import discord
-
 from eternal_guesses.model.discord.discord_component import DiscordComponent, \
     ActionRow
+from eternal_guesses.model.discord.discord_embed import DiscordEmbed
 
 
 class ResponseType(Enum):
@@ -27,7 +26,7 @@ class DiscordResponse(object):
         custom_id: str = None,
         title: str = None,
         action_rows: List[ActionRow] = None,
-        embed: discord.Embed = None,
+        embed: DiscordEmbed = None,
     ):
         self.response_type = response_type
         self.content = content
@@ -71,7 +70,7 @@ class DiscordResponse(object):
                 data['content'] = self.content
 
             if self.embed:
-                data['embeds'] = [self.embed.to_dict()]
+                data['embeds'] = [self.embed.json()]
 
             if self.action_rows:
                 data['components'] = [c.json() for c in self.action_rows]
@@ -91,7 +90,7 @@ class DiscordResponse(object):
     def channel_message(
         cls,
         content: str = None,
-        embed: discord.Embed = None
+        embed: DiscordEmbed = None
     ):
         return DiscordResponse(
             response_type=ResponseType.CHANNEL_MESSAGE,
@@ -103,7 +102,7 @@ class DiscordResponse(object):
     def ephemeral_channel_message(
         cls,
         content: str = None,
-        embed: discord.Embed = None,
+        embed: DiscordEmbed = None,
         action_rows: List[ActionRow] = None,
     ):
         response = DiscordResponse(
@@ -122,6 +121,15 @@ class DiscordResponse(object):
             response_type=ResponseType.DEFERRED_CHANNEL_MESSAGE
         )
 
+    @classmethod
+    def ephemeral_deferred_channel_message(cls):
+        response = DiscordResponse(
+            response_type=ResponseType.DEFERRED_CHANNEL_MESSAGE
+        )
+        response.is_ephemeral = True
+
+        return response
+
     @classmethod
     def modal(
         cls,
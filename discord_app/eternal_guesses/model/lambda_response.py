@@ -1,6 +1,7 @@
-import json
 from typing import Dict
 
+from eternal_guesses import json_codec
+
 
 class LambdaResponse:
     body: str
@@ -20,7 +21,7 @@ class LambdaResponse:
     def success(body: Dict):
         response = LambdaResponse()
         response.status_code = 200
-        response.body = json.dumps(body)
+        response.body = json_codec.dumps(body)
 
         return response
 
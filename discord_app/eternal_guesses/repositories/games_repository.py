@@ -1,36 +1,126 @@
-import json
+import itertools
 import re
 from abc import ABC
 from datetime import datetime
-from typing import Optional, List
+from typing import Any, Dict, Iterator, List, Optional
 
-from boto3.dynamodb.conditions import Key
+from botocore.exceptions import ClientError
+from loguru import logger
 
+from eternal_guesses import json_codec
+from eternal_guesses.exceptions import DuplicateGameError, \
+    DuplicateGuessError, GameClosedError, GameNotFoundError, \
+    GameVersionConflictError
 from eternal_guesses.model.data.channel_message import ChannelMessage
 from eternal_guesses.model.data.game import Game
 from eternal_guesses.model.data.game_guess import GameGuess
+from eternal_guesses.model.data.game_summary import GameSummary
 
 PK_REGEX = r"GUILD#(.*)"
 SK_REGEX = r"GAME#(.*)"
 
+# Each guess is an item of its own, next to its game's item:
+# GAME#<game_id>#GUESS#<user_id>. Game ids only hold [a-z0-9-], which all
+# sort after '#', so a game's guesses sort right after the game itself and
+# before any other game.
+GUESS_INFIX = "#GUESS#"
+# Sorts after any user id
+LAST_GUESS_SUFFIX = "~"
+# Sorts after any game id, and so after all games of a guild
+LAST_GAME_RANGE_KEY = "GAME#~"
+
+# A sparse index of the open games of each guild: only a game's item has
+# an open_pk, and only while the game is open. It's the game's pk, and the
+# index sorts by sk, like the table.
+OPEN_GAMES_INDEX = "open-games"
+OPEN_PK = "open_pk"
+
+# The attributes of a game's item that save() writes. It leaves any other
+# as is, like the guesses of a game that weren't moved into items yet.
+SAVED_ATTRIBUTES = (
+    'created_by', 'closed', 'title', 'description', 'min_guess',
+    'max_guess', 'create_datetime', 'close_datetime', 'channel_messages',
+    OPEN_PK, 'version',
+)
+
+# The attributes of a game that update_fields() changes, named as on Game
+UPDATABLE_FIELDS = (
+    'title', 'description', 'min_guess', 'max_guess', 'closed',
+    'close_datetime',
+)
+
+# Guesses placed at the same time all check the same game item, and
+# DynamoDB cancels transactions that overlap on an item. They're tried again
+# right away: waiting here would block the event loop the routes run on.
+ADD_GUESS_ATTEMPTS = 5
+
 
 def _channel_message_from_model(message_model: dict):
     return ChannelMessage(
         channel_id=message_model['channel_id'],
-        message_id=message_model['message_id']
+        message_id=message_model['message_id'],
+        content_hash=message_model.get('content_hash'),
     )
 
 
+def _channel_messages_to_model(channel_messages: List[ChannelMessage]):
+    models = []
+    for message in channel_messages:
+        model = {
+            'message_id': message.message_id,
+            'channel_id': message.channel_id,
+        }
+
+        if message.content_hash is not None:
+            model['content_hash'] = message.content_hash
+
+        models.append(model)
+
+    return models
+
+
 def _guess_from_model(guess_model):
     return GameGuess(
-        user_id=guess_model['user_id'],
+        user_id=int(guess_model['user_id']),
         guess=guess_model['guess'],
-        nickname=guess_model['nickname'],
+        nickname=guess_model.get('nickname'),
         timestamp=datetime.fromisoformat(guess_model['timestamp']),
     )
 
 
-def _game_from_model(model: dict) -> Game:
+def _guess_to_model(game_guess: GameGuess) -> dict:
+    model = {
+        'user_id': int(game_guess.user_id),
+        'guess': game_guess.guess,
+        'timestamp': game_guess.timestamp.isoformat(),
+    }
+
+    if game_guess.nickname is not None:
+        model['nickname'] = game_guess.nickname
+
+    return model
+
+
+def _legacy_guesses_from_model(model: dict) -> Dict[int, GameGuess]:
+    """The guesses of a game saved before they got items of their own."""
+    guesses = {}
+    for (user_id, guess_model) in json_codec.loads(model['guesses']).items():
+        guesses[int(user_id)] = _guess_from_model(guess_model)
+
+    return guesses
+
+
+def _game_from_items(game_model: dict, guesses: Dict[int, GameGuess]) -> Game:
+    # A game saved before guesses got items of their own keeps them in its
+    # item until migrate_guesses() moved them. A guess that already has an
+    # item is newer, and wins.
+    if 'guesses' in game_model:
+        guesses = {**_legacy_guesses_from_model(game_model), **guesses}
+
+    return _game_from_model(game_model, guesses)
+
+
+def _game_from_model(model: dict, guesses: Dict[int, GameGuess]) -> Game:
     guild_id = int(re.match(PK_REGEX, model['pk']).group(1))
     game_id = re.match(SK_REGEX, model['sk']).group(1)
 
@@ -55,11 +145,6 @@ def _game_from_model(model: dict) -> Game:
             model['channel_messages']
         )
 
-    guesses = {}
-    if 'guesses' in model:
-        for (user_id, guess_model) in json.loads(model['guesses']).items():
-            guesses[int(user_id)] = _guess_from_model(guess_model)
-
     return Game(
         guild_id=guild_id,
         game_id=game_id,
@@ -73,6 +158,101 @@ def _game_from_model(model: dict) -> Game:
         closed=closed,
         channel_messages=channel_messages,
         guesses=guesses,
+        # Games saved before they had versions count as version 0
+        version=int(model.get('version', 0)),
+    )
+
+
+def _field_to_model(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+
+    return value
+
+
+def _game_to_model(game: Game) -> dict:
+    model = {
+        'pk': _hash_key(game.guild_id),
+        'sk': _range_key(game.game_id),
+        'created_by': int(game.created_by),
+        'closed': game.closed
+    }
+
+    if not game.closed:
+        model[OPEN_PK] = model['pk']
+
+    if game.title:
+        model['title'] = game.title
+
+    if game.description:
+        model['description'] = game.description
+
+    if game.min_guess:
+        model['min_guess'] = game.min_guess
+
+    if game.max_guess:
+        model['max_guess'] = game.max_guess
+
+    if game.create_datetime is not None:
+        model['create_datetime'] = game.create_datetime.isoformat()
+
+    if game.close_datetime is not None:
+        model['close_datetime'] = game.close_datetime.isoformat()
+
+    if game.channel_messages is not None:
+        model['channel_messages'] = _channel_messages_to_model(
+            game.channel_messages
+        )
+
+    return model
+
+
+def _save_expression(model: dict) -> (str, dict, dict):
+    """
+    The update expression that saves the model's attributes, and removes
+    those of SAVED_ATTRIBUTES it doesn't have, with its attribute names and
+    values.
+    """
+    attribute_names = {}
+    attribute_values = {}
+    set_actions = []
+    remove_actions = []
+    for index, name in enumerate(SAVED_ATTRIBUTES):
+        attribute_names[f'#a{index}'] = name
+
+        if name in model:
+            attribute_values[f':a{index}'] = model[name]
+            set_actions.append(f'#a{index} = :a{index}')
+        else:
+            remove_actions.append(f'#a{index}')
+
+    update_expression = 'SET ' + ', '.join(set_actions)
+    if remove_actions:
+        update_expression += ' REMOVE ' + ', '.join(remove_actions)
+
+    return update_expression, attribute_names, attribute_values
+
+
+def _version_condition(game: Game) -> (str, dict):
+    """
+    The condition for writing the game's item: that it's still at the
+    version the game was read at.
+    """
+    if game.version is None:
+        return 'attribute_not_exists(pk)', {}
+
+    if game.version == 0:
+        return 'attribute_exists(pk) AND attribute_not_exists(version)', {}
+
+    return 'version = :version', {':version': game.version}
+
+
+def _game_summary_from_model(guild_id: int, model: dict) -> GameSummary:
+    return GameSummary(
+        guild_id=guild_id,
+        game_id=re.match(SK_REGEX, model['sk']).group(1),
+        title=model.get('title', '') or '',
+        closed=model.get('closed', False) or False,
     )
 
 
@@ -84,14 +264,155 @@ def _range_key(game_id: str):
     return f"GAME#{game_id}"
 
 
+def _guess_range_key(game_id: str, user_id: int):
+    return f"{_range_key(game_id)}{GUESS_INFIX}{user_id}"
+
+
+def _is_guess(item: dict) -> bool:
+    return GUESS_INFIX in item['sk']
+
+
+def _games_key_condition(
+    guild_id: int, after: Optional[str], partition_key: str = 'pk'
+) -> dict:
+    if after is None:
+        # A plain expression, as the boto3 condition builders would pull
+        # all of boto3 into the import of this module
+        return {
+            'KeyConditionExpression':
+                f'{partition_key} = :pk AND begins_with(sk, :sk)',
+            'ExpressionAttributeValues': {
+                ':pk': _hash_key(guild_id),
+                ':sk': 'GAME#',
+            },
+        }
+
+    # Starts past the guesses of the game listed last, which sort right
+    # after it
+    return {
+        'KeyConditionExpression':
+            f'{partition_key} = :pk AND sk BETWEEN :first_sk AND :last_sk',
+        'ExpressionAttributeValues': {
+            ':pk': _hash_key(guild_id),
+            ':first_sk': _guess_range_key(after, LAST_GUESS_SUFFIX),
+            ':last_sk': LAST_GAME_RANGE_KEY,
+        },
+    }
+
+
+def _page_size(page_size: Optional[int]) -> dict:
+    # Without a Limit, DynamoDB fills pages of up to 1 MB
+    if page_size is None:
+        return {}
+
+    return {'Limit': page_size}
+
+
 class GamesRepository(ABC):
-    def get(self, guild_id: int, game_id: str) -> Optional[Game]:
+    def get(
+        self, guild_id: int, game_id: str, consistent_read: bool = False
+    ) -> Optional[Game]:
+        """
+        Reads a game with its guesses. With consistent_read, the read is
+        strongly consistent, so it sees every write made before it.
+        """
+        pass
+
+    def get_without_guesses(
+        self, guild_id: int, game_id: str
+    ) -> Optional[Game]:
+        """
+        Reads only the game's own item, with a strongly consistent read,
+        leaving out the guesses that have items of their own: for changing
+        the game itself, or checking a guess against it. Guesses still in
+        the game's item, until migrate_guesses() moved them, come with it.
+        """
         pass
 
     def get_all(self, guild_id: int) -> List[Game]:
         pass
 
+    def iter_games(
+        self,
+        guild_id: int,
+        page_size: Optional[int] = None,
+        after: Optional[str] = None,
+    ) -> Iterator[Game]:
+        """
+        Yields the games of a guild by their ids, reading a page of at most
+        page_size items (games and guesses) at a time as they're needed,
+        rather than all of them up front. With after, only yields the games
+        whose ids sort after it, so that a listing can continue where an
+        earlier one stopped.
+        """
+        pass
+
+    def get_summaries(self, guild_id: int) -> List[GameSummary]:
+        """Lists the games of a guild, with only what a listing shows."""
+        pass
+
+    def iter_summaries(
+        self,
+        guild_id: int,
+        page_size: Optional[int] = None,
+        after: Optional[str] = None,
+        open_only: bool = False,
+    ) -> Iterator[GameSummary]:
+        """
+        Yields summaries of the games of a guild, like iter_games(). With
+        open_only, only of its open games, which are read from an index of
+        them; that index is only eventually consistent, so a game that was
+        just closed or reopened may be listed as it was.
+        """
+        pass
+
+    def create(self, game: Game):
+        """
+        Saves a new game, in one write. Raises DuplicateGameError if the
+        guild already has a game with its id.
+        """
+        pass
+
     def save(self, game: Game):
+        """
+        Saves the game, if it wasn't saved since it was read, and counts up
+        its version. Raises GameVersionConflictError otherwise.
+        """
+        pass
+
+    def save_channel_messages(self, game: Game):
+        """
+        Saves only the game's channel messages, leaving the rest as is,
+        under the same condition as save().
+        """
+        pass
+
+    def update_fields(
+        self, guild_id: int, game_id: str, fields: Dict[str, Any]
+    ) -> Optional[Game]:
+        """
+        Sets only the given fields of a game, leaving the rest as is, and
+        returns the game as it is after that. Counts up its version, so
+        that copies read before can't be saved over it. Fields set to None (or an
+        empty string) are removed. Returns None if there's no such game.
+        """
+        pass
+
+    def add_guess(self, game: Game, game_guess: GameGuess):
+        """
+        Adds a new guess to the game, and to the given copy of it, in one
+        atomic write: only if the game exists, isn't closed, and has no
+        guess of the user yet. Raises GameNotFoundError, GameClosedError or
+        DuplicateGuessError otherwise.
+        """
+        pass
+
+    def save_guess(self, game: Game, game_guess: GameGuess):
+        """Saves one guess on the game, leaving the rest as is."""
+        pass
+
+    def delete_guess(self, game: Game, user_id: int):
+        """Deletes one guess from the game, leaving the rest as is."""
         pass
 
 
@@ -99,92 +420,491 @@ class GamesRepositoryImpl(GamesRepository):
     def __init__(self, eternal_guesses_table):
         self.table = eternal_guesses_table
 
-    def get(self, guild_id: int, game_id: str) -> Optional[Game]:
+    def get(
+        self, guild_id: int, game_id: str, consistent_read: bool = False
+    ) -> Optional[Game]:
+        items = self._query(
+            ConsistentRead=consistent_read,
+            KeyConditionExpression='pk = :pk AND sk BETWEEN :sk AND :last_sk',
+            ExpressionAttributeValues={
+                ':pk': _hash_key(guild_id),
+                ':sk': _range_key(game_id),
+                ':last_sk': _guess_range_key(game_id, LAST_GUESS_SUFFIX),
+            },
+        )
+
+        games = self._games_from_items(items)
+        if not games:
+            return None
+
+        return games[0]
+
+    def get_without_guesses(
+        self, guild_id: int, game_id: str
+    ) -> Optional[Game]:
         result = self.table.get_item(
             Key={
                 'pk': _hash_key(guild_id),
                 'sk': _range_key(game_id),
             },
+            ConsistentRead=True,
         )
 
         if 'Item' not in result:
             return None
 
-        return _game_from_model(result['Item'])
+        return _game_from_items(result['Item'], {})
 
     def get_all(self, guild_id: int) -> List[Game]:
-        games = []
+        return list(self.iter_games(guild_id))
+
+    def iter_games(
+        self,
+        guild_id: int,
+        page_size: Optional[int] = None,
+        after: Optional[str] = None,
+    ) -> Iterator[Game]:
+        items = self._query(
+            **_games_key_condition(guild_id, after),
+            **_page_size(page_size),
+        )
 
-        query_results = self.table.query(
-            KeyConditionExpression=(
-                Key('pk').eq(_hash_key(guild_id)) &
-                Key('sk').begins_with('GAME#')
+        return self._iter_games_from_items(items)
+
+    def get_summaries(self, guild_id: int) -> List[GameSummary]:
+        return list(self.iter_summaries(guild_id))
+
+    def iter_summaries(
+        self,
+        guild_id: int,
+        page_size: Optional[int] = None,
+        after: Optional[str] = None,
+        open_only: bool = False,
+    ) -> Iterator[GameSummary]:
+        if open_only:
+            items = self._query(
+                IndexName=OPEN_GAMES_INDEX,
+                **_games_key_condition(guild_id, after, partition_key=OPEN_PK),
+                **_page_size(page_size),
+                ProjectionExpression='sk, title, closed',
+            )
+        else:
+            items = self._query(
+                **_games_key_condition(guild_id, after),
+                **_page_size(page_size),
+                # Only games have a created_by; guesses are left out. The key
+                # attributes can't be filtered on, so sk can't tell them apart.
+                FilterExpression='attribute_exists(created_by)',
+                ProjectionExpression='sk, title, closed',
             )
-        )
 
-        if 'Items' not in query_results:
-            return []
+        return (_game_summary_from_model(guild_id, item) for item in items)
 
-        for game_model in query_results['Items']:
-            games.append(_game_from_model(game_model))
+    def create(self, game: Game):
+        assert game.game_id is not None
 
-        return games
+        model = _game_to_model(game)
+        model['version'] = 1
 
-    def save(self, game: Game):
-        assert game.game_id is not None
+        try:
+            self.table.put_item(
+                Item=model,
+                ConditionExpression='attribute_not_exists(pk)',
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise
 
-        model = {
-            'pk': _hash_key(game.guild_id),
-            'sk': _range_key(game.game_id),
-            'created_by': int(game.created_by),
-            'closed': game.closed
-        }
+            raise DuplicateGameError(
+                f"guild {game.guild_id} already has a game {game.game_id}"
+            )
 
-        if game.title:
-            model['title'] = game.title
+        game.version = 1
 
-        if game.description:
-            model['description'] = game.description
+    def save(self, game: Game):
+        assert game.game_id is not None
+
+        model = _game_to_model(game)
+
+        version = (game.version or 0) + 1
+        model['version'] = version
+
+        condition, condition_values = _version_condition(game)
+        update_expression, attribute_names, attribute_values = \
+            _save_expression(model)
+
+        try:
+            # An update rather than a put, so that it only replaces what it
+            # saves
+            self.table.update_item(
+                Key={
+                    'pk': model['pk'],
+                    'sk': model['sk'],
+                },
+                UpdateExpression=update_expression,
+                ConditionExpression=condition,
+                ExpressionAttributeNames=attribute_names,
+                ExpressionAttributeValues={
+                    **attribute_values,
+                    **condition_values,
+                },
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise
 
-        if game.min_guess:
-            model['min_guess'] = game.min_guess
+            raise GameVersionConflictError(
+                f"game {game.game_id} changed since version {game.version}"
+            )
 
-        if game.max_guess:
-            model['max_guess'] = game.max_guess
+        game.version = version
+
+    def update_fields(
+        self, guild_id: int, game_id: str, fields: Dict[str, Any]
+    ) -> Optional[Game]:
+        unknown_fields = set(fields) - set(UPDATABLE_FIELDS)
+        if not fields or unknown_fields:
+            raise ValueError(f"can't update fields {sorted(unknown_fields)} "
+                             f"of a game")
+
+        # Named by placeholder, so that no field name can clash with one of
+        # DynamoDB's reserved words
+        attribute_names = {'#version': 'version'}
+        attribute_values = {':zero': 0, ':one': 1}
+        set_actions = ['#version = if_not_exists(#version, :zero) + :one']
+        remove_actions = []
+        for index, (field, value) in enumerate(fields.items()):
+            attribute_names[f'#f{index}'] = field
+
+            if value is None or value == '':
+                remove_actions.append(f'#f{index}')
+            else:
+                attribute_values[f':f{index}'] = _field_to_model(value)
+                set_actions.append(f'#f{index} = :f{index}')
+
+        # Keeps the game in the index of open games while it's open
+        if 'closed' in fields:
+            attribute_names['#open_pk'] = OPEN_PK
+            if fields['closed']:
+                remove_actions.append('#open_pk')
+            else:
+                attribute_values[':open_pk'] = _hash_key(guild_id)
+                set_actions.append('#open_pk = :open_pk')
+
+        update_expression = 'SET ' + ', '.join(set_actions)
+        if remove_actions:
+            update_expression += ' REMOVE ' + ', '.join(remove_actions)
+
+        try:
+            result = self.table.update_item(
+                Key={
+                    'pk': _hash_key(guild_id),
+                    'sk': _range_key(game_id),
+                },
+                UpdateExpression=update_expression,
+                # Don't create a game that doesn't exist
+                ConditionExpression='attribute_exists(pk)',
+                ExpressionAttributeNames=attribute_names,
+                ExpressionAttributeValues=attribute_values,
+                ReturnValues='ALL_NEW',
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise
 
-        if game.create_datetime is not None:
-            model['create_datetime'] = game.create_datetime.isoformat()
+            return None
 
-        if game.close_datetime is not None:
-            model['close_datetime'] = game.close_datetime.isoformat()
+        # The game's item came back from the update, its guesses didn't
+        guess_items = self._query(
+            KeyConditionExpression='pk = :pk AND begins_with(sk, :sk)',
+            ExpressionAttributeValues={
+                ':pk': _hash_key(guild_id),
+                ':sk': f"{_range_key(game_id)}{GUESS_INFIX}",
+            },
+        )
 
-        if game.guesses is not None:
-            model['guesses'] = json.dumps(self._guesses(game))
+        return self._games_from_items(
+            itertools.chain([result['Attributes']], guess_items)
+        )[0]
+
+    def add_guess(self, game: Game, game_guess: GameGuess):
+        model = _guess_to_model(game_guess)
+        model['pk'] = _hash_key(game.guild_id)
+        model['sk'] = _guess_range_key(game.game_id, game_guess.user_id)
+
+        transact_items = [
+            {
+                'ConditionCheck': {
+                    'TableName': self.table.name,
+                    'Key': {
+                        'pk': _hash_key(game.guild_id),
+                        'sk': _range_key(game.game_id),
+                    },
+                    # Games that never closed have no (or a null) closed
+                    'ConditionExpression':
+                        'attribute_exists(pk) AND NOT closed = :closed',
+                    'ExpressionAttributeValues': {':closed': True},
+                    # Tells a closed game apart from a missing one
+                    'ReturnValuesOnConditionCheckFailure': 'ALL_OLD',
+                },
+            },
+            {
+                'Put': {
+                    'TableName': self.table.name,
+                    'Item': model,
+                    'ConditionExpression': 'attribute_not_exists(sk)',
+                },
+            },
+        ]
 
-        if game.channel_messages is not None:
-            channel_messages = []
-            for message in game.channel_messages:
-                channel_messages.append(
-                    {
-                        'message_id': message.message_id,
-                        'channel_id': message.channel_id
-                    }
+        for attempt in range(1, ADD_GUESS_ATTEMPTS + 1):
+            try:
+                self.table.meta.client.transact_write_items(
+                    TransactItems=transact_items,
                 )
-            model['channel_messages'] = channel_messages
+                break
+            except ClientError as e:
+                if e.response['Error']['Code'] != \
+                        'TransactionCanceledException':
+                    raise
+
+                game_reason, guess_reason = e.response['CancellationReasons']
+                if game_reason['Code'] == 'ConditionalCheckFailed':
+                    if 'Item' not in game_reason:
+                        raise GameNotFoundError(
+                            f"could not find game {game.game_id}"
+                        )
+                    raise GameClosedError(f"game {game.game_id} is closed")
+
+                if guess_reason['Code'] == 'ConditionalCheckFailed':
+                    raise DuplicateGuessError(
+                        f"{game_guess.user_id} already guessed on game "
+                        f"{game.game_id}"
+                    )
+
+                if attempt == ADD_GUESS_ATTEMPTS:
+                    raise
+
+        game.guesses[game_guess.user_id] = game_guess
+
+    def save_guess(self, game: Game, game_guess: GameGuess):
+        model = _guess_to_model(game_guess)
+        model['pk'] = _hash_key(game.guild_id)
+        model['sk'] = _guess_range_key(game.game_id, game_guess.user_id)
 
         self.table.put_item(
             Item=model,
         )
 
-    def _guesses(self, game):
+    def delete_guess(self, game: Game, user_id: int):
+        # A guess still in the game's item would otherwise be read again
+        self._migrate_guesses_of(game.guild_id, game.game_id)
+
+        self.table.delete_item(
+            Key={
+                'pk': _hash_key(game.guild_id),
+                'sk': _guess_range_key(game.game_id, user_id),
+            },
+        )
+
+    def save_channel_messages(self, game: Game):
+        version = (game.version or 0) + 1
+        condition, condition_values = _version_condition(game)
+
+        try:
+            self.table.update_item(
+                Key={
+                    'pk': _hash_key(game.guild_id),
+                    'sk': _range_key(game.game_id),
+                },
+                UpdateExpression='SET channel_messages = :channel_messages, '
+                                 'version = :new_version',
+                ConditionExpression=condition,
+                ExpressionAttributeValues={
+                    ':channel_messages': _channel_messages_to_model(
+                        game.channel_messages or []
+                    ),
+                    ':new_version': version,
+                    **condition_values,
+                },
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise
+
+            raise GameVersionConflictError(
+                f"game {game.game_id} changed since version {game.version}"
+            )
+
+        game.version = version
+
+    def migrate_guesses(self) -> int:
+        """
+        Moves the guesses of all games saved before they got items of their
+        own into items. Scans the whole table, so it's only meant to be run
+        once; reads merge the guesses left in a game's item in the
+        meantime. Returns how many guesses it moved.
+        """
+        guess_count = 0
+
+        items = self._scan(
+            FilterExpression='attribute_exists(guesses)',
+            ProjectionExpression='pk, sk, guesses',
+        )
+        for game_model in items:
+            moved = self._migrate_guesses(game_model)
+            logger.info(f"moved {moved} guesses of game {game_model['sk']} "
+                        f"into items of their own")
+            guess_count += moved
+
+        return guess_count
+
+    def backfill_open_games(self) -> int:
+        """
+        Gives the open games saved before the index of open games existed
+        their open_pk, so that they're in it. Scans the whole table, so it's
+        only meant to be run once. Returns how many games it updated.
+        """
+        game_count = 0
+
+        items = self._scan(
+            # Only games have a created_by
+            FilterExpression='attribute_exists(created_by) AND '
+                             'attribute_not_exists(open_pk) AND '
+                             'NOT closed = :closed',
+            ProjectionExpression='pk, sk',
+            ExpressionAttributeValues={':closed': True},
+        )
+        for item in items:
+            try:
+                self.table.update_item(
+                    Key={
+                        'pk': item['pk'],
+                        'sk': item['sk'],
+                    },
+                    UpdateExpression='SET open_pk = :open_pk',
+                    # Unless it was closed since it was scanned
+                    ConditionExpression='attribute_exists(pk) AND '
+                                        'NOT closed = :closed',
+                    ExpressionAttributeValues={
+                        ':open_pk': item['pk'],
+                        ':closed': True,
+                    },
+                )
+                game_count += 1
+            except ClientError as e:
+                if e.response['Error']['Code'] != \
+                        'ConditionalCheckFailedException':
+                    raise
+
+        return game_count
+
+    def _query(self, **kwargs) -> Iterator[dict]:
+        while True:
+            result = self.table.query(**kwargs)
+            yield from result.get('Items', [])
+
+            if 'LastEvaluatedKey' not in result:
+                return
+
+            kwargs['ExclusiveStartKey'] = result['LastEvaluatedKey']
+
+    def _scan(self, **kwargs) -> Iterator[dict]:
+        while True:
+            result = self.table.scan(**kwargs)
+            yield from result.get('Items', [])
+
+            if 'LastEvaluatedKey' not in result:
+                return
+
+            kwargs['ExclusiveStartKey'] = result['LastEvaluatedKey']
+
+    def _games_from_items(self, items: Iterator[dict]) -> List[Game]:
+        return list(self._iter_games_from_items(items))
+
+    def _iter_games_from_items(self, items: Iterator[dict]) -> Iterator[Game]:
+        """
+        Assembles games from their items, as they're sorted: each game's
+        item, followed by those of its guesses. Yields each game once the
+        item after its last guess is read, so only one game is held at a
+        time.
+        """
+        game_model = None
         guesses = {}
 
-        for user_id, game_guess in game.guesses.items():
-            guesses[user_id] = {
-                'user_id': game_guess.user_id,
-                'nickname': game_guess.nickname,
-                'guess': game_guess.guess,
-                'timestamp': game_guess.timestamp.isoformat(),
-            }
+        for item in items:
+            if not _is_guess(item):
+                if game_model is not None:
+                    yield _game_from_items(game_model, guesses)
+
+                game_model = item
+                guesses = {}
+            elif game_model is not None and \
+                    item['sk'].split(GUESS_INFIX)[0] == game_model['sk']:
+                game_guess = _guess_from_model(item)
+                guesses[game_guess.user_id] = game_guess
+
+        if game_model is not None:
+            yield _game_from_items(game_model, guesses)
+
+    def _migrate_guesses_of(self, guild_id: int, game_id: str):
+        """Moves the guesses of one game into items, if it still has any."""
+        result = self.table.get_item(
+            Key={
+                'pk': _hash_key(guild_id),
+                'sk': _range_key(game_id),
+            },
+            ProjectionExpression='pk, sk, guesses',
+            ConsistentRead=True,
+        )
+
+        game_model = result.get('Item')
+        if game_model is not None and 'guesses' in game_model:
+            self._migrate_guesses(game_model)
+
+    def _migrate_guesses(self, game_model: dict) -> int:
+        """
+        Moves the guesses of a game saved before they got items of their
+        own into items. A guess that already has an item is newer than the
+        one in the game's item, and is kept. Returns how many it moved.
+        """
+        guess_items = self._query(
+            KeyConditionExpression='pk = :pk AND begins_with(sk, :sk)',
+            ProjectionExpression='sk',
+            ExpressionAttributeValues={
+                ':pk': game_model['pk'],
+                ':sk': f"{game_model['sk']}{GUESS_INFIX}",
+            },
+        )
+        existing_keys = {item['sk'] for item in guess_items}
+
+        guess_count = 0
+        for user_id, game_guess in \
+                _legacy_guesses_from_model(game_model).items():
+            model = _guess_to_model(game_guess)
+            model['pk'] = game_model['pk']
+            model['sk'] = f"{game_model['sk']}{GUESS_INFIX}{user_id}"
+            if model['sk'] in existing_keys:
+                continue
+
+            try:
+                # Unless the user changed their guess since the query
+                self.table.put_item(
+                    Item=model,
+                    ConditionExpression='attribute_not_exists(sk)',
+                )
+                guess_count += 1
+            except ClientError as e:
+                if e.response['Error']['Code'] != \
+                        'ConditionalCheckFailedException':
+                    raise
+
+        self.table.update_item(
+            Key={
+                'pk': game_model['pk'],
+                'sk': game_model['sk'],
+            },
+            UpdateExpression='REMOVE guesses',
+        )
 
-        return guesses
+        return guess_count
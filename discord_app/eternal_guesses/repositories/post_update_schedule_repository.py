@@ -0,0 +1,66 @@
+import time
+from abc import ABC
+
+from botocore.exceptions import ClientError
+
+
+def _hash_key(guild_id: int):
+    return f"GUILD#{guild_id}"
+
+
+def _range_key(game_id: str):
+    return f"POST_UPDATE#{game_id}"
+
+
+class PostUpdateScheduleRepository(ABC):
+    """
+    Keeps track of which games already have an update of their posts
+    scheduled, so that a burst of changes to a game results in a single
+    update.
+    """
+
+    def claim(self, guild_id: int, game_id: str, seconds: float) -> bool:
+        """
+        Marks an update of the game's posts as scheduled for the coming
+        seconds. Returns False if one already was.
+        """
+        pass
+
+    def release(self, guild_id: int, game_id: str):
+        pass
+
+
+class PostUpdateScheduleRepositoryImpl(PostUpdateScheduleRepository):
+    def __init__(self, eternal_guesses_table):
+        self.table = eternal_guesses_table
+
+    def claim(self, guild_id: int, game_id: str, seconds: float) -> bool:
+        now = int(time.time() * 1000)
+
+        try:
+            self.table.put_item(
+                Item={
+                    'pk': _hash_key(guild_id),
+                    'sk': _range_key(game_id),
+                    'pending_until': now + int(seconds * 1000),
+                },
+                # A claim that outlived its update (e.g. because the worker
+                # gave up on it) can be taken over
+                ConditionExpression='attribute_not_exists(pk) OR '
+                                    'pending_until < :now',
+                ExpressionAttributeValues={':now': now},
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return False
+            raise
+
+        return True
+
+    def release(self, guild_id: int, game_id: str):
+        self.table.delete_item(
+            Key={
+                'pk': _hash_key(guild_id),
+                'sk': _range_key(game_id),
+            },
+        )
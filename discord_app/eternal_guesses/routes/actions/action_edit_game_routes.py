@@ -1,18 +1,18 @@
-import re
 from abc import ABC
 
 from eternal_guesses.app.component_ids import ComponentIds
-from eternal_guesses.model.discord.discord_component import ComponentType, \
-    DiscordComponent
+from eternal_guesses.app.custom_id import CustomIdKind
+from eternal_guesses.model.discord.discord_component import DiscordComponent
 from eternal_guesses.model.discord.discord_event import DiscordEvent
 from eternal_guesses.model.discord.discord_response import DiscordResponse
 from eternal_guesses.routes.route import Route
 
 
 class ActionEditGameRoute(Route, ABC):
+    button: CustomIdKind
+
     def __init__(
         self,
-        prefix: str,
         input_id: str,
         is_paragraph: bool,
         name: str,
@@ -20,23 +20,13 @@ class ActionEditGameRoute(Route, ABC):
     ):
         self.modal_id_func = modal_id_func
         self.name = name
-        self.prefix = prefix
         self.input_id = input_id
         self.is_paragraph = is_paragraph
 
-    def matches(self, event: DiscordEvent) -> bool:
-        action = event.component_action
-        return (
-            action is not None and
-            action.component_type == ComponentType.BUTTON and
-            action.component_custom_id.startswith(self.prefix)
-        )
-
     async def call(self, event: DiscordEvent) -> DiscordResponse:
-        game_id = re.search(
-            fr"{self.prefix}(.*)",
+        game_id = self.button.decode(
             event.component_action.component_custom_id
-        ).group(1)
+        ).game_id
 
         return DiscordResponse.modal(
             custom_id=self.modal_id_func(game_id=game_id),
@@ -51,9 +41,11 @@ class ActionEditGameRoute(Route, ABC):
 
 
 class ActionEditGameTitleRoute(ActionEditGameRoute):
+    button = ComponentIds.button_edit_game_title
+    route_keys = [button.route_key()]
+
     def __init__(self):
         super().__init__(
-            prefix=ComponentIds.button_edit_game_title_prefix,
             modal_id_func=ComponentIds.edit_game_title_modal_id,
             input_id=ComponentIds.edit_game_title_input,
             is_paragraph=False,
@@ -62,9 +54,11 @@ class ActionEditGameTitleRoute(ActionEditGameRoute):
 
 
 class ActionEditGameMinGuessRoute(ActionEditGameRoute):
+    button = ComponentIds.button_edit_game_min_guess
+    route_keys = [button.route_key()]
+
     def __init__(self):
         super().__init__(
-            prefix=ComponentIds.button_edit_game_min_guess_prefix,
             modal_id_func=ComponentIds.edit_game_min_guess_modal_id,
             input_id=ComponentIds.edit_game_min_guess_input,
             is_paragraph=False,
@@ -73,9 +67,11 @@ class ActionEditGameMinGuessRoute(ActionEditGameRoute):
 
 
 class ActionEditGameMaxGuessRoute(ActionEditGameRoute):
+    button = ComponentIds.button_edit_game_max_guess
+    route_keys = [button.route_key()]
+
     def __init__(self):
         super().__init__(
-            prefix=ComponentIds.button_edit_game_max_guess_prefix,
             modal_id_func=ComponentIds.edit_game_max_guess_modal_id,
             input_id=ComponentIds.edit_game_max_guess_input,
             is_paragraph=False,
@@ -84,9 +80,11 @@ class ActionEditGameMaxGuessRoute(ActionEditGameRoute):
 
 
 class ActionEditGameDescriptionRoute(ActionEditGameRoute):
+    button = ComponentIds.button_edit_game_description
+    route_keys = [button.route_key()]
+
     def __init__(self):
         super().__init__(
-            prefix=ComponentIds.button_edit_game_description_prefix,
             modal_id_func=ComponentIds.edit_game_description_modal_id,
             input_id=ComponentIds.edit_game_description_input,
             is_paragraph=True,
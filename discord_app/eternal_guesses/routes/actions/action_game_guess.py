@@ -1,7 +1,4 @@
-import re
-
-from eternal_guesses.model.discord.discord_component import DiscordComponent, \
-    ComponentType
+from eternal_guesses.model.discord.discord_component import DiscordComponent
 from eternal_guesses.model.discord.discord_event import DiscordEvent
 from eternal_guesses.model.discord.discord_response import DiscordResponse
 from eternal_guesses.repositories.games_repository import GamesRepository
@@ -13,6 +10,8 @@ from eternal_guesses.app.message_provider import MessageProvider
 # Triggered by clicking the 'guess' button on a game.
 # Shows a modal to enter the guess in.
 class ActionGameGuessRoute(Route):
+    route_keys = [ComponentIds.component_button_guess.route_key()]
+
     def __init__(
         self,
         message_provider: MessageProvider,
@@ -21,22 +20,11 @@ class ActionGameGuessRoute(Route):
         self.games_repository = games_repository
         self.message_provider = message_provider
 
-    @staticmethod
-    def matches(event: DiscordEvent) -> bool:
-        return (
-            event.component_action is not None and
-            event.component_action.component_type == ComponentType.BUTTON and
-            event.component_action.component_custom_id.startswith(
-                ComponentIds.component_button_guess_prefix
-            )
-        )
-
     async def call(self, event: DiscordEvent) -> DiscordResponse:
         component_action = event.component_action
-        game_id = re.search(
-            fr"{ComponentIds.component_button_guess_prefix}(.*)",
+        game_id = ComponentIds.component_button_guess.decode(
             component_action.component_custom_id
-        ).group(1)
+        ).game_id
 
         game = self.games_repository.get(
             guild_id=event.guild_id,
@@ -1,9 +1,6 @@
-import re
-
-import discord
-
-from eternal_guesses.model.discord.discord_component import ComponentType, \
-    ActionRow, DiscordComponent, DiscordSelectOption
+from eternal_guesses.model.discord.discord_component import ActionRow, \
+    DiscordComponent, DiscordSelectOption
+from eternal_guesses.model.discord.discord_embed import DiscordEmbed
 from eternal_guesses.model.discord.discord_event import DiscordEvent
 from eternal_guesses.model.discord.discord_response import DiscordResponse, \
     ResponseType
@@ -14,6 +11,8 @@ from eternal_guesses.app.message_provider import MessageProvider
 
 
 class ActionManageGameDeleteGuessRoute(Route):
+    route_keys = [ComponentIds.component_button_delete_guess.route_key()]
+
     def __init__(
         self,
         message_provider: MessageProvider,
@@ -22,24 +21,13 @@ class ActionManageGameDeleteGuessRoute(Route):
         self.games_repository = games_repository
         self.message_provider = message_provider
 
-    @staticmethod
-    def matches(event: DiscordEvent) -> bool:
-        return (
-            event.component_action is not None and
-            event.component_action.component_type == ComponentType.BUTTON and
-            event.component_action.component_custom_id.startswith(
-                ComponentIds.component_button_delete_guess_prefix
-            )
-        )
-
     async def call(self, event: DiscordEvent) -> DiscordResponse:
         guild_id = event.guild_id
 
         custom_id = event.component_action.component_custom_id
-        game_id = re.search(
-            fr"{ComponentIds.component_button_delete_guess_prefix}(.*)",
+        game_id = ComponentIds.component_button_delete_guess.decode(
             custom_id
-        ).group(1)
+        ).game_id
 
         game = self.games_repository.get(guild_id, game_id)
 
@@ -52,7 +40,7 @@ class ActionManageGameDeleteGuessRoute(Route):
             guess_list.append(f"<@{user_id}> ({user_id}) -> {guess.guess}")
 
         guesses_string = "\n".join(guess_list)
-        response.embed = discord.Embed(
+        response.embed = DiscordEmbed(
             description=f"Which guess would you like to delete for game {game_id}?\n\n{guesses_string}"
         )
 
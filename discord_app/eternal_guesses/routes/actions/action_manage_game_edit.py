@@ -1,5 +1,3 @@
-import re
-
 from eternal_guesses.app.component_ids import ComponentIds
 from eternal_guesses.model.discord.discord_component import ActionRow, \
     DiscordComponent
@@ -10,6 +8,8 @@ from eternal_guesses.routes.route import Route
 
 
 class ActionManageGameEditRoute(Route):
+    route_keys = [ComponentIds.component_button_edit_game.route_key()]
+
     def __init__(
         self,
         # games_service: GamesService,
@@ -19,22 +19,11 @@ class ActionManageGameEditRoute(Route):
         self.games_repository = games_repository
         # self.games_service = games_service
 
-    def matches(self, event: DiscordEvent) -> bool:
-        action = event.component_action
-        if action is None:
-            return False
-
-        custom_id = action.component_custom_id
-        return custom_id.startswith(
-            ComponentIds.component_button_edit_game_prefix
-        )
-
     async def call(self, event: DiscordEvent) -> DiscordResponse:
         guild_id = event.guild_id
-        game_id = re.search(
-            fr"{ComponentIds.component_button_edit_game_prefix}(.*)",
+        game_id = ComponentIds.component_button_edit_game.decode(
             event.component_action.component_custom_id
-        ).group(1)
+        ).game_id
 
         game = self.games_repository.get(guild_id, game_id)
 
@@ -1,10 +1,8 @@
-import re
-
-import discord
 from loguru import logger
 
 from eternal_guesses.model.discord.discord_component import ActionRow, \
-    DiscordComponent, DiscordSelectOption, ComponentType
+    DiscordComponent, DiscordSelectOption
+from eternal_guesses.model.discord.discord_embed import DiscordEmbed
 from eternal_guesses.model.discord.discord_event import DiscordEvent
 from eternal_guesses.model.discord.discord_response import DiscordResponse, \
     ResponseType
@@ -15,6 +13,8 @@ from eternal_guesses.app.message_provider import MessageProvider
 
 
 class ActionManageGameEditGuessRoute(Route):
+    route_keys = [ComponentIds.component_button_edit_guess.route_key()]
+
     def __init__(
         self,
         message_provider: MessageProvider,
@@ -23,23 +23,13 @@ class ActionManageGameEditGuessRoute(Route):
         self.games_repository = games_repository
         self.message_provider = message_provider
 
-    def matches(self, event: DiscordEvent) -> bool:
-        return (
-            event.component_action is not None and
-            event.component_action.component_type == ComponentType.BUTTON and
-            event.component_action.component_custom_id.startswith(
-                ComponentIds.component_button_edit_guess_prefix
-            )
-        )
-
     async def call(self, event: DiscordEvent) -> DiscordResponse:
         guild_id = event.guild_id
 
         custom_id = event.component_action.component_custom_id
-        game_id = re.search(
-            fr"{ComponentIds.component_button_edit_guess_prefix}(.*)",
+        game_id = ComponentIds.component_button_edit_guess.decode(
             custom_id
-        ).group(1)
+        ).game_id
 
         logger.info(f"editing a guess for game_id={game_id}, guild_id={guild_id}")
 
@@ -54,7 +44,7 @@ class ActionManageGameEditGuessRoute(Route):
             guess_list.append(f"<@{user_id}> ({user_id}) -> {guess.guess}")
 
         guesses_string = "\n".join(guess_list)
-        response.embed = discord.Embed(
+        response.embed = DiscordEmbed(
             description=f"Which guess would you like to edit for game {game_id}?\n\n{guesses_string}"
         )
 
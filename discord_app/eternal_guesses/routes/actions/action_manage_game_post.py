@@ -1,7 +1,5 @@
-import re
-
 from eternal_guesses.model.discord.discord_component import ActionRow, \
-    DiscordComponent, ComponentType
+    DiscordComponent
 from eternal_guesses.model.discord.discord_event import DiscordEvent
 from eternal_guesses.model.discord.discord_response import DiscordResponse
 from eternal_guesses.routes.route import Route
@@ -9,22 +7,13 @@ from eternal_guesses.app.component_ids import ComponentIds
 
 
 class ActionManageGamePostRoute(Route):
-    @staticmethod
-    def matches(event: DiscordEvent) -> bool:
-        return (
-            event.component_action is not None and
-            event.component_action.component_type == ComponentType.BUTTON and
-            event.component_action.component_custom_id.startswith(
-                ComponentIds.component_button_post_game_prefix
-            )
-        )
+    route_keys = [ComponentIds.component_button_post_game.route_key()]
 
     async def call(self, event: DiscordEvent) -> DiscordResponse:
         custom_id = event.component_action.component_custom_id
-        game_id = re.search(
-            ComponentIds.component_button_post_game_regex,
+        game_id = ComponentIds.component_button_post_game.decode(
             custom_id
-        ).group(1)
+        ).game_id
 
         response = DiscordResponse.channel_message()
         response.is_ephemeral = True
@@ -1,5 +1,3 @@
-import re
-
 from loguru import logger
 
 from eternal_guesses.app.component_ids import ComponentIds
@@ -11,6 +9,9 @@ from eternal_guesses.services.games_service import GamesService
 
 
 class ActionManageGameReopenRoute(Route):
+    deferred = True
+    route_keys = [ComponentIds.component_button_reopen_game.route_key()]
+
     def __init__(
         self,
         games_service: GamesService,
@@ -19,23 +20,11 @@ class ActionManageGameReopenRoute(Route):
         self.games_repository = games_repository
         self.games_service = games_service
 
-    @staticmethod
-    def matches(event: DiscordEvent) -> bool:
-        action = event.component_action
-        if action is None:
-            return False
-
-        custom_id = action.component_custom_id
-        return custom_id.startswith(
-            ComponentIds.component_button_reopen_game_prefix
-        )
-
     async def call(self, event: DiscordEvent) -> DiscordResponse:
         guild_id = event.guild_id
-        game_id = re.search(
-            fr"{ComponentIds.component_button_reopen_game_prefix}(.*)",
+        game_id = ComponentIds.component_button_reopen_game.decode(
             event.component_action.component_custom_id
-        ).group(1)
+        ).game_id
 
         logger.info(f"guild {event.guild_id}, user {event.member.user_id}, "
                     f"reopening game {game_id}")
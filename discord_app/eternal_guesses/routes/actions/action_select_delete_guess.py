@@ -1,7 +1,4 @@
-import re
-
 from eternal_guesses.exceptions import GuessNotFoundError, GameNotFoundError
-from eternal_guesses.model.discord.discord_component import ComponentType
 from eternal_guesses.model.discord.discord_event import DiscordEvent
 from eternal_guesses.model.discord.discord_response import DiscordResponse
 from eternal_guesses.routes.route import Route
@@ -11,6 +8,9 @@ from eternal_guesses.app.message_provider import MessageProvider
 
 
 class ActionSelectDeleteGuessRoute(Route):
+    deferred = True
+    route_keys = [ComponentIds.component_select_delete_guess.route_key()]
+
     def __init__(
         self,
         guesses_service: GuessesService,
@@ -19,24 +19,13 @@ class ActionSelectDeleteGuessRoute(Route):
         self.message_provider = message_provider
         self.guesses_service = guesses_service
 
-    @staticmethod
-    def matches(event: DiscordEvent) -> bool:
-        return (
-            event.component_action is not None and
-            event.component_action.component_type == ComponentType.STRING_SELECT and
-            event.component_action.component_custom_id.startswith(
-                ComponentIds.component_select_delete_guess_prefix
-            )
-        )
-
     async def call(self, event: DiscordEvent) -> DiscordResponse:
         guild_id = event.guild_id
 
         custom_id = event.component_action.component_custom_id
-        game_id = re.search(
-            fr"{ComponentIds.component_select_delete_guess_prefix}(.*)",
+        game_id = ComponentIds.component_select_delete_guess.decode(
             custom_id
-        ).group(1)
+        ).game_id
 
         member_id = int(event.component_action.values[0])
 
@@ -1,7 +1,4 @@
-import re
-
-from eternal_guesses.model.discord.discord_component import ComponentType, \
-    DiscordComponent
+from eternal_guesses.model.discord.discord_component import DiscordComponent
 from eternal_guesses.model.discord.discord_event import DiscordEvent
 from eternal_guesses.model.discord.discord_response import DiscordResponse
 from eternal_guesses.routes.route import Route
@@ -10,6 +7,8 @@ from eternal_guesses.app.message_provider import MessageProvider
 
 
 class ActionSelectEditGuessRoute(Route):
+    route_keys = [ComponentIds.component_select_edit_guess.route_key()]
+
     def __init__(
         self,
         # guesses_service: GuessesService,
@@ -19,26 +18,11 @@ class ActionSelectEditGuessRoute(Route):
         # self.guesses_service = guesses_service
         self.message_provider = message_provider
 
-    @staticmethod
-    def matches(event: DiscordEvent) -> bool:
-        action = event.component_action
-        if action is None:
-            return False
-
-        if action.component_type != ComponentType.STRING_SELECT:
-            return False
-
-        custom_id = action.component_custom_id
-        return custom_id.startswith(
-            ComponentIds.component_select_edit_guess_prefix
-        )
-
     async def call(self, event: DiscordEvent) -> DiscordResponse:
         custom_id = event.component_action.component_custom_id
-        game_id = re.search(
-            fr"{ComponentIds.component_select_edit_guess_prefix}(.*)",
+        game_id = ComponentIds.component_select_edit_guess.decode(
             custom_id
-        ).group(1)
+        ).game_id
 
         member_id = int(event.component_action.values[0])
 
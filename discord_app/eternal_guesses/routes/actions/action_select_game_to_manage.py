@@ -5,21 +5,20 @@ from eternal_guesses.model.discord.discord_component import ActionRow, \
 from eternal_guesses.model.discord.discord_event import DiscordEvent
 from eternal_guesses.model.discord.discord_response import DiscordResponse
 from eternal_guesses.repositories.games_repository import GamesRepository
+from eternal_guesses.app.dispatcher import RouteKey
 from eternal_guesses.routes.route import Route
 
 
 class ActionSelectGameToManageRoute(Route):
+    route_keys = [
+        RouteKey.component(
+            custom_id=ComponentIds.component_select_game_to_manage
+        ),
+    ]
+
     def __init__(self, games_repository: GamesRepository):
         self.games_repository = games_repository
 
-    @staticmethod
-    def matches(event: DiscordEvent) -> bool:
-        action = event.component_action
-        return (
-            action is not None and
-            action.component_custom_id == ComponentIds.component_select_game_to_manage
-        )
-
     async def call(self, event: DiscordEvent) -> DiscordResponse:
         guild_id = event.guild_id
         game_id = event.component_action.values[0]
@@ -1,5 +1,3 @@
-import re
-
 from loguru import logger
 
 from eternal_guesses.model.discord.discord_event import DiscordEvent
@@ -11,6 +9,8 @@ from eternal_guesses.app.message_provider import MessageProvider
 
 
 class ActionSelectPostGameRoute(Route):
+    route_keys = [ComponentIds.selector_post_game.route_key()]
+
     def __init__(
         self,
         message_provider: MessageProvider,
@@ -19,23 +19,11 @@ class ActionSelectPostGameRoute(Route):
         self.games_service = games_service
         self.message_provider = message_provider
 
-    @staticmethod
-    def matches(event: DiscordEvent) -> bool:
-        action = event.component_action
-        if action is None:
-            return False
-
-        custom_id = action.component_custom_id
-        return custom_id.startswith(
-            ComponentIds.selector_post_game_prefix
-        )
-
     async def call(self, event: DiscordEvent) -> DiscordResponse:
         custom_id = event.component_action.component_custom_id
-        game_id = re.search(
-            fr"{ComponentIds.selector_post_game_prefix}(.*)",
+        game_id = ComponentIds.selector_post_game.decode(
             custom_id
-        ).group(1)
+        ).game_id
 
         channel_id = int(event.component_action.values[0])
 
@@ -2,12 +2,16 @@ from eternal_guesses.model.discord.discord_component import DiscordComponent
 from eternal_guesses.model.discord.discord_event import DiscordEvent
 from eternal_guesses.model.discord.discord_response import DiscordResponse
 from eternal_guesses.repositories.games_repository import GamesRepository
+from eternal_guesses.app.component_ids import ComponentIds
+from eternal_guesses.app.dispatcher import RouteKey
 from eternal_guesses.routes.route import Route
 from eternal_guesses.app.discord_messaging import DiscordMessaging
 from eternal_guesses.app.message_provider import MessageProvider
 
 
 class CreateRoute(Route):
+    route_keys = [RouteKey.command('create-game')]
+
     def __init__(
         self,
         games_repository: GamesRepository,
@@ -18,13 +22,6 @@ class CreateRoute(Route):
         self.games_repository = games_repository
         self.message_provider = message_provider
 
-    @staticmethod
-    def matches(event: DiscordEvent) -> bool:
-        return (
-            event.command is not None and
-            event.command.command_name == 'create-game'
-        )
-
     async def call(self, event: DiscordEvent) -> DiscordResponse:
         return DiscordResponse.modal(
             custom_id="modal_create_game",
@@ -33,6 +30,8 @@ class CreateRoute(Route):
                 DiscordComponent.text_input(
                     custom_id="modal_create_game_id",
                     label="Game Identifier",
+                    # The game id is part of the custom_ids of its posts
+                    max_length=ComponentIds.max_game_id_length(),
                 ),
                 DiscordComponent.text_input(
                     custom_id="modal_create_game_title",
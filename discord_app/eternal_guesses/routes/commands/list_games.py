@@ -4,11 +4,17 @@ from eternal_guesses.model.discord.discord_component import ActionRow, \
     DiscordComponent, DiscordSelectOption
 from eternal_guesses.model.discord.discord_event import DiscordEvent
 from eternal_guesses.model.discord.discord_response import DiscordResponse
+from eternal_guesses.app.dispatcher import RouteKey
 from eternal_guesses.routes.route import Route
 from eternal_guesses.services.games_service import GamesService
 
+# The most options a select menu can have
+MAX_LISTED_GAMES = 25
+
 
 class ListGamesRoute(Route):
+    route_keys = [RouteKey.command('list-games')]
+
     def __init__(
         self,
         message_provider: MessageProvider,
@@ -17,13 +23,6 @@ class ListGamesRoute(Route):
         self.games_service = games_service
         self.message_provider = message_provider
 
-    @staticmethod
-    def matches(event: DiscordEvent) -> bool:
-        return (
-            event.command is not None and
-            event.command.command_name == 'list-games'
-        )
-
     async def call(self, event: DiscordEvent) -> DiscordResponse:
         guild_id = event.guild_id
 
@@ -31,10 +30,14 @@ class ListGamesRoute(Route):
         if 'include-closed' in event.command.options:
             include_closed = event.command.options['include-closed']
 
+        # One more than is listed, to know whether there are more
         games = self.games_service.list(
             guild_id=guild_id,
-            include_closed=include_closed
+            include_closed=include_closed,
+            limit=MAX_LISTED_GAMES + 1,
         )
+        more_games = len(games) > MAX_LISTED_GAMES
+        games = games[:MAX_LISTED_GAMES]
 
         lines = []
         for game in games:
@@ -50,6 +53,9 @@ class ListGamesRoute(Route):
             message = "All open games:\n"
 
         message = message + "\n".join(sorted(lines))
+        if more_games:
+            message = message + \
+                f"\n(only the first {MAX_LISTED_GAMES} games are listed)"
 
         response = DiscordResponse.ephemeral_channel_message(message)
         response.action_rows = [
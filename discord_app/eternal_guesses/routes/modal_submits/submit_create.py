@@ -3,18 +3,22 @@ from datetime import datetime
 
 from loguru import logger
 
+from eternal_guesses.exceptions import DuplicateGameError
 from eternal_guesses.model.data.game import Game
 from eternal_guesses.model.discord.discord_component import ActionRow, \
     DiscordComponent
 from eternal_guesses.model.discord.discord_event import DiscordEvent
 from eternal_guesses.model.discord.discord_response import DiscordResponse
 from eternal_guesses.repositories.games_repository import GamesRepository
+from eternal_guesses.app.dispatcher import RouteKey
 from eternal_guesses.routes.route import Route
 from eternal_guesses.app.component_ids import ComponentIds
 from eternal_guesses.app.message_provider import MessageProvider
 
 
 class SubmitCreateRoute(Route):
+    route_keys = [RouteKey.modal(custom_id=ComponentIds.submit_create_modal_id)]
+
     def __init__(
         self,
         games_repository: GamesRepository,
@@ -23,14 +27,6 @@ class SubmitCreateRoute(Route):
         self.games_repository = games_repository
         self.message_provider = message_provider
 
-    @staticmethod
-    def matches(event: DiscordEvent) -> bool:
-        submit = event.modal_submit
-        return (
-            submit is not None and
-            submit.modal_custom_id == ComponentIds.submit_create_modal_id
-        )
-
     async def call(self, event: DiscordEvent) -> DiscordResponse:
         guild_id = event.guild_id
 
@@ -53,12 +49,6 @@ class SubmitCreateRoute(Route):
         if max_guess or max_guess == 0:
             max_guess = int(max_guess)
 
-        existing_game = self.games_repository.get(guild_id, game_id)
-        if existing_game is not None:
-            message = self.message_provider.duplicate_game_id(game_id)
-
-            return DiscordResponse.ephemeral_channel_message(message)
-
         game = Game(
             guild_id=guild_id,
             game_id=game_id,
@@ -71,7 +61,12 @@ class SubmitCreateRoute(Route):
             close_datetime=None,
             closed=False,
         )
-        self.games_repository.save(game)
+        try:
+            self.games_repository.create(game)
+        except DuplicateGameError:
+            message = self.message_provider.duplicate_game_id(game_id)
+
+            return DiscordResponse.ephemeral_channel_message(message)
 
         game_created_message = self.message_provider.game_created(game)
         return DiscordResponse.ephemeral_channel_message(
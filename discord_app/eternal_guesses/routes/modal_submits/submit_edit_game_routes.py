@@ -1,10 +1,10 @@
-import re
 import typing
 from abc import ABC
 
 from loguru import logger
 
 from eternal_guesses.app.component_ids import ComponentIds
+from eternal_guesses.app.custom_id import CustomIdKind
 from eternal_guesses.model.discord.discord_event import DiscordEvent
 from eternal_guesses.model.discord.discord_response import DiscordResponse
 from eternal_guesses.routes.route import Route
@@ -12,10 +12,12 @@ from eternal_guesses.services.games_service import GamesService
 
 
 class SubmitEditGameRoute(Route, ABC):
+    deferred = True
+    modal: CustomIdKind
+
     def __init__(
         self,
         games_service: GamesService,
-        modal_prefix: str,
         input_id: str,
         game_update_func: typing.Callable[
             [int, str, str], typing.Awaitable[typing.Any]],
@@ -23,22 +25,13 @@ class SubmitEditGameRoute(Route, ABC):
     ):
         self.is_numeric = is_numeric
         self.games_helper = games_service
-        self.modal_prefix = modal_prefix
         self.input_id = input_id
         self.game_update_func = game_update_func
 
-    def matches(self, event: DiscordEvent) -> bool:
-        modal = event.modal_submit
-        if modal is None:
-            return False
-
-        return modal.modal_custom_id.startswith(self.modal_prefix)
-
     async def call(self, event: DiscordEvent) -> DiscordResponse:
-        game_id = re.search(
-            fr"{self.modal_prefix}(.*)",
-            event.modal_submit.modal_custom_id,
-        ).group(1)
+        game_id = self.modal.decode(
+            event.modal_submit.modal_custom_id
+        ).game_id
 
         new_value = event.modal_submit.inputs[self.input_id]
         if self.is_numeric:
@@ -56,10 +49,12 @@ class SubmitEditGameRoute(Route, ABC):
 
 
 class SubmitEditGameTitleRoute(SubmitEditGameRoute):
+    modal = ComponentIds.edit_game_title_modal
+    route_keys = [modal.route_key()]
+
     def __init__(self, games_service: GamesService):
         super().__init__(
             games_service=games_service,
-            modal_prefix=ComponentIds.edit_game_title_modal_prefix,
             input_id=ComponentIds.edit_game_title_input,
             game_update_func=games_service.edit_title,
             is_numeric=False,
@@ -67,10 +62,12 @@ class SubmitEditGameTitleRoute(SubmitEditGameRoute):
 
 
 class SubmitEditGameMinGuessRoute(SubmitEditGameRoute):
+    modal = ComponentIds.edit_game_min_guess_modal
+    route_keys = [modal.route_key()]
+
     def __init__(self, games_service: GamesService):
         super().__init__(
             games_service=games_service,
-            modal_prefix=ComponentIds.edit_game_min_guess_modal_prefix,
             input_id=ComponentIds.edit_game_min_guess_input,
             game_update_func=games_service.edit_min_guess,
             is_numeric=True,
@@ -78,10 +75,12 @@ class SubmitEditGameMinGuessRoute(SubmitEditGameRoute):
 
 
 class SubmitEditGameMaxGuessRoute(SubmitEditGameRoute):
+    modal = ComponentIds.edit_game_max_guess_modal
+    route_keys = [modal.route_key()]
+
     def __init__(self, games_service: GamesService):
         super().__init__(
             games_service=games_service,
-            modal_prefix=ComponentIds.edit_game_max_guess_modal_prefix,
             input_id=ComponentIds.edit_game_max_guess_input,
             game_update_func=games_service.edit_max_guess,
             is_numeric=True,
@@ -89,10 +88,12 @@ class SubmitEditGameMaxGuessRoute(SubmitEditGameRoute):
 
 
 class SubmitEditGameDescriptionRoute(SubmitEditGameRoute):
+    modal = ComponentIds.edit_game_description_modal
+    route_keys = [modal.route_key()]
+
     def __init__(self, games_service: GamesService):
         super().__init__(
             games_service=games_service,
-            modal_prefix=ComponentIds.edit_game_description_modal_prefix,
             input_id=ComponentIds.edit_game_description_input,
             game_update_func=games_service.edit_description,
             is_numeric=False,
@@ -1,5 +1,3 @@
-import re
-
 from loguru import logger
 
 from eternal_guesses.model.discord.discord_event import DiscordEvent
@@ -10,31 +8,22 @@ from eternal_guesses.app.component_ids import ComponentIds
 
 
 class SubmitEditGuessRoute(Route):
+    deferred = True
+    route_keys = [ComponentIds.edit_guess_modal.route_key()]
+
     def __init__(
         self,
         guesses_service: GuessesService
     ):
         self.guesses_service = guesses_service
 
-    @staticmethod
-    def matches(event: DiscordEvent) -> bool:
-        if event.modal_submit is None:
-            return False
-
-        modal_id = event.modal_submit.modal_custom_id
-        return (
-            event.modal_submit is not None and
-            modal_id.startswith(ComponentIds.edit_guess_modal_prefix)
-        )
-
     async def call(self, event: DiscordEvent) -> DiscordResponse:
         modal_submit = event.modal_submit
-        matches = re.search(
-            ComponentIds.edit_guess_modal_regex,
+        custom_id = ComponentIds.edit_guess_modal.decode(
             modal_submit.modal_custom_id
         )
-        game_id = matches.group(1)
-        member_id = int(matches.group(2))
+        game_id = custom_id.game_id
+        member_id = custom_id.member_id
         new_guess = modal_submit.inputs[ComponentIds.edit_guess_modal_input_id]
 
         logger.info(f"guild_id={event.guild_id}, user {event.member.user_id} "
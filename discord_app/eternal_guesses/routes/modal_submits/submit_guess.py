@@ -1,8 +1,9 @@
-import re
 from datetime import datetime
 
 from loguru import logger
 
+from eternal_guesses.exceptions import DuplicateGuessError, \
+    GameClosedError, GameNotFoundError
 from eternal_guesses.model.data.game import Game
 from eternal_guesses.model.data.game_guess import GameGuess
 from eternal_guesses.model.discord.discord_event import DiscordEvent
@@ -15,6 +16,9 @@ from eternal_guesses.app.message_provider import MessageProvider
 
 
 class SubmitGuessRoute(Route):
+    deferred = True
+    route_keys = [ComponentIds.submit_guess_modal.route_key()]
+
     def __init__(
         self,
         games_repository: GamesRepository,
@@ -25,62 +29,63 @@ class SubmitGuessRoute(Route):
         self.message_provider = message_provider
         self.game_post_manager = game_post_manager
 
-    @staticmethod
-    def matches(event: DiscordEvent) -> bool:
-        if event.modal_submit is None:
-            return False
-
-        custom_id = event.modal_submit.modal_custom_id
-        return custom_id.startswith(ComponentIds.submit_guess_modal_prefix)
-
     async def call(self, event: DiscordEvent) -> DiscordResponse:
         guild_id = event.guild_id
         user_id = event.member.user_id
         user_nickname = event.member.nickname
 
         modal_id = event.modal_submit.modal_custom_id
-        game_id = re.search(
-            ComponentIds.submit_guess_modal_regex,
+        game_id = ComponentIds.submit_guess_modal.decode(
             modal_id
-        ).group(1)
+        ).game_id
         guess = event.modal_submit.inputs[ComponentIds.submit_guess_input_value]
 
         logger.info(f"guild_id={guild_id}, user {user_id} "
                     f"(nick='{user_nickname}') placed guess {guess} "
                     f"on game {game_id}")
 
-        game = self.games_repository.get(guild_id, game_id)
+        game = self.games_repository.get_without_guesses(guild_id, game_id)
         if game is None:
             error_message = self.message_provider.error_game_not_found(game_id)
             return DiscordResponse.ephemeral_channel_message(
                 content=error_message
             )
 
-        if game.guesses.get(user_id) is not None:
-            error_message = self.message_provider.error_duplicate_guess(game_id)
-            return DiscordResponse.ephemeral_channel_message(error_message)
-
-        if game.closed:
-            error_message = self.message_provider.error_guess_on_closed_game(
-                game_id
-            )
-            return DiscordResponse.ephemeral_channel_message(error_message)
-
         if game.is_numeric():
             if not self.validate_guess(game=game, guess=guess):
                 error_message = self.message_provider.invalid_guess(game)
                 return DiscordResponse.ephemeral_channel_message(error_message)
 
+        # Only the guesses still in the game's item were read, which the
+        # write below can't check
+        if user_id in game.guesses:
+            error_message = self.message_provider.error_duplicate_guess(game_id)
+            return DiscordResponse.ephemeral_channel_message(error_message)
+
         game_guess = GameGuess()
         game_guess.user_id = user_id
         game_guess.user_nickname = user_nickname
         game_guess.timestamp = datetime.now()
         game_guess.guess = guess
 
-        game.guesses[int(user_id)] = game_guess
-        self.games_repository.save(game)
+        # Whether the game is still open and the user hasn't guessed yet is
+        # checked as the guess is written, so that guesses placed at the
+        # same time can't overwrite each other
+        try:
+            self.games_repository.add_guess(game, game_guess)
+        except GameNotFoundError:
+            error_message = self.message_provider.error_game_not_found(game_id)
+            return DiscordResponse.ephemeral_channel_message(error_message)
+        except DuplicateGuessError:
+            error_message = self.message_provider.error_duplicate_guess(game_id)
+            return DiscordResponse.ephemeral_channel_message(error_message)
+        except GameClosedError:
+            error_message = self.message_provider.error_guess_on_closed_game(
+                game_id
+            )
+            return DiscordResponse.ephemeral_channel_message(error_message)
 
-        await self.game_post_manager.update(game)
+        await self.game_post_manager.update_stored(game)
 
         guess_added_message = self.message_provider.guess_added(game_id, guess)
         return DiscordResponse.ephemeral_channel_message(
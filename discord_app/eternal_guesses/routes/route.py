@@ -1,12 +1,20 @@
 from abc import ABC
+from typing import List
 
+from eternal_guesses.app.dispatcher import RouteKey
 from eternal_guesses.model.discord.discord_event import DiscordEvent
 from eternal_guesses.model.discord.discord_response import DiscordResponse
 
 
 class Route(ABC):
-    async def call(self, event: DiscordEvent) -> DiscordResponse:
-        raise NotImplementedError()
+    # Deferred routes are acknowledged right away, and only called afterwards
+    # (see DeferredDispatcher): their slow work, like updating all of a
+    # game's posts, could otherwise take longer than Discord waits for a reply.
+    deferred = False
 
-    def matches(self, event: DiscordEvent) -> bool:
+    # The events this route handles, found without building the route (see
+    # RouteRegistry)
+    route_keys: List[RouteKey] = []
+
+    async def call(self, event: DiscordEvent) -> DiscordResponse:
         raise NotImplementedError()
@@ -1,10 +1,14 @@
-from typing import Optional
+import itertools
+from typing import List, Optional
 
 from loguru import logger
 
 from eternal_guesses.app.game_post_manager import GamePostManager
+from eternal_guesses.app.game_updates import save_with_retry
 from eternal_guesses.exceptions import GameNotFoundError
 from eternal_guesses.model.data.channel_message import ChannelMessage
+from eternal_guesses.model.data.game import Game
+from eternal_guesses.model.data.game_summary import GameSummary
 from eternal_guesses.repositories.games_repository import GamesRepository
 
 
@@ -18,16 +22,10 @@ class GamesService:
         self.games_repository = games_repository
 
     async def close(self, guild_id: int, game_id: str):
-        game = self.games_repository.get(guild_id, game_id)
-        game.closed = True
-        self.games_repository.save(game)
-        await self.game_post_manager.update(game)
+        await self._update(guild_id, game_id, closed=True)
 
     async def reopen(self, guild_id: int, game_id: str):
-        game = self.games_repository.get(guild_id, game_id)
-        game.closed = False
-        self.games_repository.save(game)
-        await self.game_post_manager.update(game)
+        await self._update(guild_id, game_id, closed=False)
 
     async def post(
         self,
@@ -45,26 +43,36 @@ class GamesService:
 
         message_id = await self.game_post_manager.post(game, channel_id)
 
-        if game.channel_messages is None:
-            game.channel_messages = []
+        def add_channel_message(game_to_save: Game):
+            if game_to_save.channel_messages is None:
+                game_to_save.channel_messages = []
+
+            game_to_save.channel_messages.append(
+                ChannelMessage(channel_id, message_id)
+            )
 
-        game.channel_messages.append(ChannelMessage(channel_id, message_id))
-        self.games_repository.save(game)
+        save_with_retry(
+            self.games_repository,
+            game,
+            add_channel_message,
+            save=self.games_repository.save_channel_messages,
+        )
 
-    def list(self, guild_id: int, include_closed: bool):
-        all_games = self.games_repository.get_all(guild_id)
+    def list(
+        self, guild_id: int, include_closed: bool, limit: Optional[int] = None
+    ) -> List[GameSummary]:
+        """
+        Lists the games of a guild by their ids, up to limit of them. Stops
+        reading the guild's games once it has those.
+        """
+        games = self.games_repository.iter_summaries(
+            guild_id, open_only=not include_closed
+        )
 
-        if include_closed:
-            return all_games
-        else:
-            return list(filter(lambda g: not g.closed, all_games))
+        return list(itertools.islice(games, limit))
 
     async def edit_title(self, guild_id: int, game_id: str, new_title: str):
-        game = self.games_repository.get(guild_id, game_id)
-        game.title = new_title
-        self.games_repository.save(game)
-
-        await self.game_post_manager.update(game)
+        await self._update(guild_id, game_id, title=new_title)
 
     async def edit_min_guess(
         self,
@@ -72,11 +80,7 @@ class GamesService:
         game_id: str,
         new_minimum: str
     ):
-        game = self.games_repository.get(guild_id, game_id)
-        game.min_guess = new_minimum
-        self.games_repository.save(game)
-
-        await self.game_post_manager.update(game)
+        await self._update(guild_id, game_id, min_guess=new_minimum)
 
     async def edit_max_guess(
         self,
@@ -84,11 +88,7 @@ class GamesService:
         game_id: str,
         new_maximum: str
     ):
-        game = self.games_repository.get(guild_id, game_id)
-        game.max_guess = new_maximum
-        self.games_repository.save(game)
-
-        await self.game_post_manager.update(game)
+        await self._update(guild_id, game_id, max_guess=new_maximum)
 
     async def edit_description(
         self,
@@ -96,8 +96,11 @@ class GamesService:
         game_id: str,
         new_description: str
     ):
-        game = self.games_repository.get(guild_id, game_id)
-        game.description = new_description
-        self.games_repository.save(game)
+        await self._update(guild_id, game_id, description=new_description)
+
+    async def _update(self, guild_id: int, game_id: str, **fields):
+        game = self.games_repository.update_fields(guild_id, game_id, fields)
+        if game is None:
+            raise GameNotFoundError()
 
         await self.game_post_manager.update(game)
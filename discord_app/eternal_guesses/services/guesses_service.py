@@ -24,7 +24,7 @@ class GuessesService:
             )
 
         game.guesses[member].guess = guess
-        self.games_repository.save(game)
+        self.games_repository.save_guess(game, game.guesses[member])
 
         await self.game_post_manager.update(game)
 
@@ -39,6 +39,6 @@ class GuessesService:
 
         del game.guesses[member]
 
-        self.games_repository.save(game)
+        self.games_repository.delete_guess(game, member)
 
         await self.game_post_manager.update(game)
@@ -0,0 +1,59 @@
+import time
+from typing import Dict
+
+from loguru import logger
+
+from eternal_guesses.app import app_config, injector
+from eternal_guesses.app.post_update_queue import PostUpdateJob, \
+    SqlitePostUpdateQueue
+
+post_update_worker = None
+
+
+def handle_lambda(event, context) -> Dict:
+    """Handles a batch of post update jobs from SQS."""
+    jobs_by_message_id = {
+        record['messageId']: PostUpdateJob.from_json(record['body'])
+        for record in event['Records']
+    }
+
+    failed_jobs = injector.event_loop().run(
+        get_post_update_worker().process(jobs_by_message_id.values())
+    )
+
+    # Only the failed jobs are retried, not the whole batch
+    return {
+        'batchItemFailures': [
+            {'itemIdentifier': message_id}
+            for message_id, job in jobs_by_message_id.items()
+            if job in failed_jobs
+        ]
+    }
+
+
+def get_post_update_worker():
+    global post_update_worker
+
+    if post_update_worker is None:
+        post_update_worker = injector.post_update_worker()
+
+    return post_update_worker
+
+
+def run_local(poll_seconds: float = 1):
+    """Works through the jobs of a local (SQLite) queue, until interrupted."""
+    queue = SqlitePostUpdateQueue(app_config.post_update_queue_path())
+    worker = get_post_update_worker()
+    event_loop = injector.event_loop()
+
+    logger.info(f"working through post updates in {queue.path}")
+    while True:
+        jobs = queue.receive()
+        if jobs:
+            event_loop.run(worker.process(jobs))
+        else:
+            time.sleep(poll_seconds)
+
+
+if __name__ == '__main__':
+    run_local()
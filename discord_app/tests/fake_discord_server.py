@@ -0,0 +1,155 @@
+import time
+from collections import Counter
+from typing import Tuple
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+API_PREFIX = "/api/v10"
+
+
+class FakeDiscordServer:
+    """
+    A local stand-in for Discord's REST API, which keeps track of the posted
+    messages and counts the requests it receives per operation.
+
+        async with FakeDiscordServer() as server:
+            messaging = DiscordRestMessaging(session, server.api_base_url)
+
+    With a rate_limit of (limit, seconds), it enforces rate limits like
+    Discord does: per operation and channel, with X-RateLimit-* headers on
+    every response and a 429 for requests over the limit.
+    """
+
+    def __init__(self, rate_limit: Tuple[int, float] = None):
+        self.requests = Counter()
+        self.messages = {}
+        self.interaction_responses = {}
+        self.next_message_id = 1000
+
+        self.rate_limit = rate_limit
+        self.rate_limit_windows = {}
+
+        app = web.Application(middlewares=[self._enforce_rate_limits])
+        app.router.add_post(
+            API_PREFIX + "/channels/{channel_id}/messages",
+            self._create_message,
+            name='create_message',
+        )
+        app.router.add_patch(
+            API_PREFIX + "/channels/{channel_id}/messages/{message_id}",
+            self._edit_message,
+            name='edit_message',
+        )
+        app.router.add_patch(
+            API_PREFIX + "/webhooks/{application_id}/{token}/messages/@original",
+            self._edit_interaction_response,
+            name='edit_interaction_response',
+        )
+        self._server = TestServer(app)
+
+    @property
+    def api_base_url(self) -> str:
+        return str(self._server.make_url(API_PREFIX))
+
+    def add_message(self, channel_id: int, message_id: int, payload=None):
+        self.messages[(channel_id, message_id)] = payload or {}
+
+    def delete_message(self, channel_id: int, message_id: int):
+        del self.messages[(channel_id, message_id)]
+
+    async def __aenter__(self):
+        await self._server.start_server()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self._server.close()
+
+    @web.middleware
+    async def _enforce_rate_limits(self, request: web.Request, handler):
+        if self.rate_limit is None:
+            return await handler(request)
+
+        limit, seconds = self.rate_limit
+        operation = request.match_info.route.name
+        major_parameter = request.match_info.get(
+            'channel_id', request.match_info.get('token')
+        )
+
+        now = time.monotonic()
+        window_start, count = self.rate_limit_windows.get(
+            (operation, major_parameter), (now, 0)
+        )
+        if now - window_start >= seconds:
+            window_start, count = now, 0
+
+        reset_after = seconds - (now - window_start)
+        headers = {
+            'X-RateLimit-Bucket': f"{operation}-bucket",
+            'X-RateLimit-Limit': str(limit),
+            'X-RateLimit-Reset-After': f"{reset_after:.3f}",
+        }
+
+        if count >= limit:
+            self.requests['rate_limited'] += 1
+            headers['X-RateLimit-Remaining'] = "0"
+            return web.json_response(
+                {
+                    'message': 'You are being rate limited.',
+                    'retry_after': reset_after,
+                    'global': False,
+                },
+                status=429,
+                headers=headers,
+            )
+
+        count += 1
+        self.rate_limit_windows[(operation, major_parameter)] = \
+            (window_start, count)
+        headers['X-RateLimit-Remaining'] = str(limit - count)
+
+        response = await handler(request)
+        response.headers.update(headers)
+        return response
+
+    async def _create_message(self, request: web.Request):
+        self.requests['create_message'] += 1
+
+        channel_id = int(request.match_info['channel_id'])
+        message_id = self.next_message_id
+        self.next_message_id += 1
+
+        payload = await request.json()
+        self.messages[(channel_id, message_id)] = payload
+
+        return web.json_response(
+            {'id': str(message_id), 'channel_id': str(channel_id), **payload}
+        )
+
+    async def _edit_message(self, request: web.Request):
+        self.requests['edit_message'] += 1
+
+        channel_id = int(request.match_info['channel_id'])
+        message_id = int(request.match_info['message_id'])
+        if (channel_id, message_id) not in self.messages:
+            return web.json_response(
+                {'message': 'Unknown Message', 'code': 10008},
+                status=404,
+            )
+
+        payload = await request.json()
+        self.messages[(channel_id, message_id)].update(payload)
+
+        return web.json_response(
+            {'id': str(message_id), 'channel_id': str(channel_id),
+             **self.messages[(channel_id, message_id)]}
+        )
+
+    async def _edit_interaction_response(self, request: web.Request):
+        self.requests['edit_interaction_response'] += 1
+
+        token = request.match_info['token']
+        payload = await request.json()
+        self.interaction_responses[token] = payload
+
+        return web.json_response(payload)
@@ -1,35 +1,44 @@
-from typing import List, Optional
-
-import discord
+import asyncio
+from typing import Any, Dict, Iterator, List, Optional
 
+from eternal_guesses.exceptions import DiscordNotFoundError, \
+    DuplicateGameError, DuplicateGuessError, GameClosedError, \
+    GameNotFoundError, GameVersionConflictError
 from eternal_guesses.model.data.game import Game
+from eternal_guesses.model.data.game_guess import GameGuess
+from eternal_guesses.model.data.game_summary import GameSummary
 from eternal_guesses.model.data.guild_config import GuildConfig
+from eternal_guesses.model.discord.discord_component import ActionRow
+from eternal_guesses.model.discord.discord_embed import DiscordEmbed
 from eternal_guesses.model.discord.discord_member import DiscordMember
+from eternal_guesses.model.discord.discord_response import DiscordResponse
 from eternal_guesses.repositories.games_repository import GamesRepository
+from eternal_guesses.repositories.post_update_schedule_repository import \
+    PostUpdateScheduleRepository
 from eternal_guesses.app.discord_messaging import DiscordMessaging
 from eternal_guesses.app.message_provider import MessageProvider
 
 
-class FakeNotFound(discord.NotFound):
-    def __init__(self):
-        pass
-
-
 class FakeDiscordMessaging(DiscordMessaging):
-    def __init__(self):
+    def __init__(self, delay_seconds: float = 0):
+        self.delay_seconds = delay_seconds
+        self.in_flight = 0
+        self.max_in_flight = 0
+
         self.updated_channel_messages = []
         self.sent_dms = []
         self.sent_channel_messages = []
         self.sent_temp_messages = []
         self.created_channel_message_id = 0
         self.deleted_messages = []
+        self.edited_interaction_responses = []
 
     async def send_channel_message(
         self,
         channel_id: int,
         text: str = None,
-        embed: discord.Embed = None,
-        view: discord.ui.View = None
+        embed: DiscordEmbed = None,
+        action_rows: List[ActionRow] = None
     ) -> int:
         obj = {
             'channel_id': channel_id
@@ -41,8 +50,8 @@ class FakeDiscordMessaging(DiscordMessaging):
         if embed is not None:
             obj['embed'] = embed
 
-        if view is not None:
-            obj['view'] = view
+        if action_rows is not None:
+            obj['action_rows'] = action_rows
 
         self.sent_channel_messages.append(obj)
 
@@ -50,10 +59,17 @@ class FakeDiscordMessaging(DiscordMessaging):
 
     async def update_channel_message(
         self, channel_id: int, message_id: int, text: str = None,
-        embed: discord.Embed = None, view: discord.ui.View = None
+        embed: DiscordEmbed = None, action_rows: List[ActionRow] = None
     ):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay_seconds)
+        finally:
+            self.in_flight -= 1
+
         if message_id in self.deleted_messages:
-            raise FakeNotFound()
+            raise DiscordNotFoundError(status=404)
         else:
             obj = {
                 'channel_id': channel_id,
@@ -64,11 +80,22 @@ class FakeDiscordMessaging(DiscordMessaging):
                 obj['text'] = text
             if embed is not None:
                 obj['embed'] = embed
-            if view is not None:
-                obj['view'] = view
+            if action_rows is not None:
+                obj['action_rows'] = action_rows
 
             self.updated_channel_messages.append(obj)
 
+    async def edit_interaction_response(
+        self, application_id: int, token: str, response: DiscordResponse
+    ):
+        self.edited_interaction_responses.append(
+            {
+                'application_id': application_id,
+                'token': token,
+                'response': response,
+            }
+        )
+
     async def send_dm(self, member: DiscordMember, text: str):
         self.sent_dms.append(
             {
@@ -88,23 +115,124 @@ class FakeGamesRepository(GamesRepository):
 
         self.games = games
 
-    def get(self, guild_id: int, game_id: str) -> Optional[Game]:
-        for game in self.games:
-            if game.guild_id == guild_id and game.game_id == game_id:
-                return game
+    def get(
+        self, guild_id: int, game_id: str, consistent_read: bool = False
+    ) -> Optional[Game]:
+        return self._stored(guild_id, game_id)
 
-        return None
+    def get_without_guesses(
+        self, guild_id: int, game_id: str
+    ) -> Optional[Game]:
+        return self._stored(guild_id, game_id)
+
+    def create(self, game: Game):
+        if self._stored(game.guild_id, game.game_id) is not None:
+            raise DuplicateGameError()
+
+        game.version = 1
+        self.games.append(game)
 
     def save(self, game: Game):
+        saved_game = self._stored(game.guild_id, game.game_id)
+        if saved_game is not None and saved_game is not game and \
+                saved_game.version != game.version:
+            raise GameVersionConflictError()
+
+        game.version = (game.version or 0) + 1
+
         for g in self.games:
             if g.game_id == game.game_id:
                 self.games.remove(g)
 
         self.games.append(game)
 
+    def save_channel_messages(self, game: Game):
+        self.save(game)
+
+    def update_fields(
+        self, guild_id: int, game_id: str, fields: Dict[str, Any]
+    ) -> Optional[Game]:
+        saved_game = self._stored(guild_id, game_id)
+        if saved_game is None:
+            return None
+
+        for field, value in fields.items():
+            setattr(saved_game, field, value)
+
+        return saved_game
+
+    def add_guess(self, game: Game, game_guess: GameGuess):
+        saved_game = self._stored(game.guild_id, game.game_id)
+        if saved_game is None:
+            raise GameNotFoundError()
+        if saved_game.closed:
+            raise GameClosedError()
+        if game_guess.user_id in saved_game.guesses:
+            raise DuplicateGuessError()
+
+        saved_game.guesses[game_guess.user_id] = game_guess
+        game.guesses[game_guess.user_id] = game_guess
+
+    def save_guess(self, game: Game, game_guess: GameGuess):
+        saved_game = self._stored(game.guild_id, game.game_id)
+        saved_game.guesses[game_guess.user_id] = game_guess
+
+    def delete_guess(self, game: Game, user_id: int):
+        saved_game = self._stored(game.guild_id, game.game_id)
+        saved_game.guesses.pop(user_id, None)
+
     def get_all(self, guild_id: int) -> List[Game]:
         return self.games
 
+    def iter_games(
+        self,
+        guild_id: int,
+        page_size: Optional[int] = None,
+        after: Optional[str] = None,
+    ) -> Iterator[Game]:
+        for game in sorted(self.games, key=lambda g: g.game_id):
+            if after is None or game.game_id > after:
+                yield game
+
+    def get_summaries(self, guild_id: int) -> List[GameSummary]:
+        return list(self.iter_summaries(guild_id))
+
+    def iter_summaries(
+        self,
+        guild_id: int,
+        page_size: Optional[int] = None,
+        after: Optional[str] = None,
+        open_only: bool = False,
+    ) -> Iterator[GameSummary]:
+        for game in self.iter_games(guild_id, page_size, after):
+            if open_only and game.closed:
+                continue
+
+            yield GameSummary(guild_id=game.guild_id, game_id=game.game_id,
+                              title=game.title, closed=game.closed)
+
+    def _stored(self, guild_id: int, game_id: str) -> Optional[Game]:
+        for game in self.games:
+            if game.guild_id == guild_id and game.game_id == game_id:
+                return game
+
+        return None
+
+
+class FakePostUpdateScheduleRepository(PostUpdateScheduleRepository):
+    def __init__(self):
+        self.claimed = set()
+
+    def claim(self, guild_id: int, game_id: str, seconds: float) -> bool:
+        if (guild_id, game_id) in self.claimed:
+            return False
+
+        self.claimed.add((guild_id, game_id))
+        return True
+
+    def release(self, guild_id: int, game_id: str):
+        self.claimed.discard((guild_id, game_id))
+
 
 class FakeMessageProvider(MessageProvider):
     def error_guess_not_found(self, game_id: str, member_id: int) -> str:
@@ -128,10 +256,10 @@ class FakeMessageProvider(MessageProvider):
     def modal_title_place_guess(self, game: Game) -> str:
         pass
 
-    def game_post_view(self, game: Game) -> discord.ui.View:
+    def game_post_action_rows(self, game: Game) -> List[ActionRow]:
         pass
 
-    def game_post_embed(self, game: Game) -> discord.Embed:
+    def game_post_embed(self, game: Game) -> DiscordEmbed:
         pass
 
     def game_managed_channel_message(self, game: Game) -> str:
@@ -1,8 +1,7 @@
 import os
-from typing import Dict
+from typing import List
 
 import boto3
-import discord
 import docker
 import opnieuw
 import pytest
@@ -12,6 +11,9 @@ from loguru import logger
 from eternal_guesses.app.api_authorizer import ApiAuthorizer, \
     AuthorizationResult
 from eternal_guesses.app.discord_messaging import DiscordMessaging
+from eternal_guesses.app.ingress import InteractionRequest
+from eternal_guesses.model.discord.discord_component import ActionRow
+from eternal_guesses.model.discord.discord_embed import DiscordEmbed
 from eternal_guesses.model.discord.discord_member import DiscordMember
 from eternal_guesses.model.lambda_response import LambdaResponse
 
@@ -82,6 +84,29 @@ def _create_table(dynamodb, table_name):
                 "AttributeName": "sk",
                 "AttributeType": "S",
             },
+            {
+                "AttributeName": "open_pk",
+                "AttributeType": "S",
+            },
+        ],
+        GlobalSecondaryIndexes=[
+            {
+                "IndexName": "open-games",
+                "KeySchema": [
+                    {
+                        "AttributeName": "open_pk",
+                        "KeyType": "HASH",
+                    },
+                    {
+                        "AttributeName": "sk",
+                        "KeyType": "RANGE",
+                    },
+                ],
+                "Projection": {
+                    "ProjectionType": "INCLUDE",
+                    "NonKeyAttributes": ["title", "closed"],
+                },
+            },
         ],
     )
 
@@ -108,8 +133,9 @@ def eternal_guesses_table(dynamodb_resource, monkeypatch):
 @pytest.fixture(autouse=True)
 def fixed_authorization_result(mocker):
     class PassingTestAuthorizer(ApiAuthorizer):
-        def authorize(self, event: Dict) -> (AuthorizationResult,
-                                             LambdaResponse):
+        def authorize(self, request: InteractionRequest) -> (
+            AuthorizationResult, LambdaResponse
+        ):
             return AuthorizationResult.PASS, None
 
     test_authorizer = PassingTestAuthorizer()
@@ -124,20 +150,21 @@ def stub_discord_messaging(mocker):
     class SilentDiscordMessaging(DiscordMessaging):
         async def send_channel_message(
             self, channel_id: int, text: str = None,
-            embed: discord.Embed = None, view: discord.ui.View = None
+            embed: DiscordEmbed = None, action_rows: List[ActionRow] = None
         ) -> int:
             logger.info(
-                f"[stub send_channel_message] channel_id={channel_id}, text={text}, embed={embed}, view={view}"
+                f"[stub send_channel_message] channel_id={channel_id}, text={text}, embed={embed}, "
+                f"action_rows={action_rows}"
             )
             return 1
 
         async def update_channel_message(
             self, channel_id: int, message_id: int, text: str = None,
-            embed: discord.Embed = None, view: discord.ui.View = None
+            embed: DiscordEmbed = None, action_rows: List[ActionRow] = None
         ):
             logger.info(
                 f"[stub update_channel_emssage] channel_id={channel_id}, message_id={message_id} text={text},"
-                f"embed={embed}, view={view}"
+                f"embed={embed}, action_rows={action_rows}"
             )
             pass
 
@@ -149,7 +176,7 @@ def stub_discord_messaging(mocker):
 
     silent_discord_messaging = SilentDiscordMessaging()
     mocker.patch(
-        'eternal_guesses.app.injector.DiscordMessagingImpl',
+        'eternal_guesses.app.injector.DiscordRestMessaging',
         return_value=silent_discord_messaging
     )
 
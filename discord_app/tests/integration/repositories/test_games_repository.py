@@ -1,4 +1,14 @@
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from eternal_guesses import json_codec
+from eternal_guesses.app.game_updates import save_with_retry
+from eternal_guesses.exceptions import DuplicateGameError, \
+    DuplicateGuessError, GameClosedError, GameNotFoundError, GameVersionConflictError
 
 from eternal_guesses.model.data.channel_message import ChannelMessage
 from eternal_guesses.model.data.game import Game
@@ -77,14 +87,6 @@ def test_get_game(eternal_guesses_table):
         description=description,
         min_guess=min_guess,
         max_guess=max_guess,
-        guesses={
-            user_id: GameGuess(
-                user_id=user_id,
-                nickname=user_nickname,
-                guess=guess_answer,
-                timestamp=guess_timestamp
-            )
-        },
         channel_messages=[
             ChannelMessage(
                 channel_id=message_channel_id,
@@ -95,6 +97,12 @@ def test_get_game(eternal_guesses_table):
 
     # When
     games_repository.save(game)
+    games_repository.save_guess(game, GameGuess(
+        user_id=user_id,
+        nickname=user_nickname,
+        guess=guess_answer,
+        timestamp=guess_timestamp
+    ))
     retrieved_game = games_repository.get(guild_id, game_id)
 
     # Then
@@ -178,19 +186,17 @@ def test_get_all_games(eternal_guesses_table):
         game_id=game_2_id,
         created_by=game_2_created_by,
         create_datetime=game_2_create_datetime,
-        guesses={
-            game_2_guess_user_id: GameGuess(
-                user_id=game_2_guess_user_id,
-                nickname=game_2_guess_user_nick,
-                guess=game_2_guess_answer,
-                timestamp=game_2_guess_timestamp
-            )
-        }
     )
 
     # When
     games_repository.save(game_1)
     games_repository.save(game_2)
+    games_repository.save_guess(game_2, GameGuess(
+        user_id=game_2_guess_user_id,
+        nickname=game_2_guess_user_nick,
+        guess=game_2_guess_answer,
+        timestamp=game_2_guess_timestamp
+    ))
     games = games_repository.get_all(guild_id)
 
     # Then
@@ -235,3 +241,887 @@ def test_get_all_games(eternal_guesses_table):
     assert game_guess.nickname == game_2_guess_user_nick
     assert game_guess.guess == game_2_guess_answer
     assert game_guess.timestamp == game_2_guess_timestamp
+
+
+def test_save_channel_messages_keeps_the_rest_of_the_game(
+    eternal_guesses_table
+):
+    # Given
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    game = Game(
+        guild_id=1,
+        game_id='game-1',
+        created_by=10,
+        channel_messages=[ChannelMessage(channel_id=100, message_id=200)],
+    )
+    games_repository.save(game)
+    read_game = games_repository.get(1, 'game-1')
+    games_repository.save_guess(game, GameGuess(
+        user_id=20, nickname='nick', guess='42', timestamp=datetime.now()
+    ))
+
+    # When: the copy read before the guess gets its messages' hashes saved
+    read_game.channel_messages[0].content_hash = 'abc123'
+    games_repository.save_channel_messages(read_game)
+    retrieved_game = games_repository.get(1, 'game-1')
+
+    # Then
+    assert 20 in retrieved_game.guesses
+    assert retrieved_game.channel_messages[0].content_hash == 'abc123'
+
+
+def test_save_channel_messages_of_deleted_game_does_nothing(
+    eternal_guesses_table
+):
+    # Given
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    game = Game(guild_id=1, game_id='game-1', created_by=10,
+                channel_messages=[], version=3)
+
+    # When
+    with pytest.raises(GameVersionConflictError):
+        games_repository.save_channel_messages(game)
+
+    # Then
+    assert games_repository.get(1, 'game-1') is None
+
+
+def test_save_guess_writes_only_its_own_item(eternal_guesses_table):
+    # Given
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    game = Game(guild_id=1, game_id='game-1', created_by=10, title='Title')
+    games_repository.save(game)
+
+    # When
+    games_repository.save_guess(game, GameGuess(
+        user_id=20, nickname='nick', guess='42', timestamp=datetime.now()
+    ))
+    games_repository.save_guess(game, GameGuess(
+        user_id=30, guess='43', timestamp=datetime.now()
+    ))
+
+    # Then
+    items = eternal_guesses_table.scan()['Items']
+    assert sorted(item['sk'] for item in items) == [
+        'GAME#game-1',
+        'GAME#game-1#GUESS#20',
+        'GAME#game-1#GUESS#30',
+    ]
+
+    game_item = next(item for item in items if item['sk'] == 'GAME#game-1')
+    assert 'guesses' not in game_item
+
+    retrieved_game = games_repository.get(1, 'game-1')
+    assert retrieved_game.title == 'Title'
+    assert retrieved_game.guesses[20].nickname == 'nick'
+    assert retrieved_game.guesses[30].guess == '43'
+    assert retrieved_game.guesses[30].nickname is None
+
+
+def test_save_keeps_the_guesses(eternal_guesses_table):
+    # Given
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    game = Game(guild_id=1, game_id='game-1', created_by=10)
+    games_repository.save(game)
+    games_repository.save_guess(game, GameGuess(
+        user_id=20, guess='42', timestamp=datetime.now()
+    ))
+
+    # When
+    game.closed = True
+    games_repository.save(game)
+    retrieved_game = games_repository.get(1, 'game-1')
+
+    # Then
+    assert retrieved_game.closed is True
+    assert 20 in retrieved_game.guesses
+
+
+def test_delete_guess(eternal_guesses_table):
+    # Given
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    game = Game(guild_id=1, game_id='game-1', created_by=10)
+    games_repository.save(game)
+    for user_id in [20, 30]:
+        games_repository.save_guess(game, GameGuess(
+            user_id=user_id, guess='42', timestamp=datetime.now()
+        ))
+
+    # When
+    games_repository.delete_guess(game, 20)
+    retrieved_game = games_repository.get(1, 'game-1')
+
+    # Then
+    assert list(retrieved_game.guesses.keys()) == [30]
+
+
+def test_get_leaves_out_games_with_a_longer_id(eternal_guesses_table):
+    # Given
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    for game_id in ['game-1', 'game-10', 'game-1-b']:
+        game = Game(guild_id=1, game_id=game_id, created_by=10)
+        games_repository.save(game)
+        games_repository.save_guess(game, GameGuess(
+            user_id=20, guess=game_id, timestamp=datetime.now()
+        ))
+
+    # When
+    game = games_repository.get(1, 'game-1')
+    games = games_repository.get_all(1)
+
+    # Then
+    assert game.guesses[20].guess == 'game-1'
+    assert sorted(g.game_id for g in games) == ['game-1', 'game-1-b',
+                                                'game-10']
+    for g in games:
+        assert g.guesses[20].guess == g.game_id
+
+
+def _put_legacy_game(eternal_guesses_table, user_ids, timestamp):
+    """A game saved with all of its guesses in its own item."""
+    eternal_guesses_table.put_item(Item={
+        'pk': 'GUILD#1',
+        'sk': 'GAME#game-1',
+        'created_by': 10,
+        'closed': False,
+        'version': 3,
+        'guesses': json_codec.dumps({
+            user_id: {
+                'user_id': user_id,
+                'nickname': 'nick',
+                'guess': f'guess {user_id}',
+                'timestamp': timestamp.isoformat(),
+            }
+            for user_id in user_ids
+        }),
+    })
+
+
+def test_get_reads_guesses_still_in_the_game_item(eternal_guesses_table):
+    # Given: a game saved with all of its guesses in its own item
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    timestamp = datetime(2021, 2, 3, 10, 10, 10)
+    _put_legacy_game(eternal_guesses_table, [20, 30], timestamp)
+
+    # ... with a guess that was edited since
+    game = Game(guild_id=1, game_id='game-1')
+    games_repository.save_guess(game, GameGuess(
+        user_id=30, guess='edited', timestamp=timestamp
+    ))
+    items_before = eternal_guesses_table.scan()['Items']
+
+    # When
+    retrieved_game = games_repository.get(1, 'game-1')
+
+    # Then
+    assert retrieved_game.guesses[20].guess == 'guess 20'
+    assert retrieved_game.guesses[20].nickname == 'nick'
+    assert retrieved_game.guesses[20].timestamp == timestamp
+    assert retrieved_game.guesses[30].guess == 'edited'
+
+    # And reading didn't write anything
+    assert eternal_guesses_table.scan()['Items'] == items_before
+
+
+def test_get_without_guesses_reads_guesses_still_in_the_game_item(
+    eternal_guesses_table
+):
+    # Given
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    timestamp = datetime(2021, 2, 3, 10, 10, 10)
+    _put_legacy_game(eternal_guesses_table, [20, 30], timestamp)
+
+    # ... and a guess with an item of its own
+    game = Game(guild_id=1, game_id='game-1')
+    games_repository.add_guess(game, GameGuess(
+        user_id=40, guess='new', timestamp=timestamp
+    ))
+
+    # When
+    retrieved_game = games_repository.get_without_guesses(1, 'game-1')
+
+    # Then only the guesses in the game's item are read
+    assert sorted(retrieved_game.guesses) == [20, 30]
+
+
+def test_save_keeps_guesses_still_in_the_game_item(eternal_guesses_table):
+    # Given
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    _put_legacy_game(eternal_guesses_table, [20, 30], datetime.now())
+
+    # When
+    game = games_repository.get(1, 'game-1')
+    game.title = 'A new title'
+    games_repository.save(game)
+
+    # Then
+    retrieved_game = games_repository.get(1, 'game-1')
+    assert retrieved_game.title == 'A new title'
+    assert sorted(retrieved_game.guesses) == [20, 30]
+
+
+def test_migrate_guesses(eternal_guesses_table):
+    # Given: a game with its guesses in its own item, one of them edited
+    # since, and a game that never had any there
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    timestamp = datetime(2021, 2, 3, 10, 10, 10)
+    _put_legacy_game(eternal_guesses_table, [20, 30], timestamp)
+    game = Game(guild_id=1, game_id='game-1')
+    games_repository.save_guess(game, GameGuess(
+        user_id=30, guess='edited', timestamp=timestamp
+    ))
+    games_repository.create(Game(guild_id=1, game_id='game-2', created_by=10))
+
+    # When
+    guess_count = games_repository.migrate_guesses()
+
+    # Then the guesses without an item were moved into one
+    assert guess_count == 1
+    items = eternal_guesses_table.scan()['Items']
+    assert sorted(item['sk'] for item in items) == [
+        'GAME#game-1',
+        'GAME#game-1#GUESS#20',
+        'GAME#game-1#GUESS#30',
+        'GAME#game-2',
+    ]
+    assert not any('guesses' in item for item in items)
+
+    retrieved_game = games_repository.get(1, 'game-1')
+    assert retrieved_game.guesses[20].guess == 'guess 20'
+    assert retrieved_game.guesses[20].timestamp == timestamp
+    assert retrieved_game.guesses[30].guess == 'edited'
+
+    # And running it again changes nothing
+    assert games_repository.migrate_guesses() == 0
+
+
+def test_delete_guess_still_in_the_game_item(eternal_guesses_table):
+    # Given: a game with its guesses still in its own item
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    _put_legacy_game(eternal_guesses_table, [20, 30], datetime.now())
+    game = games_repository.get(1, 'game-1')
+
+    # When
+    games_repository.delete_guess(game, 20)
+
+    # Then the guess is gone, and the other one was kept
+    retrieved_game = games_repository.get(1, 'game-1')
+    assert sorted(retrieved_game.guesses) == [30]
+
+
+def test_add_guess(eternal_guesses_table):
+    # Given
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    game = Game(guild_id=1, game_id='game-1', created_by=10)
+    games_repository.save(game)
+
+    # When
+    games_repository.add_guess(game, GameGuess(
+        user_id=20, nickname='nick', guess='42', timestamp=datetime.now()
+    ))
+
+    # Then
+    assert game.guesses[20].guess == '42'
+    assert games_repository.get(1, 'game-1').guesses[20].guess == '42'
+
+
+def test_add_guess_to_unknown_game(eternal_guesses_table):
+    # Given
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    game = Game(guild_id=1, game_id='game-1', created_by=10)
+
+    # When
+    with pytest.raises(GameNotFoundError):
+        games_repository.add_guess(game, GameGuess(
+            user_id=20, guess='42', timestamp=datetime.now()
+        ))
+
+    # Then
+    assert eternal_guesses_table.scan()['Items'] == []
+
+
+def test_add_guess_to_closed_game(eternal_guesses_table):
+    # Given
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    game = Game(guild_id=1, game_id='game-1', created_by=10, closed=True)
+    games_repository.save(game)
+
+    # When
+    with pytest.raises(GameClosedError):
+        games_repository.add_guess(game, GameGuess(
+            user_id=20, guess='42', timestamp=datetime.now()
+        ))
+
+    # Then
+    assert games_repository.get(1, 'game-1').guesses == {}
+
+
+def test_add_guess_twice(eternal_guesses_table):
+    # Given
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    game = Game(guild_id=1, game_id='game-1', created_by=10)
+    games_repository.save(game)
+    games_repository.add_guess(game, GameGuess(
+        user_id=20, guess='42', timestamp=datetime.now()
+    ))
+
+    # When
+    with pytest.raises(DuplicateGuessError):
+        games_repository.add_guess(game, GameGuess(
+            user_id=20, guess='43', timestamp=datetime.now()
+        ))
+
+    # Then
+    assert games_repository.get(1, 'game-1').guesses[20].guess == '42'
+
+
+def test_add_guesses_at_the_same_time(eternal_guesses_table):
+    # Given
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    game = Game(guild_id=1, game_id='game-1', created_by=10)
+    games_repository.save(game)
+
+    user_ids = list(range(1000, 1300))
+    # ... with the first user guessing many times over
+    user_ids += [1000] * 50
+
+    def add_guess(user_id: int):
+        try:
+            games_repository.add_guess(
+                Game(guild_id=1, game_id='game-1'),
+                GameGuess(user_id=user_id, guess=str(user_id),
+                          timestamp=datetime.now()),
+            )
+            return True
+        except DuplicateGuessError:
+            return False
+
+    # When
+    with ThreadPoolExecutor(max_workers=20) as executor:
+        added = list(executor.map(add_guess, user_ids))
+
+    # Then every user's guess is there, once
+    assert added.count(True) == 300
+    assert added.count(False) == 50
+
+    guesses = games_repository.get(1, 'game-1').guesses
+    assert sorted(guesses.keys()) == list(range(1000, 1300))
+
+
+def test_update_fields(eternal_guesses_table):
+    # Given
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    game = Game(guild_id=1, game_id='game-1', created_by=10, title='Title',
+                description='Description', closed=False)
+    games_repository.save(game)
+    games_repository.save_guess(game, GameGuess(
+        user_id=20, guess='42', timestamp=datetime.now()
+    ))
+
+    # When
+    close_datetime = datetime(2021, 1, 5, 8, 6, 3)
+    updated_game = games_repository.update_fields(1, 'game-1', {
+        'closed': True,
+        'close_datetime': close_datetime,
+        'description': None,
+    })
+
+    # Then
+    assert updated_game.closed is True
+    assert updated_game.close_datetime == close_datetime
+    assert updated_game.description == ''
+    assert updated_game.title == 'Title'
+    assert updated_game.created_by == 10
+    assert updated_game.guesses[20].guess == '42'
+
+    retrieved_game = games_repository.get(1, 'game-1')
+    assert retrieved_game.closed is True
+    assert retrieved_game.close_datetime == close_datetime
+    assert retrieved_game.description == ''
+    assert 20 in retrieved_game.guesses
+
+
+def test_update_fields_keeps_guesses_added_since_a_read(
+    eternal_guesses_table
+):
+    # Given
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    game = Game(guild_id=1, game_id='game-1', created_by=10)
+    games_repository.save(game)
+    read_game = games_repository.get(1, 'game-1')
+
+    games_repository.add_guess(game, GameGuess(
+        user_id=20, guess='42', timestamp=datetime.now()
+    ))
+
+    # When
+    games_repository.update_fields(read_game.guild_id, read_game.game_id, {
+        'title': 'New title',
+    })
+
+    # Then
+    retrieved_game = games_repository.get(1, 'game-1')
+    assert retrieved_game.title == 'New title'
+    assert 20 in retrieved_game.guesses
+
+
+def test_update_fields_of_unknown_game(eternal_guesses_table):
+    # Given
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+
+    # When
+    updated_game = games_repository.update_fields(1, 'game-1', {
+        'title': 'Title',
+    })
+
+    # Then
+    assert updated_game is None
+    assert eternal_guesses_table.scan()['Items'] == []
+
+
+def test_update_unknown_fields(eternal_guesses_table):
+    # Given
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    games_repository.save(Game(guild_id=1, game_id='game-1', created_by=10))
+
+    # When
+    with pytest.raises(ValueError):
+        games_repository.update_fields(1, 'game-1', {'created_by': 20})
+
+
+def test_save_counts_up_the_version(eternal_guesses_table):
+    # Given
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    game = Game(guild_id=1, game_id='game-1', created_by=10)
+
+    # When
+    games_repository.save(game)
+    games_repository.save(game)
+
+    # Then
+    assert game.version == 2
+    assert games_repository.get(1, 'game-1').version == 2
+
+
+def test_save_stale_copy(eternal_guesses_table):
+    # Given
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    games_repository.save(Game(guild_id=1, game_id='game-1', created_by=10))
+    game = games_repository.get(1, 'game-1')
+    stale_game = games_repository.get(1, 'game-1')
+
+    game.title = 'New title'
+    games_repository.save(game)
+
+    # When
+    stale_game.description = 'New description'
+    with pytest.raises(GameVersionConflictError):
+        games_repository.save(stale_game)
+    with pytest.raises(GameVersionConflictError):
+        games_repository.save_channel_messages(stale_game)
+
+    # Then
+    retrieved_game = games_repository.get(1, 'game-1')
+    assert retrieved_game.title == 'New title'
+    assert retrieved_game.description == ''
+
+
+def test_save_new_game_over_existing_game(eternal_guesses_table):
+    # Given
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    games_repository.save(Game(guild_id=1, game_id='game-1', created_by=10))
+
+    # When
+    with pytest.raises(GameVersionConflictError):
+        games_repository.save(
+            Game(guild_id=1, game_id='game-1', created_by=20)
+        )
+
+    # Then
+    assert games_repository.get(1, 'game-1').created_by == 10
+
+
+def test_save_game_saved_before_versions(eternal_guesses_table):
+    # Given
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    eternal_guesses_table.put_item(Item={
+        'pk': 'GUILD#1',
+        'sk': 'GAME#game-1',
+        'created_by': 10,
+        'closed': False,
+    })
+    game = games_repository.get(1, 'game-1')
+
+    # When
+    game.title = 'Title'
+    games_repository.save(game)
+
+    # Then
+    retrieved_game = games_repository.get(1, 'game-1')
+    assert retrieved_game.title == 'Title'
+    assert retrieved_game.version == 1
+
+
+def test_update_fields_counts_up_the_version(eternal_guesses_table):
+    # Given
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    games_repository.save(Game(guild_id=1, game_id='game-1', created_by=10))
+    stale_game = games_repository.get(1, 'game-1')
+
+    # When
+    updated_game = games_repository.update_fields(1, 'game-1', {
+        'closed': True,
+    })
+
+    # Then
+    assert updated_game.version == 2
+    with pytest.raises(GameVersionConflictError):
+        games_repository.save(stale_game)
+
+
+def test_no_writes_are_lost_under_contention(eternal_guesses_table):
+    # Given
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    games_repository.save(Game(guild_id=1, game_id='game-1', created_by=10))
+
+    message_ids = list(range(50))
+
+    def add_channel_message(message_id: int):
+        def mutation(game: Game):
+            game.channel_messages.append(
+                ChannelMessage(channel_id=1000, message_id=message_id)
+            )
+
+        save_with_retry(
+            games_repository,
+            games_repository.get(1, 'game-1'),
+            mutation,
+            save=games_repository.save_channel_messages,
+            max_attempts=len(message_ids),
+        )
+
+    # When every thread reads the game, adds a message to it, and saves it
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        list(executor.map(add_channel_message, message_ids))
+
+    # Then
+    game = games_repository.get(1, 'game-1')
+    assert sorted(m.message_id for m in game.channel_messages) == message_ids
+    assert game.version == len(message_ids) + 1
+
+
+def test_create(eternal_guesses_table):
+    # Given
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    game = Game(guild_id=1, game_id='game-1', created_by=10, title='Title')
+
+    # When
+    games_repository.create(game)
+
+    # Then
+    assert game.version == 1
+
+    retrieved_game = games_repository.get(1, 'game-1')
+    assert retrieved_game.title == 'Title'
+    assert retrieved_game.version == 1
+
+
+def test_create_duplicate(eternal_guesses_table):
+    # Given
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    games_repository.create(
+        Game(guild_id=1, game_id='game-1', created_by=10, title='First')
+    )
+
+    # When
+    with pytest.raises(DuplicateGameError):
+        games_repository.create(
+            Game(guild_id=1, game_id='game-1', created_by=20, title='Second')
+        )
+
+    # Then
+    assert games_repository.get(1, 'game-1').title == 'First'
+
+
+def test_create_same_id_in_other_guild(eternal_guesses_table):
+    # Given
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    games_repository.create(Game(guild_id=1, game_id='game-1', created_by=10))
+
+    # When
+    games_repository.create(Game(guild_id=2, game_id='game-1', created_by=10))
+
+    # Then
+    assert games_repository.get(2, 'game-1') is not None
+
+
+def test_get_summaries(eternal_guesses_table):
+    # Given
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    open_game = Game(guild_id=1, game_id='open-game', created_by=10,
+                     title='Open', description='A long description')
+    closed_game = Game(guild_id=1, game_id='closed-game', created_by=10,
+                       closed=True)
+    other_guild_game = Game(guild_id=2, game_id='other-game', created_by=10)
+    for game in [open_game, closed_game, other_guild_game]:
+        games_repository.create(game)
+        games_repository.save_guess(game, GameGuess(
+            user_id=20, guess='42', timestamp=datetime.now()
+        ))
+
+    # When
+    summaries = games_repository.get_summaries(1)
+
+    # Then only the guild's games are listed, with their listing fields
+    summaries = sorted(summaries, key=lambda s: s.game_id)
+    assert [s.game_id for s in summaries] == ['closed-game', 'open-game']
+    assert [s.closed for s in summaries] == [True, False]
+    assert [s.title for s in summaries] == ['', 'Open']
+    assert all(s.guild_id == 1 for s in summaries)
+
+
+def _create_games_with_guesses(games_repository, guild_id, game_count, guess_count):
+    for game_number in range(game_count):
+        game = Game(guild_id=guild_id, game_id=f'game-{game_number}',
+                    created_by=10, closed=game_number % 2 == 1)
+        games_repository.create(game)
+        for user_id in range(guess_count):
+            games_repository.save_guess(game, GameGuess(
+                user_id=user_id, guess=str(user_id), timestamp=datetime.now()
+            ))
+
+
+def test_iter_games_reads_every_page(eternal_guesses_table):
+    # Given: games whose guesses don't fit on one page
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    _create_games_with_guesses(games_repository, 1, game_count=4, guess_count=5)
+
+    # When
+    games = list(games_repository.iter_games(1, page_size=3))
+
+    # Then every game comes with all its guesses, also those on later pages
+    assert [g.game_id for g in games] == ['game-0', 'game-1', 'game-2', 'game-3']
+    assert all(sorted(g.guesses) == [0, 1, 2, 3, 4] for g in games)
+
+
+def test_iter_games_reads_pages_as_needed(eternal_guesses_table):
+    # Given
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    _create_games_with_guesses(games_repository, 1, game_count=10, guess_count=2)
+
+    queries = []
+    query = eternal_guesses_table.query
+
+    def counting_query(**kwargs):
+        queries.append(kwargs)
+        return query(**kwargs)
+
+    games_repository.table = Mock(query=counting_query)
+
+    # When only the first game is taken
+    games = games_repository.iter_games(1, page_size=5)
+    game = next(games)
+
+    # Then only the pages up to the next game's item were read
+    assert game.game_id == 'game-0'
+    assert len(queries) == 1
+
+
+def test_iter_games_after(eternal_guesses_table):
+    # Given
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    _create_games_with_guesses(games_repository, 1, game_count=4, guess_count=2)
+    _create_games_with_guesses(games_repository, 2, game_count=4, guess_count=2)
+
+    # When continuing after the second game
+    games = list(games_repository.iter_games(1, after='game-1'))
+
+    # Then only the guild's games after it are listed, with their guesses
+    assert [g.game_id for g in games] == ['game-2', 'game-3']
+    assert all(g.guild_id == 1 for g in games)
+    assert all(sorted(g.guesses) == [0, 1] for g in games)
+
+
+def test_iter_summaries_pages_and_after(eternal_guesses_table):
+    # Given
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    _create_games_with_guesses(games_repository, 1, game_count=6, guess_count=3)
+
+    # When
+    first_games = list(itertools.islice(
+        games_repository.iter_summaries(1, page_size=2), 3
+    ))
+    other_games = list(games_repository.iter_summaries(
+        1, page_size=2, after=first_games[-1].game_id
+    ))
+
+    # Then
+    assert [s.game_id for s in first_games] == ['game-0', 'game-1', 'game-2']
+    assert [s.game_id for s in other_games] == ['game-3', 'game-4', 'game-5']
+    assert [s.closed for s in other_games] == [True, False, True]
+
+
+def test_iter_summaries_of_open_games(eternal_guesses_table):
+    # Given: open and closed games with guesses, in two guilds
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    _create_games_with_guesses(games_repository, 1, game_count=6, guess_count=3)
+    _create_games_with_guesses(games_repository, 2, game_count=2, guess_count=3)
+
+    # When
+    summaries = list(games_repository.iter_summaries(1, open_only=True))
+    later_summaries = list(games_repository.iter_summaries(
+        1, open_only=True, after='game-2'
+    ))
+
+    # Then only the guild's open games are listed
+    assert [s.game_id for s in summaries] == ['game-0', 'game-2', 'game-4']
+    assert [s.game_id for s in later_summaries] == ['game-4']
+    assert not any(s.closed for s in summaries)
+
+
+def test_iter_summaries_of_open_games_follows_close_and_reopen(eternal_guesses_table):
+    # Given
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    _create_games_with_guesses(games_repository, 1, game_count=2, guess_count=1)
+
+    def open_game_ids():
+        return [s.game_id for s in games_repository.iter_summaries(1, open_only=True)]
+
+    # When closing the open game and reopening the closed one
+    games_repository.update_fields(1, 'game-0', {'closed': True})
+    games_repository.update_fields(1, 'game-1', {'closed': False})
+
+    # Then
+    assert open_game_ids() == ['game-1']
+
+    # And saving a whole game keeps it in (or out of) the index too
+    game = games_repository.get(1, 'game-1')
+    game.closed = True
+    games_repository.save(game)
+    assert open_game_ids() == []
+
+    game.closed = False
+    games_repository.save(game)
+    assert open_game_ids() == ['game-1']
+
+
+def test_backfill_open_games(eternal_guesses_table):
+    # Given: games saved before the index of open games existed
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    for game_id, closed in [('open-game', False), ('closed-game', True), ('never-closed-game', None)]:
+        eternal_guesses_table.put_item(Item={
+            'pk': 'GUILD#1',
+            'sk': f'GAME#{game_id}',
+            'created_by': 10,
+            'closed': closed,
+        })
+    eternal_guesses_table.put_item(Item={
+        'pk': 'GUILD#1',
+        'sk': 'GAME#open-game#GUESS#20',
+        'user_id': 20,
+        'guess': '42',
+    })
+    assert list(games_repository.iter_summaries(1, open_only=True)) == []
+
+    # When
+    game_count = games_repository.backfill_open_games()
+
+    # Then the open games are in the index, and only those
+    assert game_count == 2
+    summaries = games_repository.iter_summaries(1, open_only=True)
+    assert [s.game_id for s in summaries] == ['never-closed-game', 'open-game']
+
+    # And running it again changes nothing
+    assert games_repository.backfill_open_games() == 0
+
+
+def test_get_without_guesses(eternal_guesses_table):
+    # Given
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    _create_games_with_guesses(games_repository, 1, game_count=1, guess_count=3)
+    games_repository.update_fields(1, 'game-0', {'title': 'A title'})
+
+    # When
+    game = games_repository.get_without_guesses(1, 'game-0')
+
+    # Then the game is read as it is now, without its guesses
+    assert game.title == 'A title'
+    assert game.version == 2
+    assert game.guesses == {}
+    assert games_repository.get_without_guesses(1, 'game-1') is None
@@ -0,0 +1,65 @@
+from eternal_guesses.model.data.game import Game
+from eternal_guesses.repositories.games_repository import GamesRepositoryImpl
+from eternal_guesses.repositories.post_update_schedule_repository import \
+    PostUpdateScheduleRepositoryImpl
+
+
+def test_claim_is_only_granted_once(eternal_guesses_table):
+    # Given
+    post_update_schedule = PostUpdateScheduleRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+
+    # When
+    first_claim = post_update_schedule.claim(1, 'game-1', seconds=60)
+    second_claim = post_update_schedule.claim(1, 'game-1', seconds=60)
+    other_game_claim = post_update_schedule.claim(1, 'game-2', seconds=60)
+
+    # Then
+    assert first_claim
+    assert not second_claim
+    assert other_game_claim
+
+
+def test_claim_is_granted_again_after_release(eternal_guesses_table):
+    # Given
+    post_update_schedule = PostUpdateScheduleRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    post_update_schedule.claim(1, 'game-1', seconds=60)
+
+    # When
+    post_update_schedule.release(1, 'game-1')
+
+    # Then
+    assert post_update_schedule.claim(1, 'game-1', seconds=60)
+
+
+def test_expired_claim_can_be_taken_over(eternal_guesses_table):
+    # Given
+    post_update_schedule = PostUpdateScheduleRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    post_update_schedule.claim(1, 'game-1', seconds=-1)
+
+    # Then
+    assert post_update_schedule.claim(1, 'game-1', seconds=60)
+
+
+def test_claims_are_not_listed_as_games(eternal_guesses_table):
+    # Given
+    games_repository = GamesRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+    games_repository.save(Game(guild_id=1, game_id='game-1', created_by=10))
+
+    post_update_schedule = PostUpdateScheduleRepositoryImpl(
+        eternal_guesses_table=eternal_guesses_table
+    )
+
+    # When
+    post_update_schedule.claim(1, 'game-1', seconds=60)
+    games = games_repository.get_all(1)
+
+    # Then
+    assert [game.game_id for game in games] == ['game-1']
@@ -0,0 +1,167 @@
+import base64
+import json
+from typing import Dict
+
+import pytest
+from nacl.signing import SigningKey
+
+from eternal_guesses.app import ingress
+from eternal_guesses.app.api_authorizer import ApiAuthorizerImpl, \
+    AuthorizationResult
+
+NOW = 1_700_000_000
+BODY = json.dumps({'type': 1})
+
+
+@pytest.fixture
+def signing_key() -> SigningKey:
+    return SigningKey.generate()
+
+
+def _authorizer(signing_key: SigningKey, **kwargs) -> ApiAuthorizerImpl:
+    return ApiAuthorizerImpl(
+        public_key=signing_key.verify_key.encode().hex(),
+        clock=lambda: NOW,
+        **kwargs,
+    )
+
+
+def _event(signing_key: SigningKey, timestamp: int = NOW, body: str = BODY):
+    signature = signing_key.sign(f"{timestamp}{body}".encode()).signature
+
+    return {
+        'body': body,
+        'headers': {
+            'x-signature-ed25519': signature.hex(),
+            'x-signature-timestamp': str(timestamp),
+        },
+    }
+
+
+def _authorize(authorizer: ApiAuthorizerImpl, event: Dict):
+    return authorizer.authorize(ingress.from_api_gateway(event))
+
+
+def test_valid_signature(signing_key):
+    # Given
+    authorizer = _authorizer(signing_key)
+
+    # When
+    result, response = _authorize(authorizer, _event(signing_key))
+
+    # Then
+    assert result == AuthorizationResult.PASS
+    assert response is None
+
+
+def test_signature_of_other_body(signing_key):
+    # Given
+    authorizer = _authorizer(signing_key)
+    event = _event(signing_key)
+    event['body'] = json.dumps({'type': 2})
+
+    # When
+    result, response = _authorize(authorizer, event)
+
+    # Then
+    assert result == AuthorizationResult.FAIL
+    assert response.status_code == 401
+
+
+def test_signature_of_other_key(signing_key):
+    # Given
+    authorizer = _authorizer(signing_key)
+
+    # When
+    result, _ = _authorize(authorizer, _event(SigningKey.generate()))
+
+    # Then
+    assert result == AuthorizationResult.FAIL
+
+
+@pytest.mark.parametrize("signature", [
+    None,
+    "",
+    "abc",
+    "zz" * 64,
+])
+def test_malformed_signature(signing_key, signature):
+    # Given
+    authorizer = _authorizer(signing_key)
+    event = _event(signing_key)
+    event['headers']['x-signature-ed25519'] = signature
+
+    # When
+    result, _ = _authorize(authorizer, event)
+
+    # Then
+    assert result == AuthorizationResult.FAIL
+
+
+def test_missing_headers(signing_key):
+    # Given
+    authorizer = _authorizer(signing_key)
+
+    # When
+    result, _ = _authorize(authorizer, {'body': BODY, 'headers': {}})
+
+    # Then
+    assert result == AuthorizationResult.FAIL
+
+
+@pytest.mark.parametrize("timestamp, expected_result", [
+    (NOW, AuthorizationResult.PASS),
+    (NOW - 60, AuthorizationResult.PASS),
+    (NOW - 61, AuthorizationResult.FAIL),
+    (NOW + 61, AuthorizationResult.FAIL),
+])
+def test_stale_timestamp(signing_key, timestamp, expected_result):
+    # Given
+    authorizer = _authorizer(signing_key, max_timestamp_age=60)
+
+    # When
+    result, _ = _authorize(authorizer, _event(signing_key, timestamp=timestamp))
+
+    # Then
+    assert result == expected_result
+
+
+def test_timestamp_age_is_not_checked_by_default(signing_key):
+    # Given
+    authorizer = _authorizer(signing_key)
+
+    # When
+    result, _ = _authorize(authorizer, _event(signing_key, timestamp=NOW - 3600))
+
+    # Then
+    assert result == AuthorizationResult.PASS
+
+
+def test_base64_encoded_body(signing_key):
+    # Given
+    authorizer = _authorizer(signing_key)
+    event = _event(signing_key)
+    event['body'] = base64.b64encode(event['body'].encode()).decode()
+    event['isBase64Encoded'] = True
+
+    # When
+    result, _ = _authorize(authorizer, event)
+
+    # Then
+    assert result == AuthorizationResult.PASS
+
+
+def test_headers_of_any_case(signing_key):
+    # Given
+    authorizer = _authorizer(signing_key)
+    event = _event(signing_key)
+    event['headers'] = {
+        'X-Signature-Ed25519': event['headers']['x-signature-ed25519'],
+        'X-Signature-Timestamp': event['headers']['x-signature-timestamp'],
+    }
+
+    # When
+    result, _ = _authorize(authorizer, event)
+
+    # Then
+    assert result == AuthorizationResult.PASS
@@ -0,0 +1,81 @@
+import pytest
+
+from eternal_guesses.app.component_ids import ComponentIds
+from eternal_guesses.app.custom_id import CustomIdKind, GameCustomId, \
+    GameMemberCustomId, MAX_CUSTOM_ID_LENGTH
+from eternal_guesses.exceptions import InvalidCustomIdError
+from eternal_guesses.model.discord.discord_event import InteractionType
+
+
+def test_encode_keeps_released_format():
+    # Then
+    assert ComponentIds.component_button_guess_id("game-1") == \
+        "button_trigger_guess_modal_game-1"
+    assert ComponentIds.edit_guess_modal_id("game-1", 42) == \
+        "modal-edit_guess-game_game-1-member_42"
+
+
+def test_decode_game_id():
+    # Given
+    custom_id = ComponentIds.component_button_close_game_id("game-1")
+
+    # When
+    decoded = ComponentIds.component_button_close_game.decode(custom_id)
+
+    # Then
+    assert decoded == GameCustomId(game_id="game-1")
+
+
+def test_decode_game_and_member_id():
+    # Given
+    custom_id = ComponentIds.edit_guess_modal_id("game-member_1", 42)
+
+    # When
+    decoded = ComponentIds.edit_guess_modal.decode(custom_id)
+
+    # Then
+    assert decoded == GameMemberCustomId(game_id="game-member_1", member_id=42)
+
+
+def test_decode_rejects_other_kind():
+    # Given
+    custom_id = ComponentIds.component_button_close_game_id("game-1")
+
+    # Then
+    with pytest.raises(InvalidCustomIdError):
+        ComponentIds.edit_guess_modal.decode(custom_id)
+
+    with pytest.raises(InvalidCustomIdError):
+        ComponentIds.component_button_reopen_game.decode(custom_id)
+
+
+def test_encode_rejects_too_long_custom_id():
+    # Given
+    game_id = "g" * MAX_CUSTOM_ID_LENGTH
+
+    # Then
+    with pytest.raises(InvalidCustomIdError):
+        ComponentIds.component_button_guess_id(game_id)
+
+
+def test_longest_game_id_fits_every_custom_id():
+    # Given
+    game_id = "g" * ComponentIds.max_game_id_length()
+    member_id = 2 ** 64 - 1
+
+    # Then
+    ComponentIds.edit_guess_modal_id(game_id, member_id)
+    ComponentIds.component_select_delete_guess_id(game_id)
+
+    with pytest.raises(InvalidCustomIdError):
+        ComponentIds.edit_guess_modal_id(game_id + "g", member_id)
+
+
+def test_template_must_declare_the_fields():
+    # Then
+    with pytest.raises(ValueError):
+        CustomIdKind(
+            InteractionType.MODAL_SUBMIT,
+            "modal-{game_id}",
+            GameMemberCustomId,
+        )
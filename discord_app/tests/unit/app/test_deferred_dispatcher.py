@@ -0,0 +1,35 @@
+from unittest.mock import Mock
+
+from eternal_guesses import json_codec
+from eternal_guesses.app.deferred_dispatcher import DEFERRED_INTERACTION_KEY, \
+    LambdaDeferredDispatcher
+
+
+def test_lambda_client_is_made_by_the_first_dispatch():
+    # Given
+    lambda_client = Mock()
+    lambda_client_factory = Mock(return_value=lambda_client)
+
+    # When
+    dispatcher = LambdaDeferredDispatcher(
+        lambda_client_factory=lambda_client_factory,
+        function_name="eternal-guesses",
+    )
+
+    # Then
+    lambda_client_factory.assert_not_called()
+
+    # When
+    dispatcher.dispatch({'id': '1'})
+    dispatcher.dispatch({'id': '2'})
+
+    # Then the one client invokes the function for both
+    lambda_client_factory.assert_called_once_with()
+    assert lambda_client.invoke.call_count == 2
+
+    kwargs = lambda_client.invoke.call_args.kwargs
+    assert kwargs['FunctionName'] == "eternal-guesses"
+    assert kwargs['InvocationType'] == 'Event'
+    assert json_codec.loads(kwargs['Payload']) == {
+        DEFERRED_INTERACTION_KEY: {'id': '2'}
+    }
@@ -2,12 +2,19 @@ import json
 from typing import Dict, Optional
 from unittest.mock import patch
 
+import pytest
+
 from eternal_guesses.app.api_authorizer import AuthorizationResult, \
     ApiAuthorizer
+from eternal_guesses.app.deferred_dispatcher import DeferredDispatcher
 from eternal_guesses.app.discord_event_handler import DiscordEventHandler
+from eternal_guesses.app.ingress import InteractionRequest
 from eternal_guesses.app.router import Router
 from eternal_guesses.model.discord.discord_event import DiscordEvent
+from eternal_guesses.model.discord.discord_response import DiscordResponse, \
+    ResponseType
 from eternal_guesses.model.lambda_response import LambdaResponse
+from tests.fakes import FakeDiscordMessaging
 
 
 class _TestAuthorizer(ApiAuthorizer):
@@ -19,7 +26,9 @@ class _TestAuthorizer(ApiAuthorizer):
         self.result = result
         self.response = response
 
-    def authorize(self, event: Dict) -> (AuthorizationResult, LambdaResponse):
+    def authorize(
+        self, request: InteractionRequest
+    ) -> (AuthorizationResult, LambdaResponse):
         return self.result, self.response
 
 
@@ -146,3 +155,130 @@ def test_discord_event(mock_from_event):
     assert json.loads(response['body']) == {
         'response': 'mocked'
     }
+
+
+class _TestDeferredDispatcher(DeferredDispatcher):
+    def __init__(self):
+        self.dispatched = []
+
+    def dispatch(self, interaction: Dict):
+        self.dispatched.append(interaction)
+
+
+class _TestDeferringRouter(Router):
+    def __init__(self, response: DiscordResponse = None, error=None):
+        self.response = response
+        self.error = error
+        self.routed = False
+
+    async def route(self, event: DiscordEvent) -> LambdaResponse:
+        self.routed = True
+        return LambdaResponse.success(self.response.json())
+
+    async def respond(self, event: DiscordEvent) -> DiscordResponse:
+        if self.error is not None:
+            raise self.error
+
+        return self.response
+
+    def is_deferred(self, event: DiscordEvent) -> bool:
+        return True
+
+
+def _modal_submit_body():
+    return {
+        'type': 5,
+        'application_id': '3001',
+        'token': 'interaction-token',
+        'channel_id': '1001',
+        'guild_id': '2001',
+        'data': {
+            'custom_id': 'test_modal',
+            'components': [],
+        },
+        'member': {
+            'nick': None,
+            'roles': [],
+            'user': {
+                'id': '9001',
+                'username': 'User-Name',
+            },
+        },
+    }
+
+
+def test_deferred_route_is_acknowledged_and_dispatched():
+    # Given
+    deferred_dispatcher = _TestDeferredDispatcher()
+    router = _TestDeferringRouter(
+        DiscordResponse.ephemeral_channel_message("Done.")
+    )
+
+    body = _modal_submit_body()
+    event = {
+        'body': json.dumps(body),
+        'headers': {},
+    }
+
+    # When
+    discord_event_handler = DiscordEventHandler(
+        router=router,
+        api_authorizer=_TestAuthorizer(AuthorizationResult.PASS, None),
+        deferred_dispatcher=deferred_dispatcher,
+    )
+    response = discord_event_handler.handle(event)
+
+    # Then
+    assert not router.routed
+    assert deferred_dispatcher.dispatched == [body]
+
+    response_body = json.loads(response['body'])
+    assert response_body['type'] == \
+        ResponseType.DEFERRED_CHANNEL_MESSAGE.value
+    assert response_body['data']['flags'] == 64
+
+
+def test_handle_deferred_edits_the_acknowledgement():
+    # Given
+    discord_messaging = FakeDiscordMessaging()
+    response = DiscordResponse.ephemeral_channel_message("Done.")
+
+    discord_event_handler = DiscordEventHandler(
+        router=_TestDeferringRouter(response),
+        api_authorizer=_TestAuthorizer(AuthorizationResult.PASS, None),
+        deferred_dispatcher=_TestDeferredDispatcher(),
+        discord_messaging=discord_messaging,
+    )
+
+    # When
+    discord_event_handler.handle_deferred(_modal_submit_body())
+
+    # Then
+    assert discord_messaging.edited_interaction_responses == [
+        {
+            'application_id': 3001,
+            'token': 'interaction-token',
+            'response': response,
+        }
+    ]
+
+
+def test_failing_deferred_route_still_answers():
+    # Given
+    discord_messaging = FakeDiscordMessaging()
+
+    discord_event_handler = DiscordEventHandler(
+        router=_TestDeferringRouter(error=ValueError("broken")),
+        api_authorizer=_TestAuthorizer(AuthorizationResult.PASS, None),
+        deferred_dispatcher=_TestDeferredDispatcher(),
+        discord_messaging=discord_messaging,
+    )
+
+    # When
+    with pytest.raises(ValueError):
+        discord_event_handler.handle_deferred(_modal_submit_body())
+
+    # Then
+    edited = discord_messaging.edited_interaction_responses
+    assert len(edited) == 1
+    assert edited[0]['response'].is_ephemeral
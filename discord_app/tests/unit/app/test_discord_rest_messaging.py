@@ -0,0 +1,289 @@
+import asyncio
+
+import pytest
+
+from eternal_guesses.app.discord_rest_messaging import DiscordRestMessaging
+from eternal_guesses.app.discord_session import DiscordSession
+from eternal_guesses.app.game_post_manager import GamePostManagerImpl
+from eternal_guesses.app.message_provider import MessageProviderImpl
+from eternal_guesses.exceptions import DiscordNotFoundError
+from eternal_guesses.model.data.channel_message import ChannelMessage
+from eternal_guesses.model.data.game import Game
+from eternal_guesses.model.discord.discord_component import ActionRow, \
+    DiscordComponent
+from eternal_guesses.model.discord.discord_embed import DiscordEmbed
+from eternal_guesses.model.discord.discord_response import DiscordResponse
+from tests.fake_discord_server import FakeDiscordServer
+from tests.fakes import FakeGamesRepository
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_send_channel_message_is_a_single_post():
+    async with FakeDiscordServer() as server:
+        # Given
+        discord_session = DiscordSession()
+        discord_messaging = DiscordRestMessaging(
+            discord_session=discord_session,
+            api_base_url=server.api_base_url,
+        )
+
+        # When
+        message_id = await discord_messaging.send_channel_message(
+            channel_id=100,
+            embed=DiscordEmbed(title="a game"),
+        )
+        await discord_session.close()
+
+        # Then
+        assert server.requests == {'create_message': 1}
+        posted = server.messages[(100, message_id)]
+        assert posted['embeds'][0]['title'] == "a game"
+        assert posted['allowed_mentions'] == {'parse': []}
+
+
+async def test_update_channel_message_is_a_single_patch():
+    async with FakeDiscordServer() as server:
+        # Given
+        server.add_message(channel_id=100, message_id=200)
+
+        discord_session = DiscordSession()
+        discord_messaging = DiscordRestMessaging(
+            discord_session=discord_session,
+            api_base_url=server.api_base_url,
+        )
+
+        action_rows = [ActionRow(components=[
+            DiscordComponent.button(custom_id="guess", label="Guess!")
+        ])]
+
+        # When
+        await discord_messaging.update_channel_message(
+            channel_id=100,
+            message_id=200,
+            embed=DiscordEmbed(title="new title"),
+            action_rows=action_rows,
+        )
+        await discord_session.close()
+
+        # Then
+        assert server.requests == {'edit_message': 1}
+        edited = server.messages[(100, 200)]
+        assert edited['embeds'][0]['title'] == "new title"
+        button = edited['components'][0]['components'][0]
+        assert button['custom_id'] == "guess"
+
+
+async def test_update_without_action_rows_removes_components():
+    async with FakeDiscordServer() as server:
+        # Given
+        server.add_message(
+            channel_id=100,
+            message_id=200,
+            payload={'components': [{'type': 1, 'components': []}]}
+        )
+
+        discord_session = DiscordSession()
+        discord_messaging = DiscordRestMessaging(
+            discord_session=discord_session,
+            api_base_url=server.api_base_url,
+        )
+
+        # When
+        await discord_messaging.update_channel_message(
+            channel_id=100,
+            message_id=200,
+            embed=DiscordEmbed(title="closed game"),
+        )
+        await discord_session.close()
+
+        # Then
+        assert server.messages[(100, 200)]['components'] == []
+
+
+async def test_update_of_deleted_message_raises_not_found():
+    async with FakeDiscordServer() as server:
+        # Given
+        discord_session = DiscordSession()
+        discord_messaging = DiscordRestMessaging(
+            discord_session=discord_session,
+            api_base_url=server.api_base_url,
+        )
+
+        # When/Then
+        with pytest.raises(DiscordNotFoundError):
+            await discord_messaging.update_channel_message(
+                channel_id=100,
+                message_id=200,
+                embed=DiscordEmbed(title="new title"),
+            )
+
+        # And the session was kept
+        assert not (await discord_session.http()).closed
+        await discord_session.close()
+
+
+async def test_edit_interaction_response_patches_the_original():
+    async with FakeDiscordServer() as server:
+        # Given
+        discord_session = DiscordSession()
+        discord_messaging = DiscordRestMessaging(
+            discord_session=discord_session,
+            api_base_url=server.api_base_url,
+        )
+
+        # When
+        await discord_messaging.edit_interaction_response(
+            application_id=300,
+            token="interaction-token",
+            response=DiscordResponse.ephemeral_channel_message("Guess added."),
+        )
+        await discord_session.close()
+
+        # Then
+        assert server.requests == {'edit_interaction_response': 1}
+        edited = server.interaction_responses["interaction-token"]
+        assert edited['content'] == "Guess added."
+        assert 'flags' not in edited
+
+
+async def test_edit_interaction_response_with_a_public_message():
+    async with FakeDiscordServer() as server:
+        # Given
+        discord_session = DiscordSession()
+        discord_messaging = DiscordRestMessaging(
+            discord_session=discord_session,
+            api_base_url=server.api_base_url,
+        )
+
+        # When
+        await discord_messaging.edit_interaction_response(
+            application_id=300,
+            token="interaction-token",
+            response=DiscordResponse.channel_message(content="A new game."),
+        )
+        await discord_session.close()
+
+        # Then
+        edited = server.interaction_responses["interaction-token"]
+        assert edited['content'] == "A new game."
+        assert 'flags' not in edited
+
+
+async def test_edit_interaction_response_rejects_a_modal():
+    # Given
+    discord_session = DiscordSession()
+    discord_messaging = DiscordRestMessaging(
+        discord_session=discord_session,
+        api_base_url="http://localhost:1",
+    )
+
+    # When a modal is to replace a deferred response, it's refused before
+    # anything is sent
+    with pytest.raises(ValueError):
+        await discord_messaging.edit_interaction_response(
+            application_id=300,
+            token="interaction-token",
+            response=DiscordResponse.modal(
+                custom_id="modal", title="A modal", components=[]
+            ),
+        )
+
+    await discord_session.close()
+
+
+async def test_game_post_manager_update_uses_one_request_per_post():
+    async with FakeDiscordServer() as server:
+        # Given: a game posted in three channels, one of which was deleted
+        server.add_message(channel_id=1, message_id=10)
+        server.add_message(channel_id=2, message_id=20)
+
+        game = Game(
+            guild_id=5,
+            game_id="game-1",
+            closed=False,
+            channel_messages=[
+                ChannelMessage(channel_id=1, message_id=10),
+                ChannelMessage(channel_id=2, message_id=20),
+                ChannelMessage(channel_id=3, message_id=30),
+            ]
+        )
+        games_repository = FakeGamesRepository([game])
+
+        discord_session = DiscordSession()
+        game_post_manager = GamePostManagerImpl(
+            games_repository=games_repository,
+            message_provider=MessageProviderImpl(),
+            discord_messaging=DiscordRestMessaging(
+                discord_session=discord_session,
+                api_base_url=server.api_base_url,
+            ),
+        )
+
+        # When
+        await game_post_manager.update(game)
+        await discord_session.close()
+
+        # Then
+        assert server.requests == {'edit_message': 3}
+        assert [m.message_id for m in game.channel_messages] == [10, 20]
+
+
+async def test_fan_out_keeps_to_the_learned_rate_limit():
+    async with FakeDiscordServer(rate_limit=(2, 0.2)) as server:
+        # Given: six posts in the same channel
+        for message_id in range(6):
+            server.add_message(channel_id=100, message_id=message_id)
+
+        discord_session = DiscordSession()
+        discord_messaging = DiscordRestMessaging(
+            discord_session=discord_session,
+            api_base_url=server.api_base_url,
+        )
+
+        # And an earlier request taught it the channel's limit
+        await discord_messaging.update_channel_message(
+            channel_id=100, message_id=0, embed=DiscordEmbed(title="a"),
+        )
+
+        # When
+        await asyncio.gather(*(
+            discord_messaging.update_channel_message(
+                channel_id=100, message_id=message_id,
+                embed=DiscordEmbed(title="b"),
+            )
+            for message_id in range(1, 6)
+        ))
+        await discord_session.close()
+
+        # Then: all edits went through, without running into a 429
+        assert server.requests == {'edit_message': 6}
+        bucket = discord_messaging.rate_limiter.state()['buckets']
+        assert 'edit_message-bucket:/channels/100' in bucket
+
+
+async def test_rate_limited_requests_are_retried():
+    async with FakeDiscordServer(rate_limit=(1, 0.1)) as server:
+        # Given: a burst before the limits are known
+        for message_id in range(3):
+            server.add_message(channel_id=100, message_id=message_id)
+
+        discord_session = DiscordSession()
+        discord_messaging = DiscordRestMessaging(
+            discord_session=discord_session,
+            api_base_url=server.api_base_url,
+        )
+
+        # When
+        await asyncio.gather(*(
+            discord_messaging.update_channel_message(
+                channel_id=100, message_id=message_id,
+                embed=DiscordEmbed(title="b"),
+            )
+            for message_id in range(3)
+        ))
+        await discord_session.close()
+
+        # Then: the ones that hit the limit were retried after it reset
+        assert server.requests['edit_message'] == 3
+        assert server.requests['rate_limited'] >= 1
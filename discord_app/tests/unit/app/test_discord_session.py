@@ -0,0 +1,84 @@
+import asyncio
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from eternal_guesses.app.discord_rest_messaging import DiscordRestMessaging
+from eternal_guesses.app.discord_session import DiscordSession
+from tests.fake_discord_server import FakeDiscordServer
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_http_session_is_reused():
+    # Given
+    session = DiscordSession()
+
+    # When
+    first_http = await session.http()
+    second_http = await session.http()
+
+    # Then
+    assert first_http is second_http
+    await session.close()
+
+
+async def test_messaging_reuses_connections():
+    async with FakeDiscordServer() as server:
+        # Given
+        session = DiscordSession()
+        discord_messaging = DiscordRestMessaging(
+            discord_session=session,
+            api_base_url=server.api_base_url,
+        )
+
+        # When
+        await discord_messaging.send_channel_message(channel_id=1, text="one")
+        await discord_messaging.send_channel_message(channel_id=2, text="two")
+        await session.close()
+
+        # Then
+        assert session.stats.connections_created == 1
+        assert session.stats.connections_reused == 1
+
+
+async def test_connection_failure_only_fails_its_own_request():
+    # Given: a server that drops the connection of one of many requests
+    async def edit_message(request: web.Request):
+        if request.match_info['channel_id'] == '1':
+            request.transport.close()
+        else:
+            await asyncio.sleep(0.05)
+
+        return web.json_response({'id': request.match_info['message_id']})
+
+    app = web.Application()
+    app.router.add_patch(
+        "/channels/{channel_id}/messages/{message_id}", edit_message
+    )
+
+    async with TestServer(app) as server:
+        session = DiscordSession()
+        discord_messaging = DiscordRestMessaging(
+            discord_session=session,
+            api_base_url=str(server.make_url("")),
+        )
+
+        # When
+        results = await asyncio.gather(
+            *(
+                discord_messaging.update_channel_message(
+                    channel_id=channel_id, message_id=100, text="edited"
+                )
+                for channel_id in range(1, 11)
+            ),
+            return_exceptions=True,
+        )
+
+        # Then only the dropped request failed, and the session was kept
+        assert isinstance(results[0], aiohttp.ClientConnectionError)
+        assert not any(isinstance(r, Exception) for r in results[1:])
+        assert not (await session.http()).closed
+        await session.close()
@@ -0,0 +1,106 @@
+import pytest
+
+from eternal_guesses.app import injector
+from eternal_guesses.app.component_ids import ComponentIds
+from eternal_guesses.app.dispatcher import Dispatcher, RouteKey
+from eternal_guesses.exceptions import AmbiguousRouteError
+from eternal_guesses.model.discord.discord_command import DiscordCommand
+from eternal_guesses.model.discord.discord_component import ComponentType
+from eternal_guesses.model.discord.discord_component_action import \
+    DiscordComponentAction
+from eternal_guesses.model.discord.discord_event import DiscordEvent
+from eternal_guesses.model.discord.discord_modal_submit import \
+    DiscordModalSubmit
+from eternal_guesses.routes.actions.action_manage_game_close import \
+    ActionManageGameCloseRoute
+from eternal_guesses.routes.commands.list_games import ListGamesRoute
+from eternal_guesses.routes.modal_submits.submit_guess import SubmitGuessRoute
+from tests.fakes import FakeDiscordMessaging
+
+
+def _component_event(custom_id: str) -> DiscordEvent:
+    return DiscordEvent(
+        component_action=DiscordComponentAction(
+            component_type=ComponentType.BUTTON,
+            component_custom_id=custom_id,
+        )
+    )
+
+
+def _modal_event(custom_id: str) -> DiscordEvent:
+    return DiscordEvent(
+        modal_submit=DiscordModalSubmit(modal_custom_id=custom_id, inputs={})
+    )
+
+
+def _command_event(name: str) -> DiscordEvent:
+    return DiscordEvent(command=DiscordCommand(command_name=name))
+
+
+def test_find_by_name_and_prefix():
+    # Given
+    dispatcher = Dispatcher()
+    dispatcher.add(RouteKey.command("list-games"), "list")
+    dispatcher.add(RouteKey.component(custom_id="manage"), "manage")
+    dispatcher.add(RouteKey.component(prefix="close_"), "close")
+    dispatcher.add(RouteKey.modal(prefix="close_"), "close modal")
+
+    # Then
+    assert dispatcher.find(_command_event("list-games")) == "list"
+    assert dispatcher.find(_component_event("manage")) == "manage"
+    assert dispatcher.find(_component_event("close_game")) == "close"
+    assert dispatcher.find(_modal_event("close_game")) == "close modal"
+
+
+def test_find_nothing():
+    # Given
+    dispatcher = Dispatcher()
+    dispatcher.add(RouteKey.command("list-games"), "list")
+    dispatcher.add(RouteKey.component(custom_id="manage"), "manage")
+    dispatcher.add(RouteKey.component(prefix="close_"), "close")
+
+    # Then
+    assert dispatcher.find(_command_event("create-game")) is None
+    assert dispatcher.find(_component_event("manage_game")) is None
+    assert dispatcher.find(_component_event("close")) is None
+    assert dispatcher.find(_modal_event("close_game")) is None
+    assert dispatcher.find(DiscordEvent()) is None
+
+
+@pytest.mark.parametrize("first_key, second_key", [
+    (RouteKey.command("ping"), RouteKey.command("ping")),
+    (RouteKey.component(prefix="game_"), RouteKey.component(prefix="game_")),
+    (RouteKey.component(prefix="game_"),
+     RouteKey.component(prefix="game_close_")),
+    (RouteKey.component(prefix="game_close_"),
+     RouteKey.component(prefix="game_")),
+    (RouteKey.component(prefix="game_"),
+     RouteKey.component(custom_id="game_list")),
+    (RouteKey.component(custom_id="game_list"),
+     RouteKey.component(prefix="game_")),
+])
+def test_overlapping_keys_are_rejected(first_key, second_key):
+    # Given
+    dispatcher = Dispatcher()
+    dispatcher.add(first_key, "first")
+
+    # Then
+    with pytest.raises(AmbiguousRouteError):
+        dispatcher.add(second_key, "second")
+
+
+def test_application_routes_do_not_overlap():
+    # When
+    router = injector._router(FakeDiscordMessaging())
+    route_registry = router.route_registry
+
+    # Then
+    assert route_registry.find_type(
+        _command_event("list-games")
+    ) is ListGamesRoute
+    assert route_registry.find_type(_component_event(
+        ComponentIds.component_button_close_game_id("game")
+    )) is ActionManageGameCloseRoute
+    assert route_registry.find_type(_modal_event(
+        ComponentIds.submit_guess_modal_id("game")
+    )) is SubmitGuessRoute
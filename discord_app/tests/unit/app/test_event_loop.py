@@ -0,0 +1,95 @@
+import asyncio
+import sys
+
+from eternal_guesses.app.discord_session import DiscordSession
+from eternal_guesses.app.event_loop import EventLoop
+
+
+class _Resource:
+    def __init__(self, closed_resources: list, name: str):
+        self.closed_resources = closed_resources
+        self.name = name
+
+    async def close(self):
+        self.closed_resources.append(self.name)
+
+
+async def _running_loop():
+    return asyncio.get_running_loop()
+
+
+def test_invocations_share_a_loop():
+    # Given
+    event_loop = EventLoop()
+
+    # When
+    first_loop = event_loop.run(_running_loop())
+    second_loop = event_loop.run(_running_loop())
+
+    # Then
+    assert first_loop is second_loop
+    assert not first_loop.is_closed()
+    event_loop.close()
+
+
+def test_http_session_is_kept_between_invocations():
+    # Given
+    event_loop = EventLoop()
+    session = event_loop.register(DiscordSession())
+
+    # When
+    first_http = event_loop.run(session.http())
+    second_http = event_loop.run(session.http())
+
+    # Then
+    assert first_http is second_http
+
+    # When
+    event_loop.close()
+
+    # Then
+    assert first_http.closed
+
+
+def test_close_closes_resources_and_loop():
+    # Given
+    closed_resources = []
+    event_loop = EventLoop()
+    event_loop.register(_Resource(closed_resources, "first"))
+    event_loop.register(_Resource(closed_resources, "second"))
+    loop = event_loop.run(_running_loop())
+
+    # When
+    event_loop.close()
+
+    # Then
+    assert closed_resources == ["second", "first"]
+    assert loop.is_closed()
+
+
+def test_run_after_close_uses_a_new_loop():
+    # Given
+    event_loop = EventLoop()
+    first_loop = event_loop.run(_running_loop())
+    event_loop.close()
+
+    # When
+    second_loop = event_loop.run(_running_loop())
+
+    # Then
+    assert second_loop is not first_loop
+    assert not second_loop.is_closed()
+    event_loop.close()
+
+
+def test_without_uvloop_installed_falls_back_to_asyncio(monkeypatch):
+    # Given
+    monkeypatch.setitem(sys.modules, 'uvloop', None)
+    event_loop = EventLoop(use_uvloop=True)
+
+    # When
+    loop = event_loop.run(_running_loop())
+
+    # Then
+    assert isinstance(loop, asyncio.BaseEventLoop)
+    event_loop.close()
@@ -1,14 +1,25 @@
+import asyncio
 from unittest.mock import MagicMock
 
-import discord
-import discord.ui
 import pytest
 
+from eternal_guesses.app import metrics
+from eternal_guesses.exceptions import DiscordServerError
 from eternal_guesses.model.data.channel_message import ChannelMessage
 from eternal_guesses.model.data.game import Game
-from eternal_guesses.app.game_post_manager import GamePostManagerImpl
-from eternal_guesses.app.message_provider import MessageProvider
-from tests.fakes import FakeGamesRepository, FakeDiscordMessaging
+from eternal_guesses.model.data.game_guess import GameGuess
+from eternal_guesses.model.discord.discord_component import ActionRow, \
+    DiscordComponent
+from eternal_guesses.model.discord.discord_embed import DiscordEmbed
+from eternal_guesses.app.game_post_manager import GamePostManagerImpl, \
+    QueueingGamePostManager
+from eternal_guesses.app.message_provider import MessageProvider, \
+    MessageProviderImpl
+from eternal_guesses.app.post_update_queue import InMemoryPostUpdateQueue, \
+    PostUpdateJob, PostUpdateQueue
+from eternal_guesses.app.post_update_worker import PostUpdateWorker
+from tests.fakes import FakeGamesRepository, FakeDiscordMessaging, \
+    FakePostUpdateScheduleRepository
 
 pytestmark = pytest.mark.asyncio
 
@@ -18,11 +29,13 @@ async def test_update_post():
     game_post_1 = ChannelMessage(channel_id=1000, message_id=5000)
     game_post_2 = ChannelMessage(channel_id=1005, message_id=5005)
 
-    post_embed = discord.Embed()
-    post_view = discord.ui.View()
+    post_embed = DiscordEmbed()
+    post_action_rows = [ActionRow(components=[
+        DiscordComponent.button(custom_id="guess", label="Guess!")
+    ])]
     message_provider = MagicMock(MessageProvider)
     message_provider.game_post_embed.return_value = post_embed
-    message_provider.game_post_view.return_value = post_view
+    message_provider.game_post_action_rows.return_value = post_action_rows
 
     game = Game(
         game_id='game-id',
@@ -48,13 +61,13 @@ async def test_update_post():
                'channel_id': game_post_1.channel_id,
                'message_id': game_post_1.message_id,
                'embed': post_embed,
-               'view': post_view,
+               'action_rows': post_action_rows,
            } in update_channel_message_calls
     assert {
                'channel_id': game_post_2.channel_id,
                'message_id': game_post_2.message_id,
                'embed': post_embed,
-               'view': post_view,
+               'action_rows': post_action_rows,
            } in update_channel_message_calls
 
 
@@ -94,16 +107,310 @@ async def test_guess_channel_message_gone_silently_fails():
                0].message_id == other_channel_message.message_id
 
 
+async def test_update_is_sent_concurrently_up_to_the_limit():
+    # Given: a game that was posted in 5 channels
+    game = Game(
+        game_id='game-id',
+        channel_messages=[
+            ChannelMessage(channel_id=1000 + i, message_id=5000 + i)
+            for i in range(5)
+        ]
+    )
+
+    discord_messaging = FakeDiscordMessaging(delay_seconds=0.01)
+    game_post_manager = _game_post_manager(
+        games_repository=FakeGamesRepository([game]),
+        discord_messaging=discord_messaging,
+        max_concurrency=2,
+    )
+
+    # When
+    await game_post_manager.update(game)
+
+    # Then all posts are updated, but never more than 2 at a time
+    assert len(discord_messaging.updated_channel_messages) == 5
+    assert discord_messaging.max_in_flight == 2
+
+
+async def test_deleted_channel_messages_are_pruned_in_one_save():
+    # Given: a game with three posts, two of which have been deleted
+    guild_id = 1001
+    game_id = 'game-id'
+    game = Game(
+        guild_id=guild_id,
+        game_id=game_id,
+        channel_messages=[
+            ChannelMessage(channel_id=1000, message_id=5000),
+            ChannelMessage(channel_id=1000, message_id=5001),
+            ChannelMessage(channel_id=1000, message_id=5002),
+        ]
+    )
+
+    class CountingGamesRepository(FakeGamesRepository):
+        saves = 0
+
+        def save(self, game: Game):
+            self.saves += 1
+            super().save(game)
+
+    games_repository = CountingGamesRepository([game])
+
+    discord_messaging = FakeDiscordMessaging()
+    discord_messaging.raise_404_on_update_of_message(5000)
+    discord_messaging.raise_404_on_update_of_message(5002)
+
+    game_post_manager = _game_post_manager(
+        games_repository=games_repository,
+        discord_messaging=discord_messaging,
+    )
+
+    # When
+    await game_post_manager.update(game)
+
+    # Then both are removed, with a single save
+    updated_game = games_repository.get(guild_id=guild_id, game_id=game_id)
+    assert [m.message_id for m in updated_game.channel_messages] == [5001]
+    assert games_repository.saves == 1
+
+
+async def test_update_records_fan_out_latency():
+    # Given
+    metrics.reset()
+    game = Game(
+        game_id='game-id',
+        channel_messages=[ChannelMessage(channel_id=1000, message_id=5000)]
+    )
+    game_post_manager = _game_post_manager(
+        games_repository=FakeGamesRepository([game]),
+    )
+
+    # When
+    await game_post_manager.update(game)
+
+    # Then
+    assert metrics.timing('game_post_update.fan_out').count == 1
+
+
+async def test_unchanged_posts_are_not_edited_again():
+    # Given: a game posted in two channels
+    metrics.reset()
+    game = Game(
+        guild_id=1,
+        game_id='game-id',
+        title='A game',
+        channel_messages=[
+            ChannelMessage(channel_id=1000, message_id=5000),
+            ChannelMessage(channel_id=1005, message_id=5005),
+        ]
+    )
+    games_repository = FakeGamesRepository([game])
+    discord_messaging = FakeDiscordMessaging()
+
+    game_post_manager = _game_post_manager(
+        games_repository=games_repository,
+        discord_messaging=discord_messaging,
+        message_provider=MessageProviderImpl(),
+    )
+
+    # When: the posts are updated twice without changes in between
+    await game_post_manager.update(game)
+    await game_post_manager.update(games_repository.get(1, 'game-id'))
+
+    # Then: only the first update edited the posts
+    assert len(discord_messaging.updated_channel_messages) == 2
+    assert metrics.counter('game_post_update.sent') == 2
+    assert metrics.counter('game_post_update.skipped') == 2
+
+    # When: the game is changed
+    game.title = 'A renamed game'
+    await game_post_manager.update(game)
+
+    # Then: the posts are edited again
+    assert len(discord_messaging.updated_channel_messages) == 4
+
+
+async def test_failed_edit_is_retried_on_the_next_update():
+    # Given
+    game = Game(
+        game_id='game-id',
+        channel_messages=[ChannelMessage(channel_id=1000, message_id=5000)]
+    )
+
+    class FailingDiscordMessaging(FakeDiscordMessaging):
+        async def update_channel_message(self, *args, **kwargs):
+            raise DiscordServerError(status=503, message="unavailable")
+
+    game_post_manager = _game_post_manager(
+        games_repository=FakeGamesRepository([game]),
+        discord_messaging=FailingDiscordMessaging(),
+    )
+
+    # When
+    with pytest.raises(DiscordServerError):
+        await game_post_manager.update(game)
+
+    # Then
+    assert game.channel_messages[0].content_hash is None
+
+
+async def test_update_stored_renders_the_stored_game():
+    # Given: a copy of the game read without its guesses
+    game_post = ChannelMessage(channel_id=1000, message_id=5000)
+    stored_game = Game(
+        guild_id=10,
+        game_id='game-id',
+        guesses={20: GameGuess(user_id=20, guess='42')},
+        channel_messages=[game_post],
+    )
+    game = Game(guild_id=10, game_id='game-id', channel_messages=[game_post])
+
+    message_provider = MagicMock(MessageProvider)
+    message_provider.game_post_embed.return_value = DiscordEmbed()
+    message_provider.game_post_action_rows.return_value = []
+    discord_messaging = FakeDiscordMessaging()
+
+    game_post_manager = _game_post_manager(
+        games_repository=FakeGamesRepository([stored_game]),
+        discord_messaging=discord_messaging,
+        message_provider=message_provider,
+    )
+
+    # When
+    await game_post_manager.update_stored(game)
+
+    # Then the post shows the game with its guesses
+    message_provider.game_post_embed.assert_called_with(stored_game)
+    assert len(discord_messaging.updated_channel_messages) == 1
+
+
+async def test_queueing_update_enqueues_a_job_instead_of_editing():
+    # Given
+    game = Game(
+        guild_id=10,
+        game_id='game-id',
+        channel_messages=[ChannelMessage(channel_id=1000, message_id=5000)]
+    )
+    discord_messaging = FakeDiscordMessaging()
+    post_update_queue = InMemoryPostUpdateQueue()
+
+    game_post_manager = QueueingGamePostManager(
+        game_post_manager=_game_post_manager(
+            games_repository=FakeGamesRepository([game]),
+            discord_messaging=discord_messaging,
+        ),
+        post_update_queue=post_update_queue,
+        coalesce_seconds=0,
+    )
+
+    # When
+    await game_post_manager.update(game)
+
+    # Then
+    assert discord_messaging.updated_channel_messages == []
+    assert post_update_queue.receive() == [
+        PostUpdateJob(guild_id=10, game_id='game-id')
+    ]
+
+
+async def test_burst_of_updates_is_coalesced_into_one_edit_per_post():
+    # Given
+    metrics.reset()
+
+    game = Game(
+        guild_id=10,
+        game_id='game-id',
+        channel_messages=[
+            ChannelMessage(channel_id=1000, message_id=5000),
+            ChannelMessage(channel_id=1005, message_id=5005),
+        ]
+    )
+    games_repository = FakeGamesRepository([game])
+    discord_messaging = FakeDiscordMessaging()
+    post_update_queue = InMemoryPostUpdateQueue()
+    post_update_schedule = FakePostUpdateScheduleRepository()
+
+    inline_game_post_manager = _game_post_manager(
+        games_repository=games_repository,
+        discord_messaging=discord_messaging,
+    )
+    game_post_manager = QueueingGamePostManager(
+        game_post_manager=inline_game_post_manager,
+        post_update_queue=post_update_queue,
+        post_update_schedule=post_update_schedule,
+        coalesce_seconds=0.01,
+    )
+    post_update_worker = PostUpdateWorker(
+        games_repository=games_repository,
+        game_post_manager=inline_game_post_manager,
+        post_update_schedule=post_update_schedule,
+    )
+
+    # When: five guesses come in within the window
+    for _ in range(5):
+        await game_post_manager.update(game)
+
+    # Then: the single job only becomes available after the window
+    assert post_update_queue.receive() == []
+    await asyncio.sleep(0.02)
+    jobs = post_update_queue.receive()
+    assert jobs == [PostUpdateJob(guild_id=10, game_id='game-id')]
+
+    # And the worker edits each post once
+    await post_update_worker.process(jobs)
+    assert len(discord_messaging.updated_channel_messages) == 2
+
+    assert metrics.counter('post_update.requested') == 5
+    assert metrics.counter('post_update.scheduled') == 1
+    assert metrics.gauge('post_update.coalescing_ratio') == 5
+
+    # And a later update is scheduled again
+    await game_post_manager.update(game)
+    assert metrics.counter('post_update.scheduled') == 2
+
+
+async def test_failed_enqueue_releases_the_claim():
+    # Given
+    game = Game(
+        guild_id=10,
+        game_id='game-id',
+        channel_messages=[ChannelMessage(channel_id=1000, message_id=5000)]
+    )
+    post_update_queue = MagicMock(PostUpdateQueue)
+    post_update_queue.enqueue.side_effect = RuntimeError("queue unavailable")
+    post_update_schedule = FakePostUpdateScheduleRepository()
+
+    game_post_manager = QueueingGamePostManager(
+        game_post_manager=_game_post_manager(),
+        post_update_queue=post_update_queue,
+        post_update_schedule=post_update_schedule,
+        coalesce_seconds=10,
+    )
+
+    # When
+    with pytest.raises(RuntimeError):
+        await game_post_manager.update(game)
+
+    # Then the next update tries again
+    assert post_update_schedule.claimed == set()
+
+    post_update_queue.enqueue.side_effect = None
+    await game_post_manager.update(game)
+    assert post_update_queue.enqueue.call_count == 2
+
+
 def _game_post_manager(
     games_repository=None,
     message_provider=None,
-    discord_messaging=None
+    discord_messaging=None,
+    max_concurrency=None,
 ):
     if games_repository is None:
         games_repository = FakeGamesRepository()
 
     if message_provider is None:
         message_provider = MagicMock(MessageProvider)
+        message_provider.game_post_embed.return_value = DiscordEmbed()
+        message_provider.game_post_action_rows.return_value = []
 
     if discord_messaging is None:
         discord_messaging = FakeDiscordMessaging()
@@ -112,4 +419,5 @@ def _game_post_manager(
         games_repository=games_repository,
         message_provider=message_provider,
         discord_messaging=discord_messaging,
+        max_concurrency=max_concurrency,
     )
@@ -0,0 +1,101 @@
+import pytest
+
+from eternal_guesses.app import metrics
+from eternal_guesses.app.game_updates import save_with_retry
+from eternal_guesses.exceptions import GameVersionConflictError
+from eternal_guesses.model.data.game import Game
+from tests.fakes import FakeGamesRepository
+
+
+class ConflictingGamesRepository(FakeGamesRepository):
+    """Has the game changed by someone else before each of the first saves."""
+
+    def __init__(self, games, conflicts: int):
+        super().__init__(games)
+        self.conflicts = conflicts
+        self.saved_titles = []
+
+    def get_without_guesses(self, guild_id: int, game_id: str):
+        game = super().get_without_guesses(guild_id, game_id)
+        if game is None:
+            return None
+
+        return Game(guild_id=game.guild_id, game_id=game.game_id,
+                    title=game.title, version=game.version)
+
+    def save(self, game: Game):
+        if self.conflicts > 0:
+            self.conflicts -= 1
+            raise GameVersionConflictError()
+
+        self.saved_titles.append(game.title)
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    metrics.reset()
+
+
+def test_saves_without_conflict():
+    # Given
+    game = Game(guild_id=1, game_id='game-1', title='Title', version=1)
+    games_repository = ConflictingGamesRepository([game], conflicts=0)
+
+    # When
+    saved_game = save_with_retry(
+        games_repository, game, lambda g: setattr(g, 'title', g.title + '!')
+    )
+
+    # Then
+    assert saved_game is game
+    assert games_repository.saved_titles == ['Title!']
+    assert metrics.counter('game_save.attempts') == 1
+    assert metrics.counter('game_save.conflicts') == 0
+
+
+def test_reapplies_the_mutation_to_a_fresh_copy():
+    # Given
+    game = Game(guild_id=1, game_id='game-1', title='Title', version=1)
+    stored_game = Game(guild_id=1, game_id='game-1', title='Title', version=2)
+    games_repository = ConflictingGamesRepository([stored_game], conflicts=2)
+
+    # When
+    saved_game = save_with_retry(
+        games_repository, game, lambda g: setattr(g, 'title', g.title + '!')
+    )
+
+    # Then the mutation is applied once to the copy that got saved
+    assert saved_game is not game
+    assert games_repository.saved_titles == ['Title!']
+    assert metrics.counter('game_save.attempts') == 3
+    assert metrics.counter('game_save.conflicts') == 2
+    assert metrics.counter('game_save.retries') == 2
+    assert metrics.gauge('game_save.conflict_rate') == pytest.approx(2 / 3)
+
+
+def test_gives_up_after_max_attempts():
+    # Given
+    game = Game(guild_id=1, game_id='game-1', title='Title', version=1)
+    games_repository = ConflictingGamesRepository([game], conflicts=3)
+
+    # When
+    with pytest.raises(GameVersionConflictError):
+        save_with_retry(games_repository, game, lambda g: None,
+                        max_attempts=3)
+
+    # Then
+    assert games_repository.saved_titles == []
+    assert metrics.counter('game_save.attempts') == 3
+
+
+def test_stops_when_the_game_was_deleted():
+    # Given
+    game = Game(guild_id=1, game_id='game-1', version=1)
+    games_repository = ConflictingGamesRepository([], conflicts=1)
+
+    # When
+    saved_game = save_with_retry(games_repository, game, lambda g: None)
+
+    # Then
+    assert saved_game is None
+    assert games_repository.saved_titles == []
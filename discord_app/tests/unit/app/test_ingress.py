@@ -0,0 +1,69 @@
+import base64
+import json
+
+from eternal_guesses.app import ingress
+
+BODY = json.dumps({'type': 1})
+
+
+def test_rest_api_event():
+    # Given
+    event = {
+        'body': BODY,
+        'headers': {
+            'Content-Type': 'application/json',
+            'X-Signature-Ed25519': 'signature',
+        },
+        'isBase64Encoded': False,
+    }
+
+    # When
+    request = ingress.from_api_gateway(event)
+
+    # Then
+    assert request.body == BODY.encode()
+    assert request.header('x-signature-ed25519') == 'signature'
+    assert request.json() == {'type': 1}
+
+
+def test_http_api_event_with_base64_body():
+    # Given
+    event = {
+        'version': '2.0',
+        'routeKey': 'POST /event',
+        'body': base64.b64encode(BODY.encode()).decode(),
+        'headers': {
+            'content-type': 'application/json',
+            'x-signature-ed25519': 'signature',
+        },
+        'isBase64Encoded': True,
+    }
+
+    # When
+    request = ingress.from_api_gateway(event)
+
+    # Then
+    assert request.body == BODY.encode()
+    assert request.header('x-signature-ed25519') == 'signature'
+    assert request.json() == {'type': 1}
+
+
+def test_body_is_parsed_once():
+    # Given
+    request = ingress.from_api_gateway({'body': BODY, 'headers': {}})
+
+    # When
+    first_json = request.json()
+    second_json = request.json()
+
+    # Then
+    assert first_json is second_json
+
+
+def test_event_without_body_or_headers():
+    # When
+    request = ingress.from_api_gateway({})
+
+    # Then
+    assert request.body == b""
+    assert request.header('x-signature-ed25519') is None
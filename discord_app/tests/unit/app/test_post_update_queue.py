@@ -0,0 +1,53 @@
+from eternal_guesses.app.post_update_queue import PostUpdateJob, \
+    SqlitePostUpdateQueue, InMemoryPostUpdateQueue
+
+
+def test_job_round_trips_through_json():
+    job = PostUpdateJob(guild_id=10, game_id='game-id')
+
+    assert PostUpdateJob.from_json(job.to_json()) == job
+
+
+def test_sqlite_queue_receives_jobs_in_order_once(tmp_path):
+    # Given
+    path = str(tmp_path / "queue.sqlite")
+    queue = SqlitePostUpdateQueue(path)
+
+    for game_id in ['game-1', 'game-2', 'game-3']:
+        queue.enqueue(PostUpdateJob(guild_id=10, game_id=game_id))
+
+    # When
+    first_batch = queue.receive(max_jobs=2)
+    second_batch = SqlitePostUpdateQueue(path).receive(max_jobs=2)
+
+    # Then
+    assert [job.game_id for job in first_batch] == ['game-1', 'game-2']
+    assert [job.game_id for job in second_batch] == ['game-3']
+    assert queue.receive() == []
+
+
+def test_in_memory_queue_receives_up_to_max_jobs():
+    # Given
+    queue = InMemoryPostUpdateQueue()
+    for game_id in ['game-1', 'game-2', 'game-3']:
+        queue.enqueue(PostUpdateJob(guild_id=10, game_id=game_id))
+
+    # When
+    jobs = queue.receive(max_jobs=2)
+
+    # Then
+    assert [job.game_id for job in jobs] == ['game-1', 'game-2']
+    assert len(queue.jobs) == 1
+
+
+def test_delayed_job_is_not_received_yet(tmp_path):
+    # Given
+    queue = SqlitePostUpdateQueue(str(tmp_path / "queue.sqlite"))
+
+    # When
+    queue.enqueue(PostUpdateJob(guild_id=10, game_id='later'),
+                  delay_seconds=60)
+    queue.enqueue(PostUpdateJob(guild_id=10, game_id='now'))
+
+    # Then
+    assert [job.game_id for job in queue.receive()] == ['now']
@@ -0,0 +1,137 @@
+from unittest.mock import Mock, call
+
+import pytest
+
+from eternal_guesses import worker
+from eternal_guesses.app.game_post_manager import GamePostManager
+from eternal_guesses.app.post_update_queue import PostUpdateJob
+from eternal_guesses.app.post_update_worker import PostUpdateWorker
+from eternal_guesses.model.data.game import Game
+from eternal_guesses.repositories.games_repository import GamesRepository
+from eternal_guesses.repositories.post_update_schedule_repository import \
+    PostUpdateScheduleRepository
+from tests.fakes import FakeGamesRepository
+
+
+class _RecordingGamePostManager(GamePostManager):
+    def __init__(self, failing_game_ids=()):
+        self.failing_game_ids = failing_game_ids
+        self.updated_games = []
+
+    async def update(self, game: Game):
+        if game.game_id in self.failing_game_ids:
+            raise RuntimeError(f"failed updating {game.game_id}")
+
+        self.updated_games.append(game.game_id)
+
+
+@pytest.mark.asyncio
+async def test_jobs_for_the_same_game_are_handled_once():
+    # Given
+    games_repository = FakeGamesRepository([
+        Game(guild_id=10, game_id='game-1'),
+        Game(guild_id=10, game_id='game-2'),
+    ])
+    game_post_manager = _RecordingGamePostManager()
+
+    post_update_worker = PostUpdateWorker(
+        games_repository=games_repository,
+        game_post_manager=game_post_manager,
+    )
+
+    # When
+    failed_jobs = await post_update_worker.process([
+        PostUpdateJob(guild_id=10, game_id='game-1'),
+        PostUpdateJob(guild_id=10, game_id='game-2'),
+        PostUpdateJob(guild_id=10, game_id='game-1'),
+    ])
+
+    # Then
+    assert failed_jobs == set()
+    assert sorted(game_post_manager.updated_games) == ['game-1', 'game-2']
+
+
+@pytest.mark.asyncio
+async def test_job_for_deleted_game_is_skipped():
+    # Given
+    game_post_manager = _RecordingGamePostManager()
+    post_update_worker = PostUpdateWorker(
+        games_repository=FakeGamesRepository([]),
+        game_post_manager=game_post_manager,
+    )
+
+    # When
+    failed_jobs = await post_update_worker.process([
+        PostUpdateJob(guild_id=10, game_id='game-1'),
+    ])
+
+    # Then
+    assert failed_jobs == set()
+    assert game_post_manager.updated_games == []
+
+
+@pytest.mark.asyncio
+async def test_game_is_read_consistently_after_its_claim_is_released():
+    # Given
+    calls = Mock()
+    calls.get.return_value = Game(guild_id=10, game_id='game-1')
+
+    post_update_worker = PostUpdateWorker(
+        games_repository=Mock(GamesRepository, get=calls.get),
+        post_update_schedule=Mock(PostUpdateScheduleRepository,
+                                  release=calls.release),
+        game_post_manager=_RecordingGamePostManager(),
+    )
+
+    # When
+    await post_update_worker.process([
+        PostUpdateJob(guild_id=10, game_id='game-1'),
+    ])
+
+    # Then the read sees the writes made while the job was claimed
+    assert calls.mock_calls == [
+        call.release(10, 'game-1'),
+        call.get(10, 'game-1', consistent_read=True),
+    ]
+
+
+def test_lambda_reports_only_the_failed_messages(monkeypatch):
+    # Given
+    post_update_worker = PostUpdateWorker(
+        games_repository=FakeGamesRepository([
+            Game(guild_id=10, game_id='game-1'),
+            Game(guild_id=10, game_id='game-2'),
+        ]),
+        game_post_manager=_RecordingGamePostManager(
+            failing_game_ids=['game-2']
+        ),
+    )
+    monkeypatch.setattr(worker, 'post_update_worker', post_update_worker)
+
+    event = {
+        'Records': [
+            {
+                'messageId': 'message-1',
+                'body': PostUpdateJob(10, 'game-1').to_json(),
+            },
+            {
+                'messageId': 'message-2',
+                'body': PostUpdateJob(10, 'game-2').to_json(),
+            },
+            {
+                'messageId': 'message-3',
+                'body': PostUpdateJob(10, 'game-2').to_json(),
+            },
+        ]
+    }
+
+    # When
+    response = worker.handle_lambda(event, None)
+
+    # Then
+    assert response == {
+        'batchItemFailures': [
+            {'itemIdentifier': 'message-2'},
+            {'itemIdentifier': 'message-3'},
+        ]
+    }
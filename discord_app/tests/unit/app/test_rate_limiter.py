@@ -0,0 +1,97 @@
+import time
+
+import pytest
+
+from eternal_guesses.app.rate_limiter import RateLimiter, route_key
+
+pytestmark = pytest.mark.asyncio
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _headers(remaining: int, reset_after: float, limit: int = 5):
+    return {
+        'X-RateLimit-Bucket': 'abcd',
+        'X-RateLimit-Limit': str(limit),
+        'X-RateLimit-Remaining': str(remaining),
+        'X-RateLimit-Reset-After': str(reset_after),
+    }
+
+
+async def test_message_ids_share_a_route():
+    assert route_key("PATCH", "/channels/1/messages/2") == \
+        route_key("PATCH", "/channels/1/messages/3")
+
+
+async def test_bucket_is_learned_from_headers():
+    # Given
+    clock = _FakeClock()
+    rate_limiter = RateLimiter(clock=clock)
+
+    # When
+    await rate_limiter.acquire("PATCH", "/channels/1/messages/2")
+    rate_limiter.update("PATCH", "/channels/1/messages/2",
+                        _headers(remaining=3, reset_after=4))
+
+    # Then
+    state = rate_limiter.state()
+    assert state['routes'] == {"PATCH /channels/{id}/messages/{id}": 'abcd'}
+    assert state['buckets']['abcd:/channels/1'] == {
+        'limit': 5,
+        'remaining': 3,
+        'reset_after': 4,
+    }
+
+
+async def test_exhausted_bucket_waits_for_its_reset():
+    # Given: a bucket with one request left in its window
+    rate_limiter = RateLimiter()
+    rate_limiter.update("PATCH", "/channels/1/messages/2",
+                        _headers(remaining=1, reset_after=0.05))
+
+    # When
+    start = time.monotonic()
+    await rate_limiter.acquire("PATCH", "/channels/1/messages/3")
+    first_duration = time.monotonic() - start
+    await rate_limiter.acquire("PATCH", "/channels/1/messages/4")
+    second_duration = time.monotonic() - start
+
+    # Then: the first goes right away, the second waits for the reset
+    assert first_duration < 0.04
+    assert second_duration >= 0.04
+
+
+async def test_other_channels_have_their_own_bucket():
+    # Given: an exhausted bucket for channel 1
+    clock = _FakeClock()
+    rate_limiter = RateLimiter(clock=clock)
+    rate_limiter.update("PATCH", "/channels/1/messages/2",
+                        _headers(remaining=0, reset_after=60))
+    rate_limiter.update("PATCH", "/channels/2/messages/2",
+                        _headers(remaining=4, reset_after=60))
+
+    # When: channel 2 doesn't wait
+    await rate_limiter.acquire("PATCH", "/channels/2/messages/3")
+
+    # Then
+    assert rate_limiter.state()['buckets']['abcd:/channels/1']['remaining'] == 0
+    assert rate_limiter.state()['buckets']['abcd:/channels/2']['remaining'] == 3
+
+
+async def test_global_rate_limit_applies_to_all_routes():
+    # Given
+    clock = _FakeClock()
+    rate_limiter = RateLimiter(clock=clock)
+
+    # When
+    rate_limiter.rate_limited("POST", "/channels/1/messages",
+                              {'X-RateLimit-Global': 'true'}, retry_after=2)
+
+    # Then
+    assert rate_limiter.state()['global_reset_after'] == 2
@@ -3,7 +3,9 @@ import pprint
 
 import pytest
 
-from eternal_guesses.app.router import RouterImpl
+from eternal_guesses.app.dispatcher import RouteKey
+from eternal_guesses.app.router import RouterImpl, RouteRegistry
+from eternal_guesses.exceptions import AmbiguousRouteError
 from eternal_guesses.model.discord.discord_component import ComponentType
 from eternal_guesses.model.discord.discord_component_action import \
     DiscordComponentAction
@@ -27,22 +29,13 @@ async def test_handle_matching_action():
     expected_content = "Component action well handled."
 
     class TestRoute(Route):
+        route_keys = [RouteKey.component(custom_id="button_trigger_test")]
+
         async def call(self, event: DiscordEvent) -> DiscordResponse:
             return DiscordResponse.ephemeral_channel_message(
                 expected_content
             )
 
-        @staticmethod
-        def matches(event: DiscordEvent) -> bool:
-            action = event.component_action
-            if action is None:
-                return False
-
-            return (
-                action.component_type == ComponentType.BUTTON and
-                action.component_custom_id == "button_trigger_test"
-            )
-
     router = RouterImpl(
         routes=[TestRoute()],
     )
@@ -57,3 +50,99 @@ async def test_handle_matching_action():
     pprint.pp(body)
     assert body['type'] == ResponseType.CHANNEL_MESSAGE.value
     assert body['data']['content'] == expected_content
+
+
+async def test_deferred_route():
+    # Given
+    event = DiscordEvent(
+        component_action=DiscordComponentAction(
+            component_type=ComponentType.BUTTON,
+            component_custom_id="button_trigger_test"
+        )
+    )
+
+    class SlowRoute(Route):
+        deferred = True
+        route_keys = [RouteKey.component(prefix="button_")]
+
+        async def call(self, event: DiscordEvent) -> DiscordResponse:
+            return DiscordResponse.ephemeral_channel_message("Done.")
+
+    class OtherRoute(Route):
+        route_keys = [RouteKey.modal(prefix="button_")]
+
+    router = RouterImpl(
+        routes=[OtherRoute(), SlowRoute()],
+    )
+
+    # When
+    is_deferred = router.is_deferred(event)
+    response = await router.respond(event)
+
+    # Then
+    assert is_deferred
+    assert response.content == "Done."
+    assert not router.is_deferred(DiscordEvent())
+
+
+async def test_registered_routes_are_built_when_first_reached():
+    # Given
+    event = DiscordEvent(
+        component_action=DiscordComponentAction(
+            component_type=ComponentType.BUTTON,
+            component_custom_id="button_trigger_test"
+        )
+    )
+
+    built_routes = []
+
+    class ButtonRoute(Route):
+        deferred = True
+        route_keys = [RouteKey.component(prefix="button_")]
+
+        def __init__(self, name: str):
+            built_routes.append(name)
+
+        async def call(self, event: DiscordEvent) -> DiscordResponse:
+            return DiscordResponse.ephemeral_channel_message("Button.")
+
+    class ModalRoute(ButtonRoute):
+        route_keys = [RouteKey.modal(prefix="button_")]
+
+    route_registry = RouteRegistry()
+    route_registry.register(ModalRoute, lambda: ModalRoute("modal"))
+    route_registry.register(ButtonRoute, lambda: ButtonRoute("button"))
+
+    router = RouterImpl(route_registry=route_registry)
+
+    # When
+    is_deferred = router.is_deferred(event)
+
+    # Then
+    assert is_deferred
+    assert built_routes == []
+
+    # When
+    first_response = await router.respond(event)
+    second_response = await router.respond(event)
+
+    # Then
+    assert first_response.content == "Button."
+    assert second_response.content == "Button."
+    assert built_routes == ["button"]
+
+
+async def test_overlapping_routes_are_rejected():
+    # Given
+    class GameRoute(Route):
+        route_keys = [RouteKey.component(prefix="game_")]
+
+    class GameCloseRoute(Route):
+        route_keys = [RouteKey.component(prefix="game_close_")]
+
+    route_registry = RouteRegistry()
+    route_registry.register(GameRoute)
+
+    # Then
+    with pytest.raises(AmbiguousRouteError):
+        route_registry.register(GameCloseRoute)
@@ -0,0 +1,35 @@
+from eternal_guesses.model.discord.discord_embed import DiscordEmbed
+
+
+def test_embed_json():
+    # Given
+    embed = DiscordEmbed(title="a game", description="guesses", color=0x723EEA)
+    embed.set_footer(text="Game closed.")
+
+    # When
+    data = embed.json()
+
+    # Then
+    assert data == {
+        'type': 'rich',
+        'title': "a game",
+        'description': "guesses",
+        'color': 0x723EEA,
+        'footer': {
+            'text': "Game closed.",
+        },
+    }
+
+
+def test_embed_json_leaves_out_unset_fields():
+    # Given
+    embed = DiscordEmbed(description="guesses")
+
+    # When
+    data = embed.json()
+
+    # Then
+    assert data == {
+        'type': 'rich',
+        'description': "guesses",
+    }
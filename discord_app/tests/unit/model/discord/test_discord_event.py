@@ -513,6 +513,7 @@ def test_from_modal_submit_event():
         },
         'guild_id': '2001',
         'id': '3001',
+        'application_id': '4001',
         "member": {
             "deaf": False,
             "is_pending": False,
@@ -541,6 +542,9 @@ def test_from_modal_submit_event():
     assert event.channel_id == 1001
     assert event.guild_id == 2001
 
+    assert event.application_id == 4001
+    assert event.token == 'whfjwhfukwynexfl823yflwf9wauf928fh82e'
+
     modal_submit = event.modal_submit
     assert modal_submit.modal_custom_id == 'test_modal'
     assert modal_submit.inputs['test_input'] == '500'
@@ -8,7 +8,8 @@ from eternal_guesses.model.data.game import Game
 from eternal_guesses.model.discord.discord_command import DiscordCommand
 from eternal_guesses.model.discord.discord_event import DiscordEvent
 from eternal_guesses.model.discord.discord_member import DiscordMember
-from eternal_guesses.routes.commands.list_games import ListGamesRoute
+from eternal_guesses.routes.commands.list_games import ListGamesRoute, \
+    MAX_LISTED_GAMES
 from eternal_guesses.services.games_service import GamesService
 from tests.fakes import FakeGamesRepository
 
@@ -81,6 +82,33 @@ async def test_list_all_games_including_closed():
     assert open_game.game_id in response.content
 
 
+async def test_list_games_lists_at_most_a_select_menu_of_games():
+    # Given: more games than a select menu has options for
+    games_repository = FakeGamesRepository([
+        Game(game_id=f"game-{number:02}", closed=False)
+        for number in range(MAX_LISTED_GAMES + 5)
+    ])
+
+    route = ListGamesRoute(
+        games_service=GamesService(
+            games_repository=games_repository,
+            game_post_manager=Mock(),
+        ),
+        message_provider=MagicMock(MessageProvider),
+    )
+
+    # When
+    response = await route.call(_make_event(options={}))
+
+    # Then only the first games are listed, and it says so
+    options = response.action_rows[0].components[0].fields['options']
+    assert [o['value'] for o in options] == [
+        f"game-{number:02}" for number in range(MAX_LISTED_GAMES)
+    ]
+    assert f"game-{MAX_LISTED_GAMES:02}" not in response.content
+    assert f"only the first {MAX_LISTED_GAMES} games" in response.content
+
+
 def _make_event(
     guild_id: int = -1,
     options: typing.Dict = None,
@@ -3,6 +3,8 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from eternal_guesses.exceptions import DuplicateGameError
+
 from eternal_guesses.model.data.game import Game
 from eternal_guesses.model.discord.discord_event import DiscordEvent
 from eternal_guesses.model.discord.discord_member import DiscordMember
@@ -87,6 +89,21 @@ async def test_create_duplicate_given_id():
     assert response.content == DUPLICATE_GAME_ID
 
 
+async def test_create_without_reading_first():
+    # Given
+    mock_games_repository = MagicMock(GamesRepositoryImpl, autospec=True)
+    mock_games_repository.create.side_effect = DuplicateGameError()
+
+    create_route = _route(games_repository=mock_games_repository)
+
+    # When
+    response = await create_route.call(_make_event())
+
+    # Then the duplicate is found by the write alone
+    mock_games_repository.get.assert_not_called()
+    assert response.content == DUPLICATE_GAME_ID
+
+
 async def test_create_sets_created_by_to_calling_user():
     # Given
     calling_user_id = 500
@@ -116,7 +133,6 @@ async def test_create_sets_title_and_description():
     description = "This is the description"
 
     mock_games_repository = MagicMock(GamesRepositoryImpl, autospec=True)
-    mock_games_repository.get.return_value = None
 
     event = _make_event(description=description, title=title)
 
@@ -125,7 +141,7 @@ async def test_create_sets_title_and_description():
     response = await create_route.call(event)
 
     # Then
-    args = mock_games_repository.save.call_args
+    args = mock_games_repository.create.call_args
 
     game = args[0][0]
     assert game.title == title
@@ -1,11 +1,11 @@
 from datetime import datetime
 from unittest.mock import patch, MagicMock, AsyncMock
 
-import discord
 import pytest
 
 from eternal_guesses.model.data.game import Game
 from eternal_guesses.model.data.game_guess import GameGuess
+from eternal_guesses.model.discord.discord_embed import DiscordEmbed
 from eternal_guesses.model.discord.discord_event import DiscordEvent
 from eternal_guesses.model.discord.discord_member import DiscordMember
 from eternal_guesses.model.discord.discord_modal_submit import \
@@ -77,7 +77,7 @@ async def test_guess_updates_channel_messages():
     guild_id = 1001
     user_id = 12000
 
-    post_embed = discord.Embed()
+    post_embed = DiscordEmbed()
     message_provider = MagicMock(MessageProvider)
     message_provider.game_post_embed.return_value = post_embed
 
@@ -100,7 +100,7 @@ async def test_guess_updates_channel_messages():
     await submit_guess_route.call(event)
 
     # Then
-    game_post_manager.update.assert_called_with(game)
+    game_post_manager.update_stored.assert_called_with(game)
 
 
 async def test_guess_replies_with_ephemeral_message():
@@ -223,6 +223,95 @@ async def test_guess_duplicate_guess():
     assert response.content == duplicate_guess_message
 
 
+async def test_guess_placed_at_the_same_time_by_the_same_user():
+    # Given: a game the user had no guess on yet when it was read
+    guild_id = 1000
+    game_id = 'game-id'
+    guessing_user_id = 2000
+
+    game = Game(guild_id=guild_id, game_id=game_id)
+
+    class ConcurrentGuessGamesRepository(FakeGamesRepository):
+        def get_without_guesses(self, guild_id: int, game_id: str):
+            return Game(guild_id=guild_id, game_id=game_id)
+
+    games_repository = ConcurrentGuessGamesRepository([game])
+    games_repository.add_guess(game, GameGuess(
+        user_id=guessing_user_id, guess='100'
+    ))
+
+    duplicate_guess_message = "You already placed a guess for this game."
+    message_provider = MagicMock(MessageProvider)
+    message_provider.error_duplicate_guess.return_value = duplicate_guess_message
+
+    game_post_manager = AsyncMock(GamePostManager, autospec=True)
+    submit_guess_route = _route(
+        games_repository=games_repository,
+        message_provider=message_provider,
+        game_post_manager=game_post_manager,
+    )
+
+    # When
+    event = _create_submit_event(
+        guild_id=guild_id,
+        game_id=game_id,
+        user_id=guessing_user_id,
+        guess='42',
+    )
+    response = await submit_guess_route.call(event)
+
+    # Then the first guess is kept
+    assert game.guesses[guessing_user_id].guess == '100'
+    game_post_manager.update_stored.assert_not_called()
+
+    assert response.is_ephemeral
+    assert response.content == duplicate_guess_message
+
+
+async def test_guess_duplicate_of_guess_still_in_the_game_item():
+    # Given: a game whose guess is still in its item, which the write of a
+    # new guess doesn't see
+    guild_id = 1000
+    game_id = 'game-id'
+    guessing_user_id = 2000
+
+    class LegacyGamesRepository(FakeGamesRepository):
+        def get_without_guesses(self, guild_id: int, game_id: str):
+            return Game(guild_id=guild_id, game_id=game_id, guesses={
+                guessing_user_id: GameGuess(
+                    user_id=guessing_user_id, guess='100'
+                ),
+            })
+
+    games_repository = LegacyGamesRepository([
+        Game(guild_id=guild_id, game_id=game_id)
+    ])
+
+    duplicate_guess_message = "You already placed a guess for this game."
+    message_provider = MagicMock(MessageProvider)
+    message_provider.error_duplicate_guess.return_value = duplicate_guess_message
+
+    submit_guess_route = _route(
+        games_repository=games_repository,
+        message_provider=message_provider,
+    )
+
+    # When
+    event = _create_submit_event(
+        guild_id=guild_id,
+        game_id=game_id,
+        user_id=guessing_user_id,
+        guess='42',
+    )
+    response = await submit_guess_route.call(event)
+
+    # Then no second guess is written
+    assert games_repository.get(guild_id, game_id).guesses == {}
+
+    assert response.is_ephemeral
+    assert response.content == duplicate_guess_message
+
+
 async def test_guess_closed_game():
     # Given
     guild_id = 1515
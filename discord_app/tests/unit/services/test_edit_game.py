@@ -0,0 +1,64 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from eternal_guesses.exceptions import GameNotFoundError
+from eternal_guesses.model.data.game import Game
+from eternal_guesses.model.data.game_guess import GameGuess
+from eternal_guesses.services.games_service import GamesService
+from eternal_guesses.app.game_post_manager import GamePostManager
+from tests.fakes import FakeGamesRepository
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_edit_title():
+    # Given
+    guild_id = 1007
+    game_id = 'game-id-1'
+
+    game = Game(
+        game_id=game_id,
+        guild_id=guild_id,
+        title='Old title',
+        guesses={
+            100: GameGuess(user_id=100, guess='42'),
+        },
+    )
+    games_repository = FakeGamesRepository([game])
+    game_post_manager = AsyncMock(GamePostManager)
+
+    service = GamesService(
+        games_repository=games_repository,
+        game_post_manager=game_post_manager,
+    )
+
+    # When
+    await service.edit_title(guild_id, game_id, 'New title')
+
+    # Then
+    saved_game = games_repository.get(guild_id, game_id)
+    assert saved_game.title == 'New title'
+    assert 100 in saved_game.guesses
+
+    updated_game = game_post_manager.update.call_args.args[0]
+    assert updated_game.title == 'New title'
+    assert 100 in updated_game.guesses
+
+
+async def test_edit_unknown_game():
+    # Given
+    games_repository = FakeGamesRepository([])
+    game_post_manager = AsyncMock(GamePostManager)
+
+    service = GamesService(
+        games_repository=games_repository,
+        game_post_manager=game_post_manager,
+    )
+
+    # When
+    with pytest.raises(GameNotFoundError):
+        await service.edit_description(1007, 'game-id-1', 'Description')
+
+    # Then
+    game_post_manager.update.assert_not_called()
@@ -0,0 +1,63 @@
+import pytest
+
+from eternal_guesses.json_codec import OrjsonCodec, StdlibCodec
+
+
+def _codecs():
+    codecs = [StdlibCodec()]
+
+    try:
+        codecs.append(OrjsonCodec())
+    except ImportError:
+        pass
+
+    return codecs
+
+
+@pytest.fixture(params=_codecs(), ids=lambda codec: codec.name)
+def codec(request):
+    return request.param
+
+
+def test_round_trip_with_int_keys(codec):
+    # Given
+    guesses = {
+        1: {'user_id': 1, 'guess': "42", 'nickname': "Zoë"},
+        2: {'user_id': 2, 'guess': "43", 'nickname': None},
+    }
+
+    # When
+    data = codec.loads(codec.dumps(guesses))
+
+    # Then
+    assert data == {
+        '1': {'user_id': 1, 'guess': "42", 'nickname': "Zoë"},
+        '2': {'user_id': 2, 'guess': "43", 'nickname': None},
+    }
+
+
+def test_loads_bytes(codec):
+    # When
+    data = codec.loads(b'{"type": 1}')
+
+    # Then
+    assert data == {'type': 1}
+
+
+def test_sort_keys(codec):
+    # When
+    data = codec.dumps({'b': 1, 'a': {'d': 2, 'c': 3}}, sort_keys=True)
+
+    # Then
+    assert data == '{"a":{"c":3,"d":2},"b":1}'
+
+
+def test_codecs_write_the_same_json():
+    # Given
+    obj = {
+        1: {'guess': "42", 'nickname': "Zoë", 'closed': False},
+        'embeds': [{'title': "a game", 'color': 0x723EEA}],
+    }
+
+    # Then
+    assert len({codec.dumps(obj) for codec in _codecs()}) == 1
@@ -1,9 +1,12 @@
-from aws_cdk import (Stack, Duration, aws_lambda, aws_apigateway, aws_dynamodb,
-                     aws_sns, aws_logs, aws_logs_destinations)
+from aws_cdk import (Stack, Duration, ArnFormat, aws_lambda, aws_apigateway,
+                     aws_dynamodb, aws_iam, aws_sns, aws_sqs, aws_logs,
+                     aws_logs_destinations)
 from aws_cdk.aws_dynamodb import ITable
 from aws_cdk.aws_lambda import Function, Runtime, Tracing
+from aws_cdk.aws_lambda_event_sources import SqsEventSource
 from aws_cdk.aws_lambda_python_alpha import PythonFunction
 from aws_cdk.aws_sns import Topic
+from aws_cdk.aws_sqs import IQueue
 from constructs import Construct
 
 from infra import config
@@ -17,12 +20,19 @@ class InfraStack(Stack):
         self.config = config.config
 
         dynamodb_table = self.create_table()
-        discord_app_handler = self.create_app_handler(dynamodb_table.table_name)
+        post_update_queue = self.create_post_update_queue()
+
+        discord_app_handler = self.create_app_handler(dynamodb_table.table_name, post_update_queue)
         self.grant_table_readwrite_permissions(dynamodb_table, discord_app_handler)
+        self.grant_deferred_invoke_permissions(discord_app_handler)
+        post_update_queue.grant_send_messages(discord_app_handler)
+
+        post_update_worker = self.create_post_update_worker(dynamodb_table.table_name, post_update_queue)
+        self.grant_table_readwrite_permissions(dynamodb_table, post_update_worker)
 
         self.create_api(discord_app_handler)
 
-        self.setup_app_error_alerting(discord_app_handler)
+        self.setup_app_error_alerting(discord_app_handler, post_update_worker)
 
     def create_table(self) -> aws_dynamodb.ITable:
         partition_key = aws_dynamodb.Attribute(
@@ -35,18 +45,47 @@ class InfraStack(Stack):
             type=aws_dynamodb.AttributeType.STRING
         )
 
-        return aws_dynamodb.Table(self, "EternalGuessesTable",
-                                  partition_key=partition_key,
-                                  sort_key=sort_key,
-                                  billing_mode=aws_dynamodb.BillingMode.PAY_PER_REQUEST
-                                  )
+        table = aws_dynamodb.Table(self, "EternalGuessesTable",
+                                   partition_key=partition_key,
+                                   sort_key=sort_key,
+                                   billing_mode=aws_dynamodb.BillingMode.PAY_PER_REQUEST
+                                   )
+
+        # Sparse: only open games have an open_pk, so listing the open games
+        # of a guild reads neither its closed games nor any guesses
+        table.add_global_secondary_index(
+            index_name="open-games",
+            partition_key=aws_dynamodb.Attribute(
+                name="open_pk",
+                type=aws_dynamodb.AttributeType.STRING
+            ),
+            sort_key=sort_key,
+            projection_type=aws_dynamodb.ProjectionType.INCLUDE,
+            non_key_attributes=["title", "closed"],
+        )
+
+        return table
+
+    def create_post_update_queue(self) -> IQueue:
+        dead_letter_queue = aws_sqs.Queue(self, "PostUpdateDeadLetterQueue",
+                                          retention_period=Duration.days(14))
+
+        # The visibility timeout has to be longer than the worker may take on a batch
+        return aws_sqs.Queue(self, "PostUpdateQueue",
+                             visibility_timeout=Duration.seconds(60),
+                             dead_letter_queue=aws_sqs.DeadLetterQueue(
+                                 queue=dead_letter_queue,
+                                 max_receive_count=3,
+                             ))
 
-    def create_app_handler(self, dynamodb_table_name: str) -> Function:
+    def create_app_handler(self, dynamodb_table_name: str, post_update_queue: IQueue) -> Function:
         environment = {
             'DISCORD_PUBLIC_KEY': self.config['DISCORD_PUBLIC_KEY'],
             'DISCORD_BOT_TOKEN': self.config['DISCORD_BOT_TOKEN'],
             'DYNAMODB_TABLE_NAME': dynamodb_table_name,
             'LOGURU_LEVEL': self.config['APP_LOG_LEVEL'],
+            'DEFERRED_RESPONSES': 'true',
+            'POST_UPDATE_QUEUE_URL': post_update_queue.queue_url,
         }
 
         return PythonFunction(
@@ -59,12 +98,59 @@ class InfraStack(Stack):
             handler="handle_lambda",
             environment=environment,
             tracing=Tracing.ACTIVE,
+            # A failed deferred interaction was already reported to the user,
+            # and retrying it could apply the same change twice
+            retry_attempts=0,
+        )
+
+    def create_post_update_worker(self, dynamodb_table_name: str, post_update_queue: IQueue) -> Function:
+        environment = {
+            'DISCORD_BOT_TOKEN': self.config['DISCORD_BOT_TOKEN'],
+            'DYNAMODB_TABLE_NAME': dynamodb_table_name,
+            'LOGURU_LEVEL': self.config['APP_LOG_LEVEL'],
+        }
+
+        worker = PythonFunction(
+            self, "PostUpdateWorkerFunction",
+            runtime=Runtime.PYTHON_3_9,
+            timeout=Duration.seconds(30),
+            memory_size=512,
+            entry="../discord_app",
+            index="eternal_guesses/worker.py",
+            handler="handle_lambda",
+            environment=environment,
+            tracing=Tracing.ACTIVE,
         )
 
+        # Collecting jobs for a moment lets the worker handle several changes
+        # to a game with a single update of its posts
+        worker.add_event_source(SqsEventSource(
+            post_update_queue,
+            batch_size=10,
+            max_batching_window=Duration.seconds(1),
+            report_batch_item_failures=True,
+        ))
+
+        return worker
+
     def grant_table_readwrite_permissions(self, dynamodb_table: ITable, function: Function):
         dynamodb_table.grant_full_access(function)
         # dynamodb_table.grant(function, "dynamodb:DescribeTable")
 
+    def grant_deferred_invoke_permissions(self, function: Function):
+        # The function invokes itself to handle deferred interactions.
+        # function.grant_invoke(function) would make the function depend on
+        # its own ARN, so the permission is granted on its name's prefix.
+        function.add_to_role_policy(aws_iam.PolicyStatement(
+            actions=["lambda:InvokeFunction"],
+            resources=[self.format_arn(
+                service="lambda",
+                resource="function",
+                resource_name=f"{self.stack_name}-DiscordAppFunction*",
+                arn_format=ArnFormat.COLON_RESOURCE_NAME,
+            )],
+        ))
+
     def create_api(self, discord_app_handler: Function):
         api = aws_apigateway.RestApi(self, "eternal-guesses-api",
                                      rest_api_name="Eternal Guesses API")
@@ -72,11 +158,13 @@ class InfraStack(Stack):
         discord_resource = api.root.add_resource("discord")
         discord_resource.add_method("POST", discord_app_integration)
 
-    def setup_app_error_alerting(self, function_to_monitor: Function) -> None:
+    def setup_app_error_alerting(self, function_to_monitor: Function, worker_to_monitor: Function) -> None:
         app_errors_sns_topic = self.create_sns_topic()
         cloudwatch_logs_handler = self.create_logs_handler(app_errors_sns_topic)
 
         self.subscribe_handler_to_function_logs(function_to_monitor, cloudwatch_logs_handler)
+        self.subscribe_handler_to_function_logs(worker_to_monitor, cloudwatch_logs_handler,
+                                                "eternal-guess-worker-subscription-filter")
         self.subscribe_emails_to_topic(app_errors_sns_topic, self.config['NOTIFICATION_EMAIL'])
 
     def create_sns_topic(self) -> Topic:
@@ -105,8 +193,9 @@ class InfraStack(Stack):
 
         return logs_handler
 
-    def subscribe_handler_to_function_logs(self, app_handler, logs_handler):
-        aws_logs.SubscriptionFilter(self, "eternal-guess-handler-subscription-filter",
+    def subscribe_handler_to_function_logs(self, app_handler, logs_handler,
+                                           filter_id="eternal-guess-handler-subscription-filter"):
+        aws_logs.SubscriptionFilter(self, filter_id,
                                     log_group=app_handler.log_group,
                                     destination=aws_logs_destinations.LambdaDestination(logs_handler),
                                     filter_pattern=aws_logs.FilterPattern.any_term("ERROR", "WARNING"))